@@ -1,20 +1,105 @@
 from __future__ import annotations
-import os, json, secrets, hashlib
+import os, json, sys, zlib, asyncio, time
 from datetime import datetime, timezone
 
 import discord
 from discord import app_commands
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 def _load_json(path: str, default):
     if not os.path.exists(path):
         return default
+    if orjson is not None:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
     with open(path, "r", encoding="utf-8") as f:
         return json.load(f)
 
+# Fields repeated across thousands of pool items; interned so duplicates share one str.
+_INTERN_FIELDS = ("source_org", "source_title", "license")
+
+def _load_pool(path: str, default):
+    pool = _load_json(path, default)
+    for it in pool.get("items", []) or []:
+        for k in _INTERN_FIELDS:
+            v = it.get(k)
+            if isinstance(v, str):
+                it[k] = sys.intern(v)
+    return pool
+
+# path -> (mtime, parsed); the pool is only re-parsed when the file changes.
+_POOL_CACHE: dict[str, tuple[float, dict]] = {}
+# path -> pending read, so a burst of misses parses the file once.
+_POOL_INFLIGHT: dict[str, asyncio.Future] = {}
+
+class _LoadCancelled(Exception):
+    """The task doing a shared pool read was cancelled; waiters retry the load."""
+
+async def _load_json_cached(path: str, default):
+    try:
+        mt = os.stat(path).st_mtime
+    except OSError:
+        return default
+    cached = _POOL_CACHE.get(path)
+    if cached and cached[0] == mt:
+        return cached[1]
+    # Only a cache miss pays for the read + parse, and it runs off the event loop.
+    # Concurrent misses share one read instead of each opening the file.
+    fut = _POOL_INFLIGHT.get(path)
+    if fut is not None:
+        try:
+            return await asyncio.shield(fut)
+        except _LoadCancelled:
+            return await _load_json_cached(path, default)
+    fut = asyncio.get_running_loop().create_future()
+    _POOL_INFLIGHT[path] = fut
+    try:
+        data = await asyncio.to_thread(_load_pool, path, default)
+        _POOL_CACHE[path] = (mt, data)
+        fut.set_result(data)
+        return data
+    except asyncio.CancelledError:
+        # Only this task was cancelled; don't cancel the waiters with it.
+        fut.set_exception(_LoadCancelled())
+        fut.exception()
+        raise
+    except Exception as e:
+        fut.set_exception(e)
+        fut.exception()  # mark retrieved when nobody else is waiting
+        raise
+    finally:
+        _POOL_INFLIGHT.pop(path, None)
+
 def _daily_index(n: int, day_str: str) -> int:
-    h = hashlib.sha256(day_str.encode("utf-8")).hexdigest()
-    return int(h, 16) % n
+    # Only needs to be deterministic per day, not cryptographic.
+    return zlib.crc32(day_str.encode("utf-8")) % n
+
+# (days since epoch, "YYYY-MM-DD") for the current UTC day.
+_last_day_key: tuple[int, str] = (-1, "")
+
+def _utc_day_str() -> str:
+    global _last_day_key
+    k = int(time.time()) // 86400
+    if _last_day_key[0] != k:
+        _last_day_key = (k, datetime.fromtimestamp(k * 86400, tz=timezone.utc).strftime("%Y-%m-%d"))
+    return _last_day_key[1]
+
+# (day_str, pool size) -> index; only the current day's entries are kept.
+_DAILY_IDX_CACHE: dict[tuple[str, int], int] = {}
+
+def _daily_index_cached(n: int, day_str: str) -> int:
+    key = (day_str, n)
+    idx = _DAILY_IDX_CACHE.get(key)
+    if idx is None:
+        if any(k[0] != day_str for k in _DAILY_IDX_CACHE):
+            _DAILY_IDX_CACHE.clear()
+        idx = _DAILY_IDX_CACHE[key] = _daily_index(n, day_str)
+    return idx
 
 def register_academic_trivia(client: discord.Client, tree: app_commands.CommandTree, data_dir: str) -> None:
     pool_path = os.path.join(data_dir, "academic_trivia_pool.json")
@@ -22,7 +107,7 @@ def register_academic_trivia(client: discord.Client, tree: app_commands.CommandT
     @app_commands.command(name="academictrivia", description="Open-licensed academic trivia: daily or random.")
     @app_commands.describe(mode="daily (deterministic per UTC day) or random")
     async def academictrivia(interaction: discord.Interaction, mode: str = "daily"):
-        pool = _load_json(pool_path, {"items": []})
+        pool = await _load_json_cached(pool_path, {"items": []})
         items = pool.get("items", []) or []
         if not items:
             await interaction.response.send_message(
@@ -37,12 +122,13 @@ def register_academic_trivia(client: discord.Client, tree: app_commands.CommandT
             return
 
         if mode == "daily":
-            day_str = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-            idx = _daily_index(len(items), day_str)
+            day_str = _utc_day_str()
+            idx = _daily_index_cached(len(items), day_str)
             picked = items[idx]
             title = "Academic Daily Trivia"
             footer = f"UTC day: {day_str} • Pool size: {len(items)}"
         else:
+            import secrets  # only the random mode needs it
             picked = items[secrets.randbelow(len(items))]
             title = "Academic Trivia (Random)"
             footer = f"Pool size: {len(items)}"
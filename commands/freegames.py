@@ -3,8 +3,10 @@ import discord
 import aiohttp
 import asyncio
 import datetime as dt
+import time
 from utils.pagination import PaginationView
 from utils.fuzzy_search import fuzzy_search
+from utils.shutdown import on_shutdown
 
 PLATFORM_COLORS = {
     "epic": 0x001F3F,
@@ -18,6 +20,20 @@ GOG_ENDPOINT = "https://www.gog.com/games/ajax/filtered?mediaType=game&price=fre
 HUMBLE_ENDPOINT = "https://www.humblebundle.com/store/api/search?sort=bestselling&filter=onsale"
 LUNA_ENDPOINT = "https://luna.amazon.com/"
 
+# One pooled session for every store fetch, so repeat commands reuse TCP/TLS connections.
+_SESSION = None
+
+async def _ensure_session():
+    global _SESSION
+    if _SESSION is None or _SESSION.closed:
+        _SESSION = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=10))
+    return _SESSION
+
+@on_shutdown
+async def _close_session():
+    if _SESSION is not None and not _SESSION.closed:
+        await _SESSION.close()
+
 async def fetch_epic(session):
     try:
         async with session.get(EPIC_ENDPOINT, timeout=10) as resp:
@@ -26,7 +42,7 @@ async def fetch_epic(session):
         return []
 
     offers = []
-    now = dt.datetime.utcnow()
+    now = dt.datetime.now(dt.timezone.utc)  # promo dates are UTC-aware
 
     elements = data.get("data", {}).get("Catalog", {}).get("searchStore", {}).get("elements", [])
 
@@ -55,6 +71,20 @@ async def fetch_epic(session):
 
     return offers
 
+# Epic promotions change at most weekly; bursts of /freegames_* calls share one fetch per TTL.
+EPIC_TTL_SECONDS = 900
+_EPIC_CACHE = {"at": 0.0, "data": []}
+
+async def fetch_epic_cached(session):
+    now = time.monotonic()
+    if _EPIC_CACHE["at"] and now - _EPIC_CACHE["at"] <= EPIC_TTL_SECONDS:
+        return _EPIC_CACHE["data"]
+    data = await fetch_epic(session)
+    if data:
+        _EPIC_CACHE.update(at=now, data=data)
+        return data
+    return _EPIC_CACHE["data"]
+
 async def fetch_gog(session):
     try:
         async with session.get(GOG_ENDPOINT, timeout=10) as resp:
@@ -104,13 +134,13 @@ async def register(bot, data_dir):
 
         await interaction.response.defer()
 
-        async with aiohttp.ClientSession() as session:
-            results = await asyncio.gather(
-                fetch_epic(session),
-                fetch_gog(session),
-                fetch_humble(session),
-                fetch_luna(session)
-            )
+        session = await _ensure_session()
+        results = await asyncio.gather(
+            fetch_epic_cached(session),
+            fetch_gog(session),
+            fetch_humble(session),
+            fetch_luna(session)
+        )
 
         offers = [o for sub in results for o in sub]
 
@@ -148,13 +178,13 @@ async def register(bot, data_dir):
 
         await interaction.response.defer()
 
-        async with aiohttp.ClientSession() as session:
-            results = await asyncio.gather(
-                fetch_epic(session),
-                fetch_gog(session),
-                fetch_humble(session),
-                fetch_luna(session)
-            )
+        session = await _ensure_session()
+        results = await asyncio.gather(
+            fetch_epic_cached(session),
+            fetch_gog(session),
+            fetch_humble(session),
+            fetch_luna(session)
+        )
 
         offers = [o for sub in results for o in sub]
         results = fuzzy_search(query, offers)
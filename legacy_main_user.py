@@ -1,24 +1,37 @@
 import os
 import logging
 import asyncio
-import json
+import atexit
+import functools
+import io
+import mmap
+import time
+import types
+import orjson
 import random
 import requests
 import aiohttp
 from aiohttp import web
 from urllib.parse import urljoin, urlparse
 from bs4 import BeautifulSoup
-import aiohttp
-from urllib.parse import quote
+from urllib.parse import quote, quote_plus
+from html import unescape
 import sqlite3
 import re
-from typing import Optional, Dict, Any, List
-from datetime import datetime, date, time as dtime
-from urllib.parse import urlparse
+from collections import OrderedDict
+from typing import Optional, Dict, Any, List, NamedTuple
+from datetime import datetime, date, time as dtime, timedelta, timezone
 import hashlib
+import importlib.util
+import itertools
 import discord
 from discord import app_commands
-from discord.ext import commands, tasks
+from discord.ext import tasks
+
+from commands.freegames import fetch_epic_cached
+from providers._html_links import iter_links
+from utils.shutdown import ShutdownBot, on_shutdown
+from utils.url_utils import fast_host
 try:
     from zoneinfo import ZoneInfo
 except Exception:
@@ -75,6 +88,8 @@ DB_PATH = os.path.join(BASE_DIR, os.getenv("BOT_DB_FILE", "bottany.sqlite3"))
 # Core datasets that are loaded at import time.
 DICT_PATH = os.path.join(DATA_DIR, "dictionaries.json")
 TRIVIA_PATH = os.path.join(DATA_DIR, "trivia_facts.json")
+ACADEMIC_PATH = os.path.join(DATA_DIR, "academic_registry.json")
+FASHION_PATH = os.path.join(DATA_DIR, "fashion_registry.json")
 # Governance / allowlist registries (safe defaults; prevents NameError)
 # -------------------------
 # Trivia scheduling defaults
@@ -82,9 +97,15 @@ TRIVIA_PATH = os.path.join(DATA_DIR, "trivia_facts.json")
 TRIVIA_POST_HOUR = int(os.getenv("TRIVIA_POST_HOUR", "10"))     # 0-23
 TRIVIA_POST_MINUTE = int(os.getenv("TRIVIA_POST_MINUTE", "0"))  # 0-59
 
+# Guild allowlist for guild-scoped command sync (comma-separated IDs).
+# DEV_GUILD_ID is still honoured and folded into the same list.
+GUILD_IDS: List[int] = [
+    int(g) for g in (os.getenv("GUILD_IDS", "") + "," + os.getenv("DEV_GUILD_ID", "")).split(",")
+    if g.strip().isdigit()
+]
+
 GOV_REG = {}
 METEO_REG = {}
-FASHION_REG = {}
 
 logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO").upper(), format="%(asctime)s %(levelname)s %(name)s: %(message)s")
 logger = logging.getLogger("bottany")
@@ -98,7 +119,7 @@ intents = discord.Intents.default()
 intents.message_content = True
 intents.members = True
 
-bot = commands.Bot(command_prefix="!", intents=intents)
+bot = ShutdownBot(command_prefix="!", intents=intents)
 
 # Healthcheck server for Railway (listens on $PORT)
 async def _healthcheck_app():
@@ -109,7 +130,7 @@ async def _healthcheck_app():
     app.router.add_get("/health", handle)
     return app
 
-bot = commands.Bot(command_prefix="!", intents=intents)
+bot = ShutdownBot(command_prefix="!", intents=intents)
 
 # NOTE: Do not start the bot or register modules at import-time.
 # These are executed in on_ready() / during startup instead.
@@ -130,6 +151,27 @@ async def start_healthcheck_server():
         logger.info("Healthcheck server listening on port %s", port)
     except Exception as e:
         logger.warning("Healthcheck server did not start: %s", e)
+
+# -------------------------
+# Shared HTTP session (keep-alive, DNS cache); created lazily inside the running loop
+# -------------------------
+_HTTP_HEADERS = {"User-Agent": "Bottany/1.0 (+https://railway.app)"}
+_HTTP_SESSION: Optional[aiohttp.ClientSession] = None
+
+def _http() -> aiohttp.ClientSession:
+    global _HTTP_SESSION
+    if _HTTP_SESSION is None or _HTTP_SESSION.closed:
+        _HTTP_SESSION = aiohttp.ClientSession(
+            headers=_HTTP_HEADERS,
+            connector=aiohttp.TCPConnector(limit=100, ttl_dns_cache=300),
+        )
+    return _HTTP_SESSION
+
+@on_shutdown
+async def _close_http() -> None:
+    if _HTTP_SESSION is not None and not _HTTP_SESSION.closed:
+        await _HTTP_SESSION.close()
+
 # -------------------------
 # DB helpers
 # -------------------------
@@ -174,6 +216,7 @@ def db_set_channel(guild_id: int, topic: str, channel_id: int) -> None:
             """,
             (guild_id, topic, channel_id))
         conn.commit()
+    _CHANNEL_CACHE.pop((guild_id, topic), None)
 
 def db_get_channel(guild_id: int, topic: str) -> Optional[int]:
     with sqlite3.connect(DB_PATH) as conn:
@@ -185,11 +228,15 @@ def db_get_channel(guild_id: int, topic: str) -> Optional[int]:
 def db_get_trivia_state(guild_id: int) -> Dict[str, Optional[str]]:
     with sqlite3.connect(DB_PATH) as conn:
         cur = conn.cursor()
-        cur.execute("SELECT last_sent_date, last_fact_id FROM trivia_state WHERE guild_id=?;", (guild_id,))
-        row = cur.fetchone()
-        if not row:
-            return {"last_sent_date": None, "last_fact_id": None}
-        return {"last_sent_date": row[0], "last_fact_id": row[1]}
+        # LEFT JOIN against a one-row table always yields a row (NULLs when unset).
+        cur.execute(
+            """
+            SELECT t.last_sent_date, t.last_fact_id
+            FROM (SELECT 1) LEFT JOIN trivia_state t ON t.guild_id=?;
+            """,
+            (guild_id,))
+        last_sent_date, last_fact_id = cur.fetchone()
+        return {"last_sent_date": last_sent_date, "last_fact_id": last_fact_id}
 
 def db_set_trivia_state(guild_id: int, last_sent_date: str, last_fact_id: str) -> None:
     with sqlite3.connect(DB_PATH) as conn:
@@ -202,6 +249,7 @@ def db_set_trivia_state(guild_id: int, last_sent_date: str, last_fact_id: str) -
             """,
             (guild_id, last_sent_date, last_fact_id))
         conn.commit()
+    _TRIVIA_STATE_CACHE.pop(guild_id, None)
 
 def db_set_module(guild_id: int, module: str, enabled: bool) -> None:
     with sqlite3.connect(DB_PATH) as conn:
@@ -214,6 +262,7 @@ def db_set_module(guild_id: int, module: str, enabled: bool) -> None:
             """,
             (guild_id, module.lower().strip(), 1 if enabled else 0))
         conn.commit()
+    _MOD_CACHE.pop((guild_id, module.lower().strip()), None)
 
 def db_get_module(guild_id: int, module: str) -> Optional[bool]:
     with sqlite3.connect(DB_PATH) as conn:
@@ -226,52 +275,121 @@ def db_get_module(guild_id: int, module: str) -> Optional[bool]:
             return None
         return bool(row[0])
 
-def module_enabled(interaction: discord.Interaction, module: str) -> bool:
+def db_module_enabled(guild_id: int, module: str) -> bool:
+    """Effective enabled flag (modules default to enabled). `module` must already be normalised."""
+    with sqlite3.connect(DB_PATH) as conn:
+        cur = conn.cursor()
+        cur.execute(
+            "SELECT COALESCE((SELECT enabled FROM module_settings WHERE guild_id=? AND module=?), 1);",
+            (guild_id, module))
+        return bool(cur.fetchone()[0])
+
+# -------------------------
+# Short-lived read caches (per guild) in front of the DB helpers.
+# The accessors are async: cache hits return on the loop, only misses (and
+# writes) hop to a worker thread so sqlite I/O never blocks interaction acks.
+# -------------------------
+_CACHE_MISS = object()
+_MOD_CACHE: Dict[tuple, tuple] = {}           # (guild_id, module) -> (expires_at, enabled)
+_TRIVIA_STATE_CACHE: Dict[int, tuple] = {}    # guild_id -> (expires_at, state)
+_CHANNEL_CACHE: Dict[tuple, tuple] = {}       # (guild_id, topic) -> (expires_at, channel_id)
+
+def _ttl_get(cache: dict, key):
+    hit = cache.get(key)
+    if hit is None:
+        return _CACHE_MISS
+    if hit[0] < time.monotonic():
+        cache.pop(key, None)
+        return _CACHE_MISS
+    return hit[1]
+
+def _ttl_put(cache: dict, key, value, ttl: float, maxsize: int) -> None:
+    if key not in cache and len(cache) >= maxsize:
+        cache.pop(next(iter(cache)), None)  # oldest insertion
+    cache[key] = (time.monotonic() + ttl, value)
+
+async def module_enabled(interaction: discord.Interaction, module: str) -> bool:
     if interaction.guild is None:
         return True
-    v = db_get_module(interaction.guild_id, module)
-    return True if v is None else v
+    key = (interaction.guild_id, module)
+    v = _ttl_get(_MOD_CACHE, key)
+    if v is _CACHE_MISS:
+        v = await asyncio.to_thread(db_module_enabled, interaction.guild_id, module)
+        _ttl_put(_MOD_CACHE, key, v, ttl=30, maxsize=4096)
+    return v
+
+async def get_trivia_state_cached(guild_id: int) -> Dict[str, Optional[str]]:
+    v = _ttl_get(_TRIVIA_STATE_CACHE, guild_id)
+    if v is _CACHE_MISS:
+        v = await asyncio.to_thread(db_get_trivia_state, guild_id)
+        _ttl_put(_TRIVIA_STATE_CACHE, guild_id, v, ttl=5, maxsize=2048)
+    return v
+
+async def get_channel_cached(guild_id: int, topic: str) -> Optional[int]:
+    key = (guild_id, topic)
+    v = _ttl_get(_CHANNEL_CACHE, key)
+    if v is _CACHE_MISS:
+        v = await asyncio.to_thread(db_get_channel, guild_id, topic)
+        _ttl_put(_CHANNEL_CACHE, key, v, ttl=30, maxsize=2048)
+    return v
 
 
 
 # -------------------------
 # Data loading
 # -------------------------
+# Files above this size are mapped instead of read (skips a userspace copy).
+_JSON_MMAP_THRESHOLD = 1024 * 1024
+
 def load_json(path: str) -> Dict[str, Any]:
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
- # -------------------------
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size < _JSON_MMAP_THRESHOLD:
+            return orjson.loads(f.read())
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as buf:
+                return orjson.loads(buf)
+
+# path -> (mtime_ns, parsed) for read-only registries; reparsed only when the file changes.
+_REGISTRY_CACHE: Dict[str, tuple] = {}
+
+def load_registry(path: str) -> Dict[str, Any]:
+    """load_json for static registries: returns {} if missing, and the previously parsed
+    object while the file's mtime is unchanged. Callers must treat the result as read-only."""
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        _REGISTRY_CACHE.pop(path, None)
+        return {}
+    hit = _REGISTRY_CACHE.get(path)
+    if hit is not None and hit[0] == mtime:
+        return hit[1]
+    obj = load_json(path)
+    _REGISTRY_CACHE[path] = (mtime, obj)
+    return obj
+
+# -------------------------
 # Rate limiting helper
 # -------------------------
-_RATE_LIMIT_STATE: Dict[str, float] = {}
+# Keyed by caller-supplied key; ordered oldest-first so eviction is O(1) per entry.
+_RATE_LIMIT_STATE: "OrderedDict[str, float]" = OrderedDict()
+_RATE_LIMIT_MAX_ENTRIES = 10000
+_rate_limit_max_cooldown = 0.0  # largest cooldown seen; older entries can never block
 
-async def enforce_rate_limit(interaction: discord.Interaction, key: str, cooldown_seconds: int = 10) -> bool:
-    """
-    Async in-memory rate limiter for slash commands.
-
-    Returns True if allowed; otherwise sends an ephemeral message and returns False.
-    """
-    # ---- coerce cooldown_seconds safely ----
+def _coerce_cooldown(cooldown_seconds: Any) -> float:
+    """Best-effort conversion of an untyped cooldown value (e.g. from config) to seconds."""
     try:
         if isinstance(cooldown_seconds, str):
             cooldown_seconds = cooldown_seconds.strip()
-        cooldown_seconds = int(float(cooldown_seconds))
+        return float(int(float(cooldown_seconds)))
     except Exception:
-        cooldown_seconds = 10  # safe fallback
+        return 10.0  # safe fallback
 
-    now_ts = asyncio.get_event_loop().time()
-
-    last = _RATE_LIMIT_STATE.get(key, 0.0)
-    try:
-        last = float(last)
-    except Exception:
-        last = 0.0
-
-    if (now_ts - last) < float(cooldown_seconds):
-        remaining = int(float(cooldown_seconds) - (now_ts - last))
-        if remaining < 1:
-            remaining = 1
+async def _enforce(interaction: discord.Interaction, key: str, cooldown_seconds: float) -> bool:
+    now_ts = time.monotonic()
+    elapsed = now_ts - _RATE_LIMIT_STATE.get(key, float("-inf"))
 
+    if elapsed < cooldown_seconds:
+        remaining = max(1, int(cooldown_seconds - elapsed))
         msg = f"Rate limit: try again in {remaining}s."
         try:
             if interaction.response.is_done():
@@ -282,17 +400,135 @@ async def enforce_rate_limit(interaction: discord.Interaction, key: str, cooldow
             pass
         return False
 
+    global _rate_limit_max_cooldown
+    if cooldown_seconds > _rate_limit_max_cooldown:
+        _rate_limit_max_cooldown = cooldown_seconds
     _RATE_LIMIT_STATE[key] = now_ts
+    _RATE_LIMIT_STATE.move_to_end(key)
+    # Drop entries that have outlived every possible cooldown, then cap the size.
+    while _RATE_LIMIT_STATE:
+        oldest_key, oldest_ts = next(iter(_RATE_LIMIT_STATE.items()))
+        if now_ts - oldest_ts <= _rate_limit_max_cooldown and len(_RATE_LIMIT_STATE) <= _RATE_LIMIT_MAX_ENTRIES:
+            break
+        del _RATE_LIMIT_STATE[oldest_key]
     return True
 
+async def enforce_rate_limit(interaction: discord.Interaction, key: str, cooldown_seconds: int = 10) -> bool:
+    """
+    Async in-memory rate limiter for slash commands.
+
+    Returns True if allowed; otherwise sends an ephemeral message and returns False.
+    Numeric cooldowns (the usual literal at call sites) skip coercion entirely.
+    """
+    if type(cooldown_seconds) not in (int, float):
+        cooldown_seconds = _coerce_cooldown(cooldown_seconds)
+    return await _enforce(interaction, key, cooldown_seconds)
+
 def save_json(path: str, obj: Any) -> None:
     # Ensure parent directory exists (e.g. data/)
     os.makedirs(os.path.dirname(path), exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(obj, f, ensure_ascii=False, indent=2)
+    # orjson writes UTF-8 directly (same output as ensure_ascii=False, indent=2).
+    with open(path, "wb") as f:
+        f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+
+def save_json_atomic(path: str, obj: Any) -> None:
+    # Write to a sibling temp file then rename, so a crash never leaves a half-written cache.
+    tmp = path + ".tmp"
+    save_json(tmp, obj)
+    os.replace(tmp, path)
+
+# Debounced writes for hot caches: path -> object to persist on the next flush.
+_DIRTY_CACHES: Dict[str, Any] = {}
+_CACHE_FLUSH_HANDLE: Optional[asyncio.TimerHandle] = None
+
+def _flush_dirty_caches() -> None:
+    global _CACHE_FLUSH_HANDLE
+    _CACHE_FLUSH_HANDLE = None
+    while _DIRTY_CACHES:
+        path, obj = _DIRTY_CACHES.popitem()
+        try:
+            save_json_atomic(path, obj)
+        except Exception as e:
+            logger.warning("Cache flush failed for %s: %s", path, e)
+
+def schedule_cache_flush(path: str, obj: Any, delay: float = 2.0) -> None:
+    """Mark a cache dirty; all pending caches are written once, `delay` seconds after the first mark."""
+    global _CACHE_FLUSH_HANDLE
+    _DIRTY_CACHES[path] = obj
+    if _CACHE_FLUSH_HANDLE is not None:
+        return
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:  # no loop (e.g. import-time/offline use): write now
+        _flush_dirty_caches()
+        return
+    _CACHE_FLUSH_HANDLE = loop.call_later(delay, _flush_dirty_caches)
+
+atexit.register(_flush_dirty_caches)
 
 DICT_REG = load_json(DICT_PATH)
 TRIVIA_REG = load_json(TRIVIA_PATH)
+ACADEMIC_REG = load_json(ACADEMIC_PATH) if os.path.exists(ACADEMIC_PATH) else {}
+FASHION_REG = load_json(FASHION_PATH) if os.path.exists(FASHION_PATH) else {}
+
+# -------------------------
+# Append-only logs for admin registry additions.
+# /registry add_* appends one JSONL record instead of rewriting the whole registry;
+# the log is replayed on load and folded back into the JSON file at startup/exit.
+# -------------------------
+ACADEMIC_LOG_PATH = os.path.splitext(ACADEMIC_PATH)[0] + ".jsonl"
+FASHION_LOG_PATH = os.path.splitext(FASHION_PATH)[0] + ".jsonl"
+
+def append_jsonl(path: str, record: Dict[str, Any]) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "ab") as f:
+        f.write(orjson.dumps(record) + b"\n")
+
+def _read_jsonl(path: str) -> List[Dict[str, Any]]:
+    if not os.path.exists(path):
+        return []
+    records = []
+    with open(path, "rb") as f:
+        for line in f:
+            try:
+                records.append(orjson.loads(line))
+            except orjson.JSONDecodeError:
+                continue  # blank or torn last line
+    return records
+
+def _append_unique(items: list, obj: Dict[str, Any]) -> None:
+    # Replaying a log that was already folded in (crash between save and truncate) must not duplicate.
+    if not any(i.get("name") == obj.get("name") and i.get("url") == obj.get("url") for i in items):
+        items.append(obj)
+
+def _apply_fashion_add(obj: Dict[str, Any]) -> None:
+    _append_unique(FASHION_REG.setdefault("free_academic_fashion_sources", []), obj)
+
+def _apply_academic_add(rec: Dict[str, Any]) -> None:
+    _append_unique(ACADEMIC_REG.setdefault("reference_hubs", {}).setdefault(rec["group"], []), rec["item"])
+
+def _compact_registry_logs() -> None:
+    for path, obj, log_path in ((ACADEMIC_PATH, ACADEMIC_REG, ACADEMIC_LOG_PATH), (FASHION_PATH, FASHION_REG, FASHION_LOG_PATH)):
+        if not os.path.exists(log_path):
+            continue
+        try:
+            obj["generated_utc"] = datetime.utcnow().replace(microsecond=0).isoformat()+"Z"
+            save_json_atomic(path, obj)
+            os.remove(log_path)
+        except Exception as e:
+            logger.warning("Could not compact %s: %s", log_path, e)
+
+for _rec in _read_jsonl(FASHION_LOG_PATH):
+    _apply_fashion_add(_rec)
+for _rec in _read_jsonl(ACADEMIC_LOG_PATH):
+    _apply_academic_add(_rec)
+_compact_registry_logs()
+atexit.register(_compact_registry_logs)
+# TRIVIA_REG is static at runtime, so the source list is computed once.
+_TRIVIA_SOURCE_URLS: List[str] = sorted({f["source_url"] for f in TRIVIA_REG.get("facts", []) if f.get("source_url")})
+_FACTS: List[Dict[str, Any]] = TRIVIA_REG.get("facts", [])
+# Keyed by str(id): trivia_state stores last_fact_id as text.
+_FACT_ID_INDEX: Dict[str, int] = {str(f["id"]): i for i, f in enumerate(_FACTS) if "id" in f}
 
 def get_tz():
     if ZoneInfo is None:
@@ -307,17 +543,32 @@ def get_tz():
 # -------------------------
 MEANING_PATTERN = re.compile(r"^\s*(?:what\s*['’]?s|what\s+is)\s+the\s+meaning\s+of\s+(.+?)\s*\??\s*$", re.IGNORECASE)
 
+# Official dictionary URL templates; fill with an already URL-encoded word via .format(w=...).
+_OXFORD_URL = "https://www.oxfordlearnersdictionaries.com/definition/english/{w}"
+_CAMBRIDGE_URL = "https://dictionary.cambridge.org/dictionary/english/{w}"
+_MW_URL = "https://www.merriam-webster.com/dictionary/{w}"
+_MW_THESAURUS_URL = "https://www.merriam-webster.com/thesaurus/{w}"
+_COLLINS_URL = "https://www.collinsdictionary.com/dictionary/english/{w}"
+_OED_URL = "https://www.oed.com/search/dictionary/?scope=Entries&q={w}"
+_UK_TEMPLATES = (
+    "• Oxford Learner’s: " + _OXFORD_URL,
+    "• Cambridge: " + _CAMBRIDGE_URL,
+)
+
+@functools.lru_cache(maxsize=4096)
+def _quote_word(word: str) -> str:
+    """URL-encoded form of a looked-up word; common words repeat, so cache them."""
+    return quote(word.strip(), safe="")
+
 async def fetch_definition_free_api(term: str) -> Optional[str]:
     """Uses a public dictionary API (dictionaryapi.dev) for a short definition.
     We do NOT scrape premium dictionaries; we provide official links for those."""
-    import aiohttp
     url = f"https://api.dictionaryapi.dev/api/v2/entries/en/{term}"
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, timeout=12) as resp:
-                if resp.status != 200:
-                    return None
-                data = await resp.json()
+        async with _http().get(url, timeout=aiohttp.ClientTimeout(total=12)) as resp:
+            if resp.status != 200:
+                return None
+            data = await resp.json()
         # Parse first meaning
         if isinstance(data, list) and data:
             meanings = data[0].get("meanings") or []
@@ -332,14 +583,14 @@ async def fetch_definition_free_api(term: str) -> Optional[str]:
         return None
 
 def build_dictionary_links(term: str) -> List[tuple]:
-    term_enc = term.replace(" ", "%20")
+    term_enc = _quote_word(term)
     # Direct entry links where stable, otherwise search pages
     links = [
-        ("Oxford Learner's Dictionaries", f"https://www.oxfordlearnersdictionaries.com/definition/english/{term_enc}"),
-        ("Cambridge Dictionary", f"https://dictionary.cambridge.org/dictionary/english/{term_enc}"),
-        ("Merriam-Webster", f"https://www.merriam-webster.com/dictionary/{term_enc}"),
-        ("Collins Dictionary", f"https://www.collinsdictionary.com/dictionary/english/{term_enc}"),
-        ("Oxford English Dictionary (OED)", f"https://www.oed.com/search/dictionary/?scope=Entries&q={term_enc}"),
+        ("Oxford Learner's Dictionaries", _OXFORD_URL.format(w=term_enc)),
+        ("Cambridge Dictionary", _CAMBRIDGE_URL.format(w=term_enc)),
+        ("Merriam-Webster", _MW_URL.format(w=term_enc)),
+        ("Collins Dictionary", _COLLINS_URL.format(w=term_enc)),
+        ("Oxford English Dictionary (OED)", _OED_URL.format(w=term_enc)),
     ]
     return links
 
@@ -366,7 +617,7 @@ async def send_definition(interaction_or_channel, term: str, requester: Optional
         embed.set_footer(text=f"Requested by {requester}")
 
     if isinstance(interaction_or_channel, discord.Interaction):
-        await interaction_or_channel.response.send_message(embed=embed)
+        await _reply(interaction_or_channel, embed=embed)
     else:
         await interaction_or_channel.send(embed=embed)
 
@@ -374,13 +625,17 @@ async def send_definition(interaction_or_channel, term: str, requester: Optional
 # Trivia helper
 # -------------------------
 def pick_trivia_fact(exclude_id: Optional[str]=None) -> Dict[str, Any]:
-    facts = TRIVIA_REG.get("facts", [])
-    if not facts:
+    n = len(_FACTS)
+    if not n:
         raise RuntimeError("No trivia facts loaded.")
-    candidates = [f for f in facts if f.get("id") != exclude_id] if exclude_id else facts[:]
-    if not candidates:
-        candidates = facts[:]
-    return random.choice(candidates)
+    ex = _FACT_ID_INDEX.get(exclude_id) if exclude_id else None
+    if n <= 1 or ex is None:
+        return random.choice(_FACTS)
+    # Draw from the n-1 other slots and step over the excluded one: O(1), no copy.
+    i = random.randrange(n - 1)
+    if i >= ex:
+        i += 1
+    return _FACTS[i]
 
 def trivia_embed(fact_obj: Dict[str, Any]) -> discord.Embed:
     topic = fact_obj.get("topic", "Academic Trivia")
@@ -391,14 +646,14 @@ def trivia_embed(fact_obj: Dict[str, Any]) -> discord.Embed:
     return embed
 
 async def post_daily_trivia_for_guild(guild: discord.Guild) -> bool:
-    chan_id = db_get_channel(guild.id, "trivia")
+    chan_id = await get_channel_cached(guild.id, "trivia")
     if not chan_id:
         return False
     channel = guild.get_channel(chan_id)
     if not isinstance(channel, discord.TextChannel):
         return False
 
-    state = db_get_trivia_state(guild.id)
+    state = await get_trivia_state_cached(guild.id)
     today = datetime.now(get_tz()).date() if get_tz() else date.today()
     today_str = today.isoformat()
     if state.get("last_sent_date") == today_str:
@@ -406,7 +661,7 @@ async def post_daily_trivia_for_guild(guild: discord.Guild) -> bool:
 
     fact_obj = pick_trivia_fact(exclude_id=state.get("last_fact_id"))
     await channel.send(embed=trivia_embed(fact_obj))
-    db_set_trivia_state(guild.id, today_str, str(fact_obj.get("id")))
+    await asyncio.to_thread(db_set_trivia_state, guild.id, today_str, str(fact_obj.get("id")))
     return True
 
 @tasks.loop(minutes=1)
@@ -424,122 +679,83 @@ async def trivia_scheduler():
 # -------------------------
 # Events
 # -------------------------
-@bot.event
-async def on_ready():
-    db_init()
-
-    # Ensure /drawing commands are registered once
-    if not getattr(bot, "_drawing_registered", False):
-        try:
-            await register_drawing(bot, DATA_DIR)
-            bot._drawing_registered = True
-        except Exception as e:
-            if "already registered" in str(e).lower():
-                bot._drawing_registered = True
-                logger.warning("Drawing command group was already registered; continuing.")
-            else:
-                logger.warning("Drawing module registration failed: %s", e)
-    # Ensure /weather commands are registered once
-    if not getattr(bot, "_weather_registered", False):
-        try:
-            register_weather(bot, DATA_DIR)
-            bot._weather_registered = True
-        except Exception as e:
-            logger.warning("Weather module registration failed: %s", e)
+async def _register_once(flag: str, func, label: str) -> bool:
+    """Register an optional command module once per process.
 
-    # Ensure /freegames commands are registered once
-    if not getattr(bot, "_free_games_registered", False):
-        try:
-            await register_free_games(bot, DATA_DIR)
-            bot._free_games_registered = True
-        except Exception as e:
-            # If a reconnect happens, Discord.py may see the group as already present.
-            if "already registered" in str(e).lower():
-                bot._free_games_registered = True
-                logger.warning("Free games command group was already registered; continuing.")
-            else:
-                logger.warning("Free games module registration failed: %s", e)
+    Returns True when the module was newly registered (so a re-sync is needed).
+    """
+    if getattr(bot, flag, False):
+        return False
+    if func is None:
+        setattr(bot, flag, True)
+        return False
+    try:
+        result = func(bot, DATA_DIR)
+        if asyncio.iscoroutine(result):
+            await result
+        setattr(bot, flag, True)
+        return True
+    except Exception as e:
+        # If a reconnect happens, Discord.py may see the group as already present.
+        if "already" in str(e).lower():
+            setattr(bot, flag, True)
+            logger.warning("%s commands were already registered; continuing.", label)
+        else:
+            logger.warning("%s module registration failed: %s", label, e)
+        return False
 
-    # Ensure /help commands are registered once
-    if not getattr(bot, "_help_registered", False):
-        try:
-            register_help(bot, DATA_DIR)
-            bot._help_registered = True
-        except Exception as e:
-            # If a reconnect happens, Discord.py may see the command as already present.
-            if "already registered" in str(e).lower():
-                bot._help_registered = True
-                logger.warning("Help command was already registered; continuing.")
-            else:
-                logger.warning("Help module registration failed: %s", e)
+# Registered before the first sync: core commands users expect immediately.
+CORE_REGISTRATIONS = [
+    ("_drawing_registered", register_drawing, "Drawing"),
+    ("_weather_registered", register_weather, "Weather"),
+    ("_free_games_registered", register_free_games, "Free games"),
+    ("_help_registered", register_help, "Help"),
+]
 
-    # Ensure /gaming commands are registered once
-    if not getattr(bot, "_gaming_products_registered", False):
-        try:
-            register_gaming_products(bot, DATA_DIR)
-            bot._gaming_products_registered = True
-        except Exception as e:
-            if "already registered" in str(e).lower():
-                bot._gaming_products_registered = True
-                logger.warning("Gaming command group was already registered; continuing.")
-            else:
-                logger.warning("Gaming module registration failed: %s", e)
+# Registered on a background task after the first sync, then re-synced.
+BACKGROUND_REGISTRATIONS = [
+    ("_gaming_products_registered", register_gaming_products, "Gaming"),
+    ("_history_of_the_consoles_registered", register_history_of_the_consoles, "Console"),
+    ("_first_and_early_games_from_the_history_registered", register_first_and_early_games_from_the_history, "Games"),
+    ("_belgium_beverages_registered", register_belgium_beverages, "Belgium beverages"),
+    ("_badges_registered", register_badges, "Badges"),
+]
 
-    # Ensure /console commands are registered once
-    if not getattr(bot, "_history_of_the_consoles_registered", False):
-        try:
-            register_history_of_the_consoles(bot, DATA_DIR)
-            bot._history_of_the_consoles_registered = True
-        except Exception as e:
-            if "already registered" in str(e).lower():
-                bot._history_of_the_consoles_registered = True
-                logger.warning("Console command group was already registered; continuing.")
-            else:
-                logger.warning("Console module registration failed: %s", e)
+async def _sync_guild(gid: int) -> None:
+    guild = discord.Object(id=gid)
+    bot.tree.copy_global_to(guild=guild)
+    synced = await bot.tree.sync(guild=guild)
+    logger.info("Synced %s command(s) to guild %s. Logged in as %s", len(synced), gid, bot.user)
 
-    # Ensure /games commands are registered once
-    if not getattr(bot, "_first_and_early_games_from_the_history_registered", False):
-        try:
-            register_first_and_early_games_from_the_history(bot, DATA_DIR)
-            bot._first_and_early_games_from_the_history_registered = True
-        except Exception as e:
-            if "already registered" in str(e).lower():
-                bot._first_and_early_games_from_the_history_registered = True
-                logger.warning("Games command group was already registered; continuing.")
-            else:
-                logger.warning("Games module registration failed: %s", e)
+async def _sync_command_tree() -> None:
+    # Guild commands propagate in seconds; global ones can take up to an hour.
+    # With GUILD_IDS (or DEV_GUILD_ID) set, every group is copied into those
+    # guilds and synced there in one pass; otherwise we sync globally.
+    try:
+        if GUILD_IDS:
+            await asyncio.gather(*(_sync_guild(gid) for gid in dict.fromkeys(GUILD_IDS)))
+        else:
+            synced = await bot.tree.sync()
+            logger.info("Synced %s command(s) globally. Logged in as %s", len(synced), bot.user)
+    except Exception as e:
+        logger.warning("Command sync failed: %s", e)
 
-    
-    # Ensure /belgium beverages commands are registered once
-    if not getattr(bot, "_belgium_beverages_registered", False):
-        try:
-            if register_belgium_beverages:
-                await register_belgium_beverages(bot, DATA_DIR)
-            bot._belgium_beverages_registered = True
-        except Exception as e:
-            if "already" in str(e).lower():
-                bot._belgium_beverages_registered = True
-                logger.warning("Belgium beverages commands were already registered; continuing.")
-            else:
-                logger.warning("Belgium beverages registration failed: %s", e)
+async def _register_bg_modules() -> None:
+    added = await asyncio.gather(*(_register_once(*r) for r in BACKGROUND_REGISTRATIONS))
+    if any(added):
+        await _sync_command_tree()
 
+@bot.event
+async def on_ready():
+    db_init()
 
+    # Core modules first (concurrently), so the initial sync already includes them.
+    await asyncio.gather(*(_register_once(*r) for r in CORE_REGISTRATIONS))
 
-    # Ensure /badges commands are registered once (Twitch badges watcher)
-    if not getattr(bot, "_badges_registered", False):
-        try:
-            if register_badges:
-                await register_badges(bot, DATA_DIR)
-            bot._badges_registered = True
-        except Exception as e:
-            if "already" in str(e).lower():
-                bot._badges_registered = True
-                logger.warning("Badges command group was already registered; continuing.")
-            else:
-                logger.warning("Badges registration failed: %s", e)
 # Compute governance report after startup (avoid crashing at import time)
     global GOV_REPORT
     try:
+        _rebuild_allow_sets()
         GOV_REPORT = validate_registry_links()
         logger.info(
             "Governance validation done. checked=%s violations=%s",
@@ -556,27 +772,14 @@ async def on_ready():
         }
 
     # --- Slash command sync ---
-    # DEV_GUILD_ID enables faster 'instant' syncing to a single test server.
-    # If DEV_GUILD_ID is set, we sync to that guild; otherwise we sync globally.
-    try:
-        dev_guild_id = (os.getenv("DEV_GUILD_ID", "") or "").strip()
-        if dev_guild_id:
-            gid = int(dev_guild_id)
-            guild = discord.Object(id=gid)
-            try:
-                bot.tree.copy_global_to(guild=guild)
-            except Exception:
-                pass
-            synced = await bot.tree.sync(guild=guild)
-            logger.info("Synced %s command(s) to DEV_GUILD_ID=%s. Logged in as %s", len(synced), gid, bot.user)
-        else:
-            synced = await bot.tree.sync()
-            logger.info("Synced %s command(s) globally. Logged in as %s", len(synced), bot.user)
-    except Exception as e:
-        logger.warning("Command sync failed: %s", e)
+    await _sync_command_tree()
+
+    # Optional modules register off the critical path and trigger their own re-sync.
+    bot._bg_registration_task = asyncio.create_task(_register_bg_modules())
 
     if not trivia_scheduler.is_running():
         trivia_scheduler.start()
+    _start_weekly_jobs()
 @bot.event
 async def on_message(message: discord.Message):
     if message.author.bot:
@@ -591,35 +794,68 @@ async def on_message(message: discord.Message):
 def require_guild(interaction: discord.Interaction) -> bool:
     return interaction.guild is not None
 
+async def _reply(interaction: discord.Interaction, *args, **kwargs) -> None:
+    """Send via the followup webhook once the interaction has been acknowledged."""
+    if interaction.response.is_done():
+        await interaction.followup.send(*args, **kwargs)
+    else:
+        await interaction.response.send_message(*args, **kwargs)
+
+def deferred_cmd(fn):
+    """Acknowledge the interaction before running the handler.
+
+    Discord invalidates interactions that are not acknowledged within 3s
+    (error 10062); deferring first extends the window to 15 minutes, so slow
+    DB or registry work can no longer time the command out.
+    """
+    @functools.wraps(fn)
+    async def wrap(interaction: discord.Interaction, *args, **kwargs):
+        if not interaction.response.is_done():
+            await interaction.response.defer(thinking=False)
+        return await fn(interaction, *args, **kwargs)
+    return wrap
+
+# Toggleable modules (see /settings) and their fixed rejection notices.
+_MODULES = ("academic", "fashion", "trivia", "dictionaries", "weather")
+_DISABLED_MSGS: Dict[str, str] = {m: f"The **{m}** module is disabled in this server." for m in _MODULES}
+
+def requires_module(name: str):
+    """Short-circuit the command with a notice when module `name` is disabled in this server."""
+    msg = _DISABLED_MSGS[name]
+    def deco(fn):
+        @functools.wraps(fn)
+        async def wrap(interaction: discord.Interaction, *args, **kwargs):
+            if not await module_enabled(interaction, name):
+                await _reply(interaction, msg)
+                return
+            return await fn(interaction, *args, **kwargs)
+        return wrap
+    return deco
+
 # -------------------------
 # Commands: Dictionaries
 # -------------------------
 @bot.tree.command(name="dictionaries", description="List prestigious English dictionaries used by the bot.")
+@deferred_cmd
+@requires_module("dictionaries")
 async def dictionaries_cmd(interaction: discord.Interaction):
-    if not module_enabled(interaction, "dictionaries"):
-        await interaction.response.send_message("The **dictionaries** module is disabled in this server.")
-        return
-
     dcts = DICT_REG.get("dictionaries", [])
-    embed = discord.Embed(title="Prestigious English dictionaries")
-    embed.description = "Official sites are listed below. (The bot does not scrape subscription content.)"
+    embed = discord.Embed(title="Prestigious English dictionaries", description="Official sites are listed below. (The bot does not scrape subscription content.)")
     for d in dcts:
         embed.add_field(
             name=d["name"],
             value=f'{d["official_url"]}\nType: {d.get("type","")} | Access: {d.get("access","")}',
             inline=False)
-    await interaction.response.send_message(embed=embed)
+    await _reply(interaction, embed=embed)
 
 @bot.tree.command(name="define", description="Define a word and show official dictionary links.")
 @app_commands.describe(phrase="Use the exact pattern: what's the meaning of <word>?")
+@deferred_cmd
+@requires_module("dictionaries")
 async def define_cmd(interaction: discord.Interaction, phrase: str):
-    if not module_enabled(interaction, "dictionaries"):
-        await interaction.response.send_message("The **dictionaries** module is disabled in this server.")
-        return
-
     m = MEANING_PATTERN.match(phrase or "")
     if not m:
-        await interaction.response.send_message(
+        await _reply(interaction, 
             "Please use the exact pattern: **what's the meaning of <word>?**")
         return
     term = m.group(1).strip()
@@ -637,63 +873,53 @@ tesla_group = app_commands.Group(
 
 @trivia_group.command(name="setchannel", description="Set the channel where the daily trivia will be posted (admin).")
 @app_commands.describe(channel="Target channel for daily trivia posts")
+@deferred_cmd
+@requires_module("trivia")
 async def trivia_setchannel(interaction: discord.Interaction, channel: discord.TextChannel):
-    if not module_enabled(interaction, "trivia"):
-        await interaction.response.send_message("The **trivia** module is disabled in this server.")
-        return
-
     if not require_guild(interaction):
-        await interaction.response.send_message("This must be used in a server.")
+        await _reply(interaction, "This must be used in a server.")
         return
     if not interaction.user.guild_permissions.manage_guild:
-        await interaction.response.send_message("You need 'Manage Server' permission.")
+        await _reply(interaction, "You need 'Manage Server' permission.")
         return
-    db_set_channel(interaction.guild_id, "trivia", channel.id)
-    await interaction.response.send_message(f"Daily trivia will be posted in {channel.mention} at {TRIVIA_POST_HOUR:02d}:{TRIVIA_POST_MINUTE:02d} ({TZ_NAME}).")
+    await asyncio.to_thread(db_set_channel, interaction.guild_id, "trivia", channel.id)
+    await _reply(interaction, f"Daily trivia will be posted in {channel.mention} at {TRIVIA_POST_HOUR:02d}:{TRIVIA_POST_MINUTE:02d} ({TZ_NAME}).")
 
 @trivia_group.command(name="now", description="Post one academic trivia item right now (manual).")
+@deferred_cmd
+@requires_module("trivia")
 async def trivia_now(interaction: discord.Interaction):
-    if not module_enabled(interaction, "trivia"):
-        await interaction.response.send_message("The **trivia** module is disabled in this server.")
-        return
-
     if not require_guild(interaction):
-        await interaction.response.send_message("This must be used in a server.")
+        await _reply(interaction, "This must be used in a server.")
         return
-    state = db_get_trivia_state(interaction.guild_id)
+    state = await get_trivia_state_cached(interaction.guild_id)
     fact_obj = pick_trivia_fact(exclude_id=state.get("last_fact_id"))
-    await interaction.response.send_message(embed=trivia_embed(fact_obj))
+    await _reply(interaction, embed=trivia_embed(fact_obj))
 
 @trivia_group.command(name="sources", description="Show the curated sources behind the trivia facts.")
+@deferred_cmd
+@requires_module("trivia")
 async def trivia_sources(interaction: discord.Interaction):
-    if not module_enabled(interaction, "trivia"):
-        await interaction.response.send_message("The **trivia** module is disabled in this server.")
-        return
-
     # Show unique domains / source URLs
-    facts = TRIVIA_REG.get("facts", [])
-    urls = sorted({f.get("source_url") for f in facts if f.get("source_url")})
-    embed = discord.Embed(title="Trivia sources (reference links)")
-    embed.description = "\n".join(f"• {u}" for u in urls[:25])
+    urls = _TRIVIA_SOURCE_URLS
+    embed = discord.Embed(title="Trivia sources (reference links)", description="\n".join(f"• {u}" for u in urls[:25]))
     if len(urls) > 25:
         embed.add_field(name="More", value=f"And {len(urls)-25} more sources in the registry.", inline=False)
-    await interaction.response.send_message(embed=embed)
+    await _reply(interaction, embed=embed)
 
 @trivia_group.command(name="status", description="Show trivia posting status for this server.")
+@deferred_cmd
+@requires_module("trivia")
 async def trivia_status(interaction: discord.Interaction):
-    if not module_enabled(interaction, "trivia"):
-        await interaction.response.send_message("The **trivia** module is disabled in this server.")
-        return
-
     if not require_guild(interaction):
-        await interaction.response.send_message("This must be used in a server.")
+        await _reply(interaction, "This must be used in a server.")
         return
-    chan_id = db_get_channel(interaction.guild_id, "trivia")
-    state = db_get_trivia_state(interaction.guild_id)
+    chan_id = await get_channel_cached(interaction.guild_id, "trivia")
+    state = await get_trivia_state_cached(interaction.guild_id)
     embed = discord.Embed(title="Trivia status")
     embed.add_field(name="Channel", value=f"<#{chan_id}>" if chan_id else "Not set", inline=False)
     embed.add_field(name="Last sent date", value=state.get("last_sent_date") or "Never", inline=False)
-    await interaction.response.send_message(embed=embed)
+    await _reply(interaction, embed=embed)
 
 bot.tree.add_command(trivia_group)
 
@@ -724,484 +950,654 @@ async def bundles(interaction: discord.Interaction, source: Optional[str] = None
 
 @bot.tree.command(name="define_word", description="Define a word (academic dictionaries only).")
 @app_commands.describe(word="English word to define")
+@deferred_cmd
+@requires_module("dictionaries")
 async def define_word(interaction: discord.Interaction, word: str):
-    if not module_enabled(interaction, "dictionaries"):
-        await interaction.response.send_message("The **dictionaries** module is disabled in this server.")
-        return
-
     # Reuse the same pipeline as the phrase-based define
     await send_definition(interaction, word, requester=str(interaction.user))
 
 @bot.tree.command(name="define_compare", description="Compare UK vs US usage and pronunciation (academic dictionaries).")
 @app_commands.describe(word="English word to compare (UK vs US)")
+@deferred_cmd
+@requires_module("dictionaries")
 async def define_compare(interaction: discord.Interaction, word: str):
-    if not module_enabled(interaction, "dictionaries"):
-        await interaction.response.send_message("The **dictionaries** module is disabled in this server.")
-        return
-
     w = (word or "").strip()
     if not w:
-        await interaction.response.send_message("Please provide a word to compare.")
+        await _reply(interaction, "Please provide a word to compare.")
         return
+    w_enc = _quote_word(w)
 
-    embed = discord.Embed(title=f"UK vs US — {w}")
-    embed.description = (
-        "This comparison is based on authoritative dictionaries. "
-        "Follow the official links below for full entries, IPA, and audio."
+    embed = discord.Embed(
+        title=f"UK vs US — {w}",
+        description=(
+            "This comparison is based on authoritative dictionaries. "
+            "Follow the official links below for full entries, IPA, and audio."
+        ),
     )
 
     embed.add_field(
         name="UK (Oxford / Cambridge)",
-        value=(
-            f"• Oxford Learner’s: https://www.oxfordlearnersdictionaries.com/definition/english/{w}\n"
-            f"• Cambridge: https://dictionary.cambridge.org/dictionary/english/{w}"
-        ),
+        value="\n".join(t.format(w=w_enc) for t in _UK_TEMPLATES),
         inline=False,
     )
     embed.add_field(
         name="US (Merriam-Webster)",
-        value=f"• Merriam-Webster: https://www.merriam-webster.com/dictionary/{w}",
+        value="• Merriam-Webster: " + _MW_URL.format(w=w_enc),
         inline=False,
     )
 
-    await interaction.response.send_message(embed=embed)
+    await _reply(interaction, embed=embed)
 
 @bot.tree.command(name="define_etymology", description="Show etymology references (academic dictionaries only).")
 @app_commands.describe(word="English word to check etymology")
+@deferred_cmd
+@requires_module("dictionaries")
 async def define_etymology(interaction: discord.Interaction, word: str):
-    if not module_enabled(interaction, "dictionaries"):
-        await interaction.response.send_message("The **dictionaries** module is disabled in this server.")
-        return
-
     w = (word or "").strip()
     if not w:
-        await interaction.response.send_message("Please provide a word.")
+        await _reply(interaction, "Please provide a word.")
         return
+    w_enc = _quote_word(w)
 
-    embed = discord.Embed(title=f"Etymology — {w}")
-    embed.description = (
-        "Etymology references from authoritative dictionaries. "
-        "Follow the official links below for full historical entries."
+    embed = discord.Embed(
+        title=f"Etymology — {w}",
+        description=(
+            "Etymology references from authoritative dictionaries. "
+            "Follow the official links below for full historical entries."
+        ),
     )
     embed.add_field(
         name="Oxford English Dictionary (OED)",
-        value=f"https://www.oed.com/search/dictionary/?scope=Entries&q={w}",
+        value=_OED_URL.format(w=w_enc),
         inline=False,
     )
     embed.add_field(
         name="Merriam-Webster (Etymology)",
-        value=f"https://www.merriam-webster.com/dictionary/{w}#etymology",
+        value=_MW_URL.format(w=w_enc) + "#etymology",
         inline=False,
     )
-    await interaction.response.send_message(embed=embed)
+    await _reply(interaction, embed=embed)
 
 @bot.tree.command(name="define_usage", description="Usage examples and synonyms (authoritative dictionaries).")
 @app_commands.describe(word="English word to check usage and synonyms")
+@deferred_cmd
+@requires_module("dictionaries")
 async def define_usage(interaction: discord.Interaction, word: str):
-    if not module_enabled(interaction, "dictionaries"):
-        await interaction.response.send_message("The **dictionaries** module is disabled in this server.")
-        return
-
-    embed = discord.Embed(title=f"Usage & Synonyms — {word}")
-    embed.description = (
-        "Authoritative usage notes and synonym sets via official dictionary pages."
+    w_enc = _quote_word(word)
+    embed = discord.Embed(
+        title=f"Usage & Synonyms — {word}",
+        description=(
+            "Authoritative usage notes and synonym sets via official dictionary pages."
+        ),
     )
     embed.add_field(
         name="Oxford Learner’s (Usage & Examples)",
-        value=f"https://www.oxfordlearnersdictionaries.com/definition/english/{word}",
+        value=_OXFORD_URL.format(w=w_enc),
         inline=False)
     embed.add_field(
         name="Cambridge (Examples)",
-        value=f"https://dictionary.cambridge.org/dictionary/english/{word}",
+        value=_CAMBRIDGE_URL.format(w=w_enc),
         inline=False)
     embed.add_field(
         name="Merriam-Webster (Synonyms)",
-        value=f"https://www.merriam-webster.com/thesaurus/{word}",
+        value=_MW_THESAURUS_URL.format(w=w_enc),
         inline=False)
-    await interaction.response.send_message(embed=embed)
+    await _reply(interaction, embed=embed)
 
 @bot.tree.command(name="define_pronunciation", description="Pronunciation (IPA & audio via official dictionaries).")
 @app_commands.describe(word="English word to check pronunciation")
+@deferred_cmd
+@requires_module("dictionaries")
 async def define_pronunciation(interaction: discord.Interaction, word: str):
-    if not module_enabled(interaction, "dictionaries"):
-        await interaction.response.send_message("The **dictionaries** module is disabled in this server.")
-        return
-
-    embed = discord.Embed(title=f"Pronunciation — {word}")
-    embed.description = (
-        "IPA and audio pronunciations are provided on the official dictionary pages below."
+    w_enc = _quote_word(word)
+    embed = discord.Embed(
+        title=f"Pronunciation — {word}",
+        description=(
+            "IPA and audio pronunciations are provided on the official dictionary pages below."
+        ),
     )
     embed.add_field(
         name="Oxford / Cambridge (UK)",
-        value=(
-            f"• Oxford Learner’s: https://www.oxfordlearnersdictionaries.com/definition/english/{word}\n"
-            f"• Cambridge: https://dictionary.cambridge.org/dictionary/english/{word}"
-        ),
+        value="\n".join(t.format(w=w_enc) for t in _UK_TEMPLATES),
         inline=False)
     embed.add_field(
         name="Merriam-Webster (US)",
-        value=f"https://www.merriam-webster.com/dictionary/{word}",
+        value=_MW_URL.format(w=w_enc),
         inline=False)
-    await interaction.response.send_message(embed=embed)
+    await _reply(interaction, embed=embed)
 
 # -------------------------
 # Academic helpers (link-first, no scraping)
 # -------------------------
-def ensure_academic_enabled(interaction: discord.Interaction) -> bool:
-    return module_enabled(interaction, "academic")
+@functools.lru_cache(maxsize=4096)
+def _norm(s: str) -> str:
+    return (s or "").strip().lower()
+
+@functools.lru_cache(maxsize=1024)
+def _closest_key_cached(keys: tuple, topic_n: str) -> str:
+    if not keys:
+        return ""
+    t = topic_n.replace("-", " ").replace("_", " ")
+    for k in keys:
+        if k.replace("_", " ") == t:
+            return k
+    for k in keys:
+        k_sp = k.replace("_", " ")
+        if t and (t in k_sp or k_sp in t):
+            return k
+    return keys[0]
+
+def _closest_key(mapping: dict, topic: str) -> str:
+    """Best-effort match of a free-text topic to a registry key (e.g. "visual analysis" -> "visual_analysis").
+
+    Results are memoized on (keys, normalized topic); repeat topics are a dict hit.
+    """
+    return _closest_key_cached(tuple(mapping), _norm(topic))
+
+class Ref(NamedTuple):
+    name: str
+    url: str
+
+def _freeze_refs(lst) -> List[Ref]:
+    """Registry {"name", "url"} dicts -> compact Ref tuples (entries without a url are dropped)."""
+    return [Ref(r.get("name", ""), r["url"]) for r in lst if r.get("url")]
+
+def _ref_line(r: Ref) -> str:
+    return f"• {r.name}: {r.url}"
+
+def _ref_lines(refs) -> List[str]:
+    return [_ref_line(r) for r in refs]
 
 def _mk_refs(refs: list) -> str:
-    return "\n".join(
-        f"• {r.get('name')}: {r.get('url')}"
-        for r in refs
-        if r.get("url")
-    ) or "No references available."
+    return "\n".join(_ref_lines(_freeze_refs(refs))) or "No references available."
 
-def _embed_from(title: str, bullets: list, refs: list) -> discord.Embed:
-    e = discord.Embed(title=title)
-    if bullets:
-        e.description = "\n".join(f"• {b}" for b in bullets)
+def _mk_bullets(bullets) -> str:
+    return "\n".join(f"• {b}" for b in bullets)
+
+def _refs_value(refs) -> str:
     # Governance: always show a reference field
-    if refs:
-        e.add_field(name="Academic references (official)", value=_mk_refs(refs), inline=False)
-    else:
-        e.add_field(
-            name="Academic references (official)",
-            value="(Missing references in registry for this item)",
-            inline=False,
-        )
+    return _mk_refs(refs) if refs else "(Missing references in registry for this item)"
+
+def _join_ref_lines(*slices: List[str]) -> str:
+    """_refs_value for references already formatted by _ref_lines, given as one or more hub slices.
+
+    Writes straight into a buffer so multi-hub presets never build a concatenated list.
+    """
+    buf = io.StringIO()
+    sep = ""
+    for lines in slices:
+        for line in lines:
+            buf.write(sep)
+            buf.write(line)
+            sep = "\n"
+    return buf.getvalue() or "(Missing references in registry for this item)"
+
+def _embed_from(title: str, bullets: list, refs: list) -> discord.Embed:
+    e = discord.Embed(title=title, description=_mk_bullets(bullets) if bullets else None)
+    e.add_field(name="Academic references (official)", value=_refs_value(refs), inline=False)
     return e
 
+class _FrozenEmbed(discord.Embed):
+    """Embed built from static content whose to_dict() payload is computed once.
+
+    Do not mutate after the first send; use copy_with_title for per-call titles.
+    (No __slots__ here: Embed.to_dict walks self.__slots__.)
+    """
+
+    def to_dict(self):
+        payload = getattr(self, "_payload", None)
+        if payload is None:
+            payload = self._payload = super().to_dict()
+        return dict(payload)
+
+    def copy_with_title(self, title: str) -> "_FrozenEmbed":
+        e = _FrozenEmbed(title=title, description=self.description)
+        fields = getattr(self, "_fields", None)
+        if fields is not None:
+            e._fields = fields  # shared, read-only
+        e._payload = {**self.to_dict(), "title": title}
+        return e
+
+def _embed_from_pre(title: Optional[str], desc: str, refs_value: str) -> _FrozenEmbed:
+    """_embed_from for preset commands whose description/reference strings are already joined."""
+    e = _FrozenEmbed(title=title, description=desc or None)
+    e.add_field(name="Academic references (official)", value=refs_value, inline=False)
+    return e
+
+# Registry paths bound once; handlers and preset builders use these names directly.
+_HUBS: Dict[str, list] = ACADEMIC_REG.setdefault("reference_hubs", {})
+# The registry dicts stay as-is (they are saved back by /registry add_academic_ref);
+# handlers read the frozen Ref copies.
+_HUB_REFS: Dict[str, List[Ref]] = {}
+# Hub group -> pre-formatted "• Name: URL" lines, so presets only slice and join.
+_HUBS_LINES: Dict[str, List[str]] = {}
+
+def _bind_hubs() -> None:
+    _HUB_REFS.clear()
+    for group in ("philosophy", "museums", "game_studies", "art_tech"):
+        _HUB_REFS[group] = []
+    _HUB_REFS.update((group, _freeze_refs(items)) for group, items in _HUBS.items())
+    _HUBS_LINES.clear()
+    _HUBS_LINES.update((group, _ref_lines(refs)) for group, refs in _HUB_REFS.items())
+
+_ACADEMIC_MODULES: Dict[str, dict] = ACADEMIC_REG.get("modules", {})
+_METHODOLOGY_GUIDES = _ACADEMIC_MODULES.get("methodology_guide", {})
+_ACADEMIC_DEBATES = _ACADEMIC_MODULES.get("academic_debate", {})
+_THEORY_ORIGINS = _ACADEMIC_MODULES.get("theory_origin", {})
+_DIGITAL_ARCHIVE_MAPS = _ACADEMIC_MODULES.get("digital_archive_map", {})
+
+def _build_academic_presets() -> Dict[str, tuple]:
+    """(description, references) strings per link-first academic command.
+
+    Both are fixed for a given registry, so they are joined once here rather than per call.
+    """
+    raw = {
+        "concept_map": (
+            (
+                "Definition (discipline-specific): philosophy, art history, media studies.",
+                "Key questions: meaning, representation, form, context, reception.",
+                "Typical methods: formal analysis, iconography, semiotics.",
+            ),
+            (_HUBS_LINES["philosophy"], _HUBS_LINES["museums"][:3]),
+        ),
+        "timeline": (
+            (
+                "Start with authoritative timelines (museum research portals).",
+                "Anchor dates with peer-reviewed discussions (journals).",
+                "Document primary sources (catalogues, collections, archives).",
+            ),
+            (_HUBS_LINES["museums"][:2], _HUBS_LINES["game_studies"][:2]),
+        ),
+        "institution_compare": (
+            (
+                "Compare: museums/collections, libraries, journals/press outputs, digital archives, open access.",
+                "Use official institutional pages for authoritative descriptions.",
+            ),
+            (
+                _ref_lines((
+                    Ref("Oxford University", "https://www.ox.ac.uk/"),
+                    Ref("University of Cambridge", "https://www.cam.ac.uk/"),
+                    Ref("Harvard University", "https://www.harvard.edu/"),
+                    Ref("MIT", "https://www.mit.edu/"),
+                    Ref("Sorbonne University", "https://www.sorbonne-universite.fr/en"),
+                )),
+            ),
+        ),
+        "sources": (
+            (
+                "Start with encyclopedic peer-reviewed references for definitions and conceptual framing.",
+                "Use museum research portals for historical grounding and object-based scholarship.",
+                "Use peer-reviewed journals for debates, methods, and state-of-the-art research.",
+            ),
+            (_HUBS_LINES["philosophy"], _HUBS_LINES["museums"][:3], _HUBS_LINES["game_studies"], _HUBS_LINES["art_tech"]),
+        ),
+        "museum_archive": (
+            (
+                "Use the official online collection for object records and metadata.",
+                "Use the research/learning portal for essays, catalogues, and scholarly context.",
+            ),
+            (_HUBS_LINES["museums"][:4],),
+        ),
+        "reading_path": (
+            (
+                "Beginner: peer-reviewed encyclopedia entries + museum terms/glossaries.",
+                "Intermediate: museum research essays + curated bibliographies.",
+                "Advanced: peer-reviewed journals and academic press monographs.",
+            ),
+            (_HUBS_LINES["philosophy"], _HUBS_LINES["museums"][:2], _HUBS_LINES["art_tech"][:1], _HUBS_LINES["game_studies"][:1]),
+        ),
+        "glossary": (
+            (
+                "Use institutional glossaries and museum term banks for controlled vocabulary.",
+                "Prefer peer-reviewed references for theoretical terms.",
+            ),
+            (_ref_lines((Ref("Tate — Art Terms", "https://www.tate.org.uk/art/art-terms"),)), _HUBS_LINES["philosophy"]),
+        ),
+        "open_access": (
+            ("Open-access peer-reviewed journals and institutional resources.",),
+            (_HUBS_LINES["game_studies"],),
+        ),
+        "ethics": (
+            (
+                "Use official rights and permissions pages for images and reproductions.",
+                "Cite sources consistently; keep access dates for web resources.",
+                "Do not redistribute paywalled content; link to official entries.",
+            ),
+            (
+                _ref_lines((
+                    Ref("The Met — Terms and Conditions", "https://www.metmuseum.org/information/terms-and-conditions"),
+                    Ref("Tate — Terms of Use", "https://www.tate.org.uk/about-us/policies-and-procedures/website-terms-use"),
+                )),
+            ),
+        ),
+        "discipline_bridge": (
+            (
+                "Philosophy: conceptual definitions and arguments.",
+                "Art history/visual culture: form, context, reception.",
+                "Game studies/media: systems, representation, interaction.",
+            ),
+            (_HUBS_LINES["philosophy"], _HUBS_LINES["museums"][:2], _HUBS_LINES["game_studies"][:2]),
+        ),
+        "canonical_texts": (
+            (
+                "Use academic press catalogues and peer-reviewed journals to identify canonical texts.",
+                "Prefer university presses (OUP, Cambridge UP, MIT Press) and established journals.",
+            ),
+            (
+                _ref_lines((
+                    Ref("Oxford University Press", "https://global.oup.com/academic/"),
+                    Ref("Cambridge University Press", "https://www.cambridge.org/"),
+                    Ref("MIT Press", "https://mitpress.mit.edu/"),
+                    Ref("Game Studies (OA)", "https://gamestudies.org/"),
+                    Ref("ToDIGRA (OA)", "https://todigra.org/"),
+                )),
+            ),
+        ),
+        "primary_secondary": (
+            (
+                "Primary sources: original artifacts/objects, contemporary documents, archival records, catalogs.",
+                "Secondary sources: scholarly analyses (peer-reviewed articles, monographs), curated timelines and essays.",
+                "Use museum collections as primary-source gateways; journals/presses for secondary interpretation.",
+            ),
+            (
+                _ref_lines((
+                    Ref("British Museum — Collection", "https://www.britishmuseum.org/collection"),
+                    Ref("The Met — Timeline of Art History", "https://www.metmuseum.org/toah/"),
+                    Ref("Game Studies (OA)", "https://gamestudies.org/"),
+                )),
+            ),
+        ),
+        "research_gap": (
+            (
+                "Identify gaps by reading recent peer-reviewed discussions and institutional reports.",
+                "Look for under-studied regions, media forms, archives, or methodological blind spots.",
+                "Define a narrow research question and map primary/secondary sources.",
+            ),
+            (
+                _ref_lines((
+                    Ref("ToDIGRA (OA)", "https://todigra.org/"),
+                    Ref("Game Studies (OA)", "https://gamestudies.org/"),
+                    Ref("Video Game History Foundation", "https://gamehistory.org/"),
+                )),
+            ),
+        ),
+        "vocabulary": (
+            (
+                "Use museum term banks and peer-reviewed references for controlled vocabulary.",
+                "Prefer institutional glossaries over informal sources.",
+            ),
+            (
+                _ref_lines((
+                    Ref("Tate — Art Terms", "https://www.tate.org.uk/art/art-terms"),
+                    Ref("The Met — Timeline of Art History", "https://www.metmuseum.org/toah/"),
+                )),
+            ),
+        ),
+        "skill": (
+            (
+                "Start with a clear research question and define key terms (use peer-reviewed references).",
+                "Use primary sources (collections/archives) for evidence; then interpret with secondary literature.",
+                "Document citations and keep a consistent reference style.",
+            ),
+            (
+                _ref_lines((
+                    Ref("Stanford Encyclopedia of Philosophy", "https://plato.stanford.edu/"),
+                    Ref("The Met — Timeline of Art History", "https://www.metmuseum.org/toah/"),
+                )),
+            ),
+        ),
+    }
+    return {key: (_mk_bullets(bullets), _join_ref_lines(*slices)) for key, (bullets, slices) in raw.items()}
+
+def _build_museum_index() -> List[tuple]:
+    """(normalized name, formatted ref line) pairs for the museum_archive substring picker."""
+    return [(_norm(r.name), _ref_line(r)) for r in _HUB_REFS["museums"]]
+
+# Rebuilt whenever reference_hubs change (see add_academic_ref).
+_ACADEMIC_PRESETS: Dict[str, tuple] = {}
+_PRESET_EMBEDS: Dict[str, _FrozenEmbed] = {}  # untitled; handlers call copy_with_title
+_MUSEUM_INDEX: List[tuple] = []
+
+def _rebuild_academic_presets() -> None:
+    _bind_hubs()
+    _ACADEMIC_PRESETS.clear()
+    _ACADEMIC_PRESETS.update(_build_academic_presets())
+    _PRESET_EMBEDS.clear()
+    _PRESET_EMBEDS.update((k, _embed_from_pre(None, *v)) for k, v in _ACADEMIC_PRESETS.items())
+    _MUSEUM_INDEX[:] = _build_museum_index()
+
+_rebuild_academic_presets()
+
 academic_group = app_commands.Group(name="academic", description="Academic-only knowledge hub (universities, museums, journals, official institutions).")
 
 @academic_group.command(name="concept_map", description="Show an academic concept map for a term (link-first).")
 @app_commands.describe(term="Concept/term, e.g., aesthetics, semiotics, narrative")
+@deferred_cmd
+@requires_module("academic")
 async def academic_concept_map(interaction: discord.Interaction, term: str):
-    if not ensure_academic_enabled(interaction):
-        await interaction.response.send_message("The **academic** module is disabled in this server.")
-        return
-
-    term_n = _norm(term)
-    refs = []
-    # Always include core hubs
-    refs += ACADEMIC_REG.get("reference_hubs", {}).get("philosophy", [])
-    refs += ACADEMIC_REG.get("reference_hubs", {}).get("museums", [])[:3]
-    bullets = [
-        "Definition (discipline-specific): philosophy, art history, media studies.",
-        "Key questions: meaning, representation, form, context, reception.",
-        "Typical methods: formal analysis, iconography, semiotics."
-    ]
-    e = _embed_from(f"Concept Map — {term}", bullets, refs)
-    await interaction.response.send_message(embed=e)
+    e = _PRESET_EMBEDS["concept_map"].copy_with_title(f"Concept Map — {term}")
+    await _reply(interaction, embed=e)
 
 @academic_group.command(name="timeline", description="Create an academic timeline starter (link-first).")
 @app_commands.describe(topic="Topic, e.g., video game history, impressionism")
+@deferred_cmd
+@requires_module("academic")
 async def academic_timeline(interaction: discord.Interaction, topic: str):
-    if not ensure_academic_enabled(interaction):
-        await interaction.response.send_message("The **academic** module is disabled in this server.")
-        return
-
-    refs = []
-    refs += ACADEMIC_REG.get("reference_hubs", {}).get("museums", [])[:2]
-    refs += ACADEMIC_REG.get("reference_hubs", {}).get("game_studies", [])[:2]
-    bullets = [
-        "Start with authoritative timelines (museum research portals).",
-        "Anchor dates with peer-reviewed discussions (journals).",
-        "Document primary sources (catalogues, collections, archives)."
-    ]
-    e = _embed_from(f"Academic Timeline — {topic}", bullets, refs)
-    await interaction.response.send_message(embed=e)
+    e = _PRESET_EMBEDS["timeline"].copy_with_title(f"Academic Timeline — {topic}")
+    await _reply(interaction, embed=e)
 
 @academic_group.command(name="institution_compare", description="Compare two academic institutions (link-first).")
 @app_commands.describe(a="Institution A (e.g., Oxford)", b="Institution B (e.g., Harvard)")
+@deferred_cmd
 async def academic_institution_compare(interaction: discord.Interaction, a: str, b: str):
-    bullets = [
-        "Compare: museums/collections, libraries, journals/press outputs, digital archives, open access.",
-        "Use official institutional pages for authoritative descriptions."
-    ]
-    refs = [
-        {"name":"Oxford University", "url":"https://www.ox.ac.uk/"},
-        {"name":"University of Cambridge", "url":"https://www.cam.ac.uk/"},
-        {"name":"Harvard University", "url":"https://www.harvard.edu/"},
-        {"name":"MIT", "url":"https://www.mit.edu/"},
-        {"name":"Sorbonne University", "url":"https://www.sorbonne-universite.fr/en"}
-    ]
-    e = _embed_from(f"Institution Compare — {a} vs {b}", bullets, refs)
-    await interaction.response.send_message(embed=e)
+    e = _PRESET_EMBEDS["institution_compare"].copy_with_title(f"Institution Compare — {a} vs {b}")
+    await _reply(interaction, embed=e)
 
 @academic_group.command(name="academic_sources", description="Where to read academically for a topic (link-first).")
 @app_commands.describe(topic="Topic, e.g., visual semiotics, game preservation")
+@deferred_cmd
+@requires_module("academic")
 async def academic_sources(interaction: discord.Interaction, topic: str):
-    if not ensure_academic_enabled(interaction):
-        await interaction.response.send_message("The **academic** module is disabled in this server.")
-        return
-
-    refs = []
-    refs += ACADEMIC_REG.get("reference_hubs", {}).get("philosophy", [])
-    refs += ACADEMIC_REG.get("reference_hubs", {}).get("museums", [])[:3]
-    refs += ACADEMIC_REG.get("reference_hubs", {}).get("game_studies", [])
-    refs += ACADEMIC_REG.get("reference_hubs", {}).get("art_tech", [])
-    bullets = [
-        "Start with encyclopedic peer-reviewed references for definitions and conceptual framing.",
-        "Use museum research portals for historical grounding and object-based scholarship.",
-        "Use peer-reviewed journals for debates, methods, and state-of-the-art research."
-    ]
-    e = _embed_from(f"Academic Sources — {topic}", bullets, refs)
-    await interaction.response.send_message(embed=e)
+    e = _PRESET_EMBEDS["sources"].copy_with_title(f"Academic Sources — {topic}")
+    await _reply(interaction, embed=e)
 
 @academic_group.command(name="museum_archive", description="Show academic museum archive entry points (link-first).")
 @app_commands.describe(museum="Museum name, e.g., British Museum, The Met, Tate, MoMA")
+@deferred_cmd
 async def academic_museum_archive(interaction: discord.Interaction, museum: str):
-    hubs = ACADEMIC_REG.get("reference_hubs", {}).get("museums", [])
     # best-effort pick by substring
     q = _norm(museum)
-    picked = [h for h in hubs if q and q in _norm(h.get("name",""))] or hubs[:4]
-    bullets = [
-        "Use the official online collection for object records and metadata.",
-        "Use the research/learning portal for essays, catalogues, and scholarly context."
-    ]
-    e = _embed_from(f"Museum Archive — {museum}", bullets, picked)
-    await interaction.response.send_message(embed=e)
+    picked = [line for name_n, line in _MUSEUM_INDEX if q in name_n] if q else []
+    title = f"Museum Archive — {museum}"
+    if picked:
+        e = _embed_from_pre(title, _ACADEMIC_PRESETS["museum_archive"][0], "\n".join(picked))
+    else:
+        e = _PRESET_EMBEDS["museum_archive"].copy_with_title(title)
+    await _reply(interaction, embed=e)
 
 @academic_group.command(name="reading_path", description="Build an academic reading path (beginner → advanced).")
 @app_commands.describe(topic="Topic, e.g., AI and art, impressionism, game studies")
+@deferred_cmd
 async def academic_reading_path(interaction: discord.Interaction, topic: str):
-    refs = []
-    refs += ACADEMIC_REG.get("reference_hubs", {}).get("philosophy", [])
-    refs += ACADEMIC_REG.get("reference_hubs", {}).get("museums", [])[:2]
-    refs += ACADEMIC_REG.get("reference_hubs", {}).get("art_tech", [])[:1]
-    refs += ACADEMIC_REG.get("reference_hubs", {}).get("game_studies", [])[:1]
-    bullets = [
-        "Beginner: peer-reviewed encyclopedia entries + museum terms/glossaries.",
-        "Intermediate: museum research essays + curated bibliographies.",
-        "Advanced: peer-reviewed journals and academic press monographs."
-    ]
-    e = _embed_from(f"Reading Path — {topic}", bullets, refs)
-    await interaction.response.send_message(embed=e)
+    e = _PRESET_EMBEDS["reading_path"].copy_with_title(f"Reading Path — {topic}")
+    await _reply(interaction, embed=e)
 
 @academic_group.command(name="glossary", description="Academic glossary entry points (link-first).")
 @app_commands.describe(field="Field, e.g., art history, contemporary art")
+@deferred_cmd
 async def academic_glossary(interaction: discord.Interaction, field: str):
-    refs = [{"name":"Tate — Art Terms", "url":"https://www.tate.org.uk/art/art-terms"}]
-    bullets = [
-        "Use institutional glossaries and museum term banks for controlled vocabulary.",
-        "Prefer peer-reviewed references for theoretical terms."
-    ]
-    refs += ACADEMIC_REG.get("reference_hubs", {}).get("philosophy", [])
-    e = _embed_from(f"Academic Glossary — {field}", bullets, refs)
-    await interaction.response.send_message(embed=e)
+    e = _PRESET_EMBEDS["glossary"].copy_with_title(f"Academic Glossary — {field}")
+    await _reply(interaction, embed=e)
+
+_CITATION_BULLETS = (
+    "This helper does not fetch metadata automatically (no scraping).",
+    "Use the templates below and fill in: author/organization, year, title, site/publisher, URL, access date.",
+)
+_CITATION_TEMPLATES = types.MappingProxyType({
+    "apa": "Organization/Author. (Year, Month Day). Title of page. Site Name. URL (Accessed YYYY-MM-DD).",
+    "chicago": "Organization/Author. \"Title of Page.\" Site Name. Last modified/Accessed Month Day, Year. URL.",
+    "mla": "Organization/Author. \"Title of Page.\" Site Name, Publisher (if any), Date, URL. Accessed Day Month Year.",
+})
 
 @academic_group.command(name="citation_helper", description="Citation helper (APA/Chicago/MLA templates; metadata-only).")
 @app_commands.describe(url="Official URL of the source you want to cite", style="apa|chicago|mla")
+@deferred_cmd
 async def academic_citation_helper(interaction: discord.Interaction, url: str, style: str = "apa"):
-    style_n = _norm(style)
-    bullets = [
-        "This helper does not fetch metadata automatically (no scraping).",
-        "Use the templates below and fill in: author/organization, year, title, site/publisher, URL, access date."
-    ]
-    templates = {
-        "apa": "Organization/Author. (Year, Month Day). Title of page. Site Name. URL (Accessed YYYY-MM-DD).",
-        "chicago": "Organization/Author. \"Title of Page.\" Site Name. Last modified/Accessed Month Day, Year. URL.",
-        "mla": "Organization/Author. \"Title of Page.\" Site Name, Publisher (if any), Date, URL. Accessed Day Month Year."
-    }
-    t = templates.get(style_n, templates["apa"])
-    e = _embed_from(f"Citation Helper — {style.upper()}", bullets, [{"name":"Source URL", "url": url}])
+    t = _CITATION_TEMPLATES.get(_norm(style), _CITATION_TEMPLATES["apa"])
+    e = _embed_from(f"Citation Helper — {style.upper()}", _CITATION_BULLETS, [{"name":"Source URL", "url": url}])
     e.add_field(name="Template", value=t, inline=False)
-    await interaction.response.send_message(embed=e)
+    await _reply(interaction, embed=e)
 
 @academic_group.command(name="open_access", description="Open-access academic entry points (link-first).")
 @app_commands.describe(topic="Topic, e.g., game studies")
+@deferred_cmd
 async def academic_open_access(interaction: discord.Interaction, topic: str):
-    key = "game_studies"
-    refs = ACADEMIC_REG.get("reference_hubs", {}).get("game_studies", [])
-    bullets = ["Open-access peer-reviewed journals and institutional resources."]
-    e = _embed_from(f"Open Access — {topic}", bullets, refs)
-    await interaction.response.send_message(embed=e)
+    e = _PRESET_EMBEDS["open_access"].copy_with_title(f"Open Access — {topic}")
+    await _reply(interaction, embed=e)
 
 @academic_group.command(name="academic_ethics", description="Academic ethics and usage notes (institutional guidance).")
 @app_commands.describe(topic="Topic, e.g., using museum images, citation, fair use")
+@deferred_cmd
 async def academic_ethics(interaction: discord.Interaction, topic: str):
-    bullets = [
-        "Use official rights and permissions pages for images and reproductions.",
-        "Cite sources consistently; keep access dates for web resources.",
-        "Do not redistribute paywalled content; link to official entries."
-    ]
-    refs = [
-        {"name":"The Met — Terms and Conditions", "url":"https://www.metmuseum.org/information/terms-and-conditions"},
-        {"name":"Tate — Terms of Use", "url":"https://www.tate.org.uk/about-us/policies-and-procedures/website-terms-use"},
-    ]
-    e = _embed_from(f"Academic Ethics — {topic}", bullets, refs)
-    await interaction.response.send_message(embed=e)
+    e = _PRESET_EMBEDS["ethics"].copy_with_title(f"Academic Ethics — {topic}")
+    await _reply(interaction, embed=e)
 
 # -------- New advanced set (all applied, link-first) --------
 
 @academic_group.command(name="methodology_guide", description="Methodology guide for a topic (academic-only, link-first).")
 @app_commands.describe(topic="e.g., visual analysis")
+@deferred_cmd
+@requires_module("academic")
 async def methodology_guide(interaction: discord.Interaction, topic: str):
-    if not ensure_academic_enabled(interaction):
-        await interaction.response.send_message("The **academic** module is disabled in this server.")
-        return
-
-    mapping = ACADEMIC_REG.get("modules", {}).get("methodology_guide", {})
+    mapping = _METHODOLOGY_GUIDES
     k = _closest_key(mapping, topic)
     obj = mapping.get(k) or {}
     e = _embed_from(obj.get("title", f"Methodology Guide — {topic}"), obj.get("bullets", []), obj.get("refs", []))
-    await interaction.response.send_message(embed=e)
+    await _reply(interaction, embed=e)
 
 @academic_group.command(name="discipline_bridge", description="Bridge a term across disciplines (academic-only).")
 @app_commands.describe(term="e.g., narrative, aesthetics")
+@deferred_cmd
 async def discipline_bridge(interaction: discord.Interaction, term: str):
-    refs = []
-    refs += ACADEMIC_REG.get("reference_hubs", {}).get("philosophy", [])
-    refs += ACADEMIC_REG.get("reference_hubs", {}).get("museums", [])[:2]
-    refs += ACADEMIC_REG.get("reference_hubs", {}).get("game_studies", [])[:2]
-    bullets = [
-        "Philosophy: conceptual definitions and arguments.",
-        "Art history/visual culture: form, context, reception.",
-        "Game studies/media: systems, representation, interaction."
-    ]
-    e = _embed_from(f"Discipline Bridge — {term}", bullets, refs)
-    await interaction.response.send_message(embed=e)
+    e = _PRESET_EMBEDS["discipline_bridge"].copy_with_title(f"Discipline Bridge — {term}")
+    await _reply(interaction, embed=e)
 
 @academic_group.command(name="canonical_texts", description="Canonical texts starter list (academic presses/journals).")
 @app_commands.describe(field="e.g., game studies, art history")
+@deferred_cmd
 async def canonical_texts(interaction: discord.Interaction, field: str):
-    bullets = [
-        "Use academic press catalogues and peer-reviewed journals to identify canonical texts.",
-        "Prefer university presses (OUP, Cambridge UP, MIT Press) and established journals."
-    ]
-    refs = [
-        {"name":"Oxford University Press", "url":"https://global.oup.com/academic/"},
-        {"name":"Cambridge University Press", "url":"https://www.cambridge.org/"},
-        {"name":"MIT Press", "url":"https://mitpress.mit.edu/"},
-        {"name":"Game Studies (OA)", "url":"https://gamestudies.org/"},
-        {"name":"ToDIGRA (OA)", "url":"https://todigra.org/"}
-    ]
-    e = _embed_from(f"Canonical Texts — {field}", bullets, refs)
-    await interaction.response.send_message(embed=e)
+    e = _PRESET_EMBEDS["canonical_texts"].copy_with_title(f"Canonical Texts — {field}")
+    await _reply(interaction, embed=e)
 
 @academic_group.command(name="primary_secondary", description="Explain primary vs secondary sources for a topic.")
 @app_commands.describe(topic="e.g., renaissance painting")
+@deferred_cmd
 async def primary_secondary(interaction: discord.Interaction, topic: str):
-    bullets = [
-        "Primary sources: original artifacts/objects, contemporary documents, archival records, catalogs.",
-        "Secondary sources: scholarly analyses (peer-reviewed articles, monographs), curated timelines and essays.",
-        "Use museum collections as primary-source gateways; journals/presses for secondary interpretation."
-    ]
-    refs = [
-        {"name":"British Museum — Collection", "url":"https://www.britishmuseum.org/collection"},
-        {"name":"The Met — Timeline of Art History", "url":"https://www.metmuseum.org/toah/"},
-        {"name":"Game Studies (OA)", "url":"https://gamestudies.org/"}
-    ]
-    e = _embed_from(f"Primary vs Secondary — {topic}", bullets, refs)
-    await interaction.response.send_message(embed=e)
+    e = _PRESET_EMBEDS["primary_secondary"].copy_with_title(f"Primary vs Secondary — {topic}")
+    await _reply(interaction, embed=e)
 
 @academic_group.command(name="academic_debate", description="Show an academic debate overview (link-first).")
 @app_commands.describe(topic="e.g., ludology vs narratology")
+@deferred_cmd
 async def academic_debate(interaction: discord.Interaction, topic: str):
-    mapping = ACADEMIC_REG.get("modules", {}).get("academic_debate", {})
+    mapping = _ACADEMIC_DEBATES
     k = _closest_key(mapping, topic)
     obj = mapping.get(k) or {}
     e = _embed_from(obj.get("title", f"Academic Debate — {topic}"), obj.get("bullets", []), obj.get("refs", []))
-    await interaction.response.send_message(embed=e)
+    await _reply(interaction, embed=e)
 
 @academic_group.command(name="theory_origin", description="Theory origin starter (academic-only, link-first).")
 @app_commands.describe(theory="e.g., semiotics")
+@deferred_cmd
 async def theory_origin(interaction: discord.Interaction, theory: str):
-    mapping = ACADEMIC_REG.get("modules", {}).get("theory_origin", {})
+    mapping = _THEORY_ORIGINS
     k = _closest_key(mapping, theory)
     obj = mapping.get(k) or {}
     e = _embed_from(obj.get("title", f"Theory Origin — {theory}"), obj.get("bullets", []), obj.get("refs", []))
-    await interaction.response.send_message(embed=e)
+    await _reply(interaction, embed=e)
 
 @academic_group.command(name="research_gap", description="Suggest research gap directions (academic framing; link-first).")
 @app_commands.describe(field="e.g., game preservation")
+@deferred_cmd
 async def research_gap(interaction: discord.Interaction, field: str):
-    bullets = [
-        "Identify gaps by reading recent peer-reviewed discussions and institutional reports.",
-        "Look for under-studied regions, media forms, archives, or methodological blind spots.",
-        "Define a narrow research question and map primary/secondary sources."
-    ]
-    refs = [
-        {"name":"ToDIGRA (OA)", "url":"https://todigra.org/"},
-        {"name":"Game Studies (OA)", "url":"https://gamestudies.org/"},
-        {"name":"Video Game History Foundation", "url":"https://gamehistory.org/"}
-    ]
-    e = _embed_from(f"Research Gap — {field}", bullets, refs)
-    await interaction.response.send_message(embed=e)
+    e = _PRESET_EMBEDS["research_gap"].copy_with_title(f"Research Gap — {field}")
+    await _reply(interaction, embed=e)
 
 @academic_group.command(name="academic_vocabulary", description="Academic vocabulary entry points (institutional glossaries).")
 @app_commands.describe(field="e.g., art history")
+@deferred_cmd
 async def academic_vocabulary(interaction: discord.Interaction, field: str):
-    bullets = [
-        "Use museum term banks and peer-reviewed references for controlled vocabulary.",
-        "Prefer institutional glossaries over informal sources."
-    ]
-    refs = [
-        {"name":"Tate — Art Terms", "url":"https://www.tate.org.uk/art/art-terms"},
-        {"name":"The Met — Timeline of Art History", "url":"https://www.metmuseum.org/toah/"}
-    ]
-    e = _embed_from(f"Academic Vocabulary — {field}", bullets, refs)
-    await interaction.response.send_message(embed=e)
+    e = _PRESET_EMBEDS["vocabulary"].copy_with_title(f"Academic Vocabulary — {field}")
+    await _reply(interaction, embed=e)
 
 @academic_group.command(name="digital_archive_map", description="Academic digital archive map (institutional links).")
 @app_commands.describe(field="e.g., video games")
+@deferred_cmd
 async def digital_archive_map(interaction: discord.Interaction, field: str):
-    mapping = ACADEMIC_REG.get("modules", {}).get("digital_archive_map", {})
+    mapping = _DIGITAL_ARCHIVE_MAPS
     k = _closest_key(mapping, field)
     obj = mapping.get(k) or {}
     e = _embed_from(obj.get("title", f"Digital Archive Map — {field}"), obj.get("bullets", []), obj.get("refs", []))
-    await interaction.response.send_message(embed=e)
+    await _reply(interaction, embed=e)
 
 @academic_group.command(name="academic_skill", description="Academic skill mini-guide (with institutional references).")
 @app_commands.describe(skill="e.g., visual analysis writing")
+@deferred_cmd
 async def academic_skill(interaction: discord.Interaction, skill: str):
-    bullets = [
-        "Start with a clear research question and define key terms (use peer-reviewed references).",
-        "Use primary sources (collections/archives) for evidence; then interpret with secondary literature.",
-        "Document citations and keep a consistent reference style."
-    ]
-    refs = [
-        {"name":"Stanford Encyclopedia of Philosophy", "url":"https://plato.stanford.edu/"},
-        {"name":"The Met — Timeline of Art History", "url":"https://www.metmuseum.org/toah/"}
-    ]
-    e = _embed_from(f"Academic Skill — {skill}", bullets, refs)
-    await interaction.response.send_message(embed=e)
+    e = _PRESET_EMBEDS["skill"].copy_with_title(f"Academic Skill — {skill}")
+    await _reply(interaction, embed=e)
 
 bot.tree.add_command(academic_group)
 
+# Pre-joined field values for /fashion, keyed by upper-cased country code.
+_FASHION_BY_CC: Dict[str, str] = {}
+_FASHION_ALL_VALUE = ""
+_FASHION_JOURNALS_VALUE = ""
+
+def _rebuild_fashion_index() -> None:
+    global _FASHION_ALL_VALUE, _FASHION_JOURNALS_VALUE
+    free = FASHION_REG.get("free_academic_fashion_sources", [])
+    by_cc: Dict[str, list] = {}
+    for s in free:
+        by_cc.setdefault(s.get("country","").upper(), []).append(s)
+    _FASHION_BY_CC.clear()
+    _FASHION_BY_CC.update({
+        cc: "\n".join(f"• {s.get('name')}: {s.get('url')}" for s in items[:12])
+        for cc, items in by_cc.items()
+    })
+    _FASHION_ALL_VALUE = "\n".join(f"• {s.get('name')}: {s.get('url')}" for s in free[:12])
+    journals = FASHION_REG.get("prestige_fashion_academic_journals_official", [])
+    _FASHION_JOURNALS_VALUE = "\n".join(f"• {j.get('name')}: {j.get('url')}" for j in journals[:8])
+
+_rebuild_fashion_index()
+
 @bot.tree.command(name="fashion", description="Academic-only fashion resources (free institutional links).")
 @app_commands.describe(country="Optional 2-letter country code filter (e.g., BE, UK, JP, SE, US, TR, FR)")
+@deferred_cmd
+@requires_module("fashion")
 async def fashion_cmd(interaction: discord.Interaction, country: str = ""):
-    if not module_enabled(interaction, "fashion"):
-        await interaction.response.send_message("The **fashion** module is disabled in this server.")
-        return
     cc = (country or "").strip().upper()
-    embed = discord.Embed(title="Fashion — Academic Resources (Free Links)")
-    embed.description = "Curated institutional and peer-reviewed entry points. Academic links only."
-    free = FASHION_REG.get("free_academic_fashion_sources", [])
-    if cc:
-        free = [s for s in free if (s.get("country","").upper() == cc)]
-    if free:
+    embed = discord.Embed(title="Fashion — Academic Resources (Free Links)", description="Curated institutional and peer-reviewed entry points. Academic links only.")
+    free_value = _FASHION_BY_CC.get(cc, "") if cc else _FASHION_ALL_VALUE
+    if free_value:
         embed.add_field(
             name=("Free institutional sources" + (f" — {cc}" if cc else "")),
-            value="\n".join(f"• {s.get('name')}: {s.get('url')}" for s in free[:12]),
+            value=free_value,
             inline=False)
     else:
         embed.add_field(
             name="No matches",
             value="No sources found for that country code in the local registry. Try without a filter.",
             inline=False)
-    journals = FASHION_REG.get("prestige_fashion_academic_journals_official", [])
-    if journals and not cc:
+    if _FASHION_JOURNALS_VALUE and not cc:
         embed.add_field(
             name="Peer-reviewed journals (official pages)",
-            value="\n".join(f"• {j.get('name')}: {j.get('url')}" for j in journals[:8]),
+            value=_FASHION_JOURNALS_VALUE,
             inline=False)
     note = FASHION_REG.get("note")
     if note:
         embed.set_footer(text=note)
-    await interaction.response.send_message(embed=embed)
+    await _reply(interaction, embed=embed)
 
 
 # -------------------------
@@ -1218,7 +1614,7 @@ async def settings_enable(interaction: discord.Interaction, module: str):
     if not interaction.user.guild_permissions.manage_guild:
         await interaction.response.send_message("You need 'Manage Server' permission.")
         return
-    db_set_module(interaction.guild_id, module, True)
+    await asyncio.to_thread(db_set_module, interaction.guild_id, module, True)
     await interaction.response.send_message(f"Enabled module: **{module}**")
 
 @settings_group.command(name="disable", description="Disable a module in this server (admin).")
@@ -1230,7 +1626,7 @@ async def settings_disable(interaction: discord.Interaction, module: str):
     if not interaction.user.guild_permissions.manage_guild:
         await interaction.response.send_message("You need 'Manage Server' permission.")
         return
-    db_set_module(interaction.guild_id, module, False)
+    await asyncio.to_thread(db_set_module, interaction.guild_id, module, False)
     await interaction.response.send_message(f"Disabled module: **{module}**")
 
 @settings_group.command(name="status", description="Show module status for this server.")
@@ -1238,14 +1634,13 @@ async def settings_status(interaction: discord.Interaction):
     if interaction.guild is None:
         await interaction.response.send_message("This must be used in a server.")
         return
-    modules = ["academic", "fashion", "trivia", "dictionaries", "weather"]
+    modules = _MODULES
+    values = await asyncio.to_thread(lambda: [db_get_module(interaction.guild_id, m) for m in modules])
     lines = []
-    for m in modules:
-        v = db_get_module(interaction.guild_id, m)
+    for m, v in zip(modules, values):
         status = "enabled (default)" if v is None else ("enabled" if v else "disabled")
         lines.append(f"• {m}: {status}")
-    embed = discord.Embed(title="Module status")
-    embed.description = "\n".join(lines)
+    embed = discord.Embed(title="Module status", description="\n".join(lines))
     await interaction.response.send_message(embed=embed)
 
 bot.tree.add_command(settings_group)
@@ -1257,8 +1652,7 @@ governance_group = app_commands.Group(name="governance", description="Quality &
 
 @governance_group.command(name="status", description="Show governance validation status for registries.")
 async def governance_status(interaction: discord.Interaction):
-    embed = discord.Embed(title="Governance status")
-    embed.description = governance_summary_text()
+    embed = discord.Embed(title="Governance status", description=governance_summary_text())
     await interaction.response.send_message(embed=embed)
 
 @governance_group.command(name="report", description="Show a short governance violation report.")
@@ -1284,8 +1678,8 @@ async def governance_report(interaction: discord.Interaction):
 async def governance_validate(interaction: discord.Interaction):
     global GOV_REPORT
     GOV_REPORT = None  # computed in on_ready()
-    embed = discord.Embed(title="Validation complete")
-    embed.description = governance_summary_text()
+    _rebuild_allow_sets()  # pick up allowlist edits before the next validation
+    embed = discord.Embed(title="Validation complete", description=governance_summary_text())
     await interaction.response.send_message(embed=embed)
 
 bot.tree.add_command(governance_group)
@@ -1298,18 +1692,14 @@ registry_group = app_commands.Group(name="registry", description="Admin: update
 def _is_admin(interaction: discord.Interaction) -> bool:
     return interaction.guild is not None and interaction.user.guild_permissions.manage_guild
 
-
-    def _validate_academic_url(url: str, kind: str) -> bool:
-        kind_n = (kind or "").strip().lower()
-        pub_domains = (GOV_REG or {}).get("allowlists", {}).get("publishers", {}).get("domains", [])
-        inst_domains = (GOV_REG or {}).get("allowlists", {}).get("academic_institutional", {}).get("domains", [])
-        if kind_n in ("publisher", "journal_platform", "press"):
-            return _allowed(url, pub_domains)
-        return _allowed(url, inst_domains)
+def _validate_academic_url(url: str, kind: str) -> bool:
+    kind_n = (kind or "").strip().lower()
+    if kind_n in _PUB_TYPES:
+        return _allowed_domain("publishers", url)
+    return _allowed_domain("academic_institutional", url)
 
 def _validate_url_for_section(url: str, section: str) -> bool:
-    domains = (GOV_REG or {}).get("allowlists", {}).get(section, {}).get("domains", [])
-    return _allowed(url, domains)
+    return _allowed_domain(section, url)
 
 @registry_group.command(name="add_fashion_source", description="Admin: add an institutional fashion source (validated).")
 @app_commands.describe(name="Display name", url="Official URL", country="2-letter code (e.g., BE, UK, JP, SE, US, TR, FR)", notes="Optional notes")
@@ -1327,9 +1717,10 @@ async def add_fashion_source(interaction: discord.Interaction, name: str, url: s
         "country": country.strip().upper(),
         "notes": notes.strip()
     }
-    FASHION_REG.setdefault("free_academic_fashion_sources", []).append(obj)
+    _apply_fashion_add(obj)
     FASHION_REG["generated_utc"] = datetime.utcnow().replace(microsecond=0).isoformat()+"Z"
-    save_json(FASHION_PATH, FASHION_REG)
+    append_jsonl(FASHION_LOG_PATH, obj)
+    _rebuild_fashion_index()
     await interaction.response.send_message(f"Added fashion source: **{obj['name']}** ({obj['country']})")
 
 @registry_group.command(name="add_academic_ref", description="Admin: add an academic reference hub entry (validated).")
@@ -1342,13 +1733,18 @@ async def add_academic_ref(interaction: discord.Interaction, group: str, name: s
             await interaction.response.send_message("URL domain is not allowed for the selected kind (institutional vs publisher).")
             return
     g = group.strip()
-    ACADEMIC_REG.setdefault("reference_hubs", {}).setdefault(g, []).append({
+    rec = {
+        "group": g,
+        "item": {
             "name": name.strip(),
             "url": url.strip(),
             "type": (kind.strip().lower() or "reference_hub")
-        })
+        },
+    }
+    _apply_academic_add(rec)
     ACADEMIC_REG["generated_utc"] = datetime.utcnow().replace(microsecond=0).isoformat()+"Z"
-    save_json(ACADEMIC_PATH, ACADEMIC_REG)
+    append_jsonl(ACADEMIC_LOG_PATH, rec)
+    _rebuild_academic_presets()
     await interaction.response.send_message(f"Added academic hub item to **{g}**: {name.strip()}")
 
 @registry_group.command(name="validate", description="Admin: re-run governance validation after registry updates.")
@@ -1358,6 +1754,7 @@ async def registry_validate(interaction: discord.Interaction):
         return
     global GOV_REPORT
     GOV_REPORT = None  # computed in on_ready()
+    _rebuild_allow_sets()  # pick up allowlist edits before the next validation
     await interaction.response.send_message(governance_summary_text())
 
 bot.tree.add_command(registry_group)
@@ -1367,122 +1764,138 @@ bot.tree.add_command(registry_group)
 # -------------------------
 # Governance / Quality
 # -------------------------
+@functools.lru_cache(maxsize=8192)
 def _domain(url: str) -> str:
+    # Registries repeat the same hosts many times; memoize the parse.
     try:
-        from urllib.parse import urlparse, quote_plus
-        host = urlparse(url).netloc.lower()
-        host = host.split(":")[0]
-        return host
-    except Exception:
+        return urlparse(url).netloc.lower().split(":", 1)[0]
+    except ValueError:  # e.g. malformed IPv6 netloc
         return ""
 
-def _allowed(url: str, allowed_domains: list) -> bool:
-    host = _domain(url)
+# section -> frozenset of allowlisted domains; rebuilt whenever GOV_REG changes.
+_ALLOW_SETS: Dict[str, frozenset] = {}
+# section -> (".domain", ...) for subdomain checks via str.endswith.
+_ALLOW_SUFFIXES: Dict[str, tuple] = {}
+
+def _rebuild_allow_sets() -> None:
+    global _FREEGAMES_BUTTON_CACHE
+    _FREEGAMES_BUTTON_CACHE = None
+    _ALLOW_SETS.clear()
+    _ALLOW_SUFFIXES.clear()
+    for section, cfg in ((GOV_REG or {}).get("allowlists", {}) or {}).items():
+        _ALLOW_SETS[section] = frozenset(
+            d.lower().strip() for d in ((cfg or {}).get("domains", []) or []) if d and d.strip()
+        )
+        _ALLOW_SUFFIXES[section] = tuple("." + d for d in _ALLOW_SETS[section])
+
+def _allowed_fast(host: str, section: str) -> bool:
+    """True if host is an allowlisted domain of `section` or a subdomain of one."""
     if not host:
         return False
-    for d in allowed_domains:
-        d = d.lower().strip()
-        if host == d or host.endswith("." + d):
-            return True
-    return False
+    return host in _ALLOW_SETS.get(section, ()) or host.endswith(_ALLOW_SUFFIXES.get(section, ()))
 
-def validate_registry_links() -> dict:
-    """Validate registry JSON files against domain allowlists and required references.
-    Returns a report dict with violations.
-    """
-    report = {
-        "generated_utc": datetime.utcnow().replace(microsecond=0).isoformat()+"Z",
-        "violations": [],
-        "counts": {"checked_urls": 0, "violations": 0},
-    }
-    rules = (GOV_REG or {}).get("rules", {})
-    allow = (GOV_REG or {}).get("allowlists", {})
+def _allowed_domain(section: str, url: str) -> bool:
+    return _allowed_fast(_domain(url), section)
 
-    def add_violation(module: str, where: str, url: str, reason: str):
-        report["violations"].append({"module": module, "where": where, "url": url, "reason": reason})
-        report["counts"]["violations"] += 1
+# Reference types validated against the publishers allowlist (others: academic_institutional).
+_PUB_TYPES = frozenset(("publisher", "journal_platform", "press"))
 
-    # --- dictionaries ---
-    dic_allow = allow.get("dictionaries", {}).get("domains", [])
-    try:
-        for d in DICT_REG.get("dictionaries", []):
-            url = d.get("official_url")
-            if url:
-                report["counts"]["checked_urls"] += 1
-                if dic_allow and not _allowed(url, dic_allow):
-                    add_violation("dictionaries", d.get("name","unknown"), url, "Domain not in allowlist")
-    except Exception as e:
-        add_violation("dictionaries", "registry", "", f"Registry parse error: {e}")
+_rebuild_allow_sets()
 
-    # --- weather ---
-    w_allow = allow.get("weather", {}).get("domains", [])
-    try:
-        for hub in METEO_REG.get("global_official_hubs", []):
-            url = hub.get("official_url")
-            if url:
-                report["counts"]["checked_urls"] += 1
-                if w_allow and not _allowed(url, w_allow):
-                    add_violation("weather", hub.get("name","hub"), url, "Domain not in allowlist")
-        for cc, svc in METEO_REG.get("services_by_country", {}).items():
-            url = svc.get("official_url")
-            if url:
-                report["counts"]["checked_urls"] += 1
-                if w_allow and not _allowed(url, w_allow):
-                    add_violation("weather", f"{cc}:{svc.get('service_name','service')}", url, "Domain not in allowlist")
-    except Exception as e:
-        add_violation("weather", "registry", "", f"Registry parse error: {e}")
+# Each source yields (module, where, url, allowlist section) for every URL it holds.
+def _iter_dictionary_urls():
+    for d in DICT_REG.get("dictionaries", []):
+        url = d.get("official_url")
+        if url:
+            yield ("dictionaries", d.get("name","unknown"), url, "dictionaries")
 
-    # --- fashion ---
-    f_allow = allow.get("fashion", {}).get("domains", [])
-    try:
-        for s in FASHION_REG.get("free_academic_fashion_sources", []):
-            url = s.get("url")
-            if url:
-                report["counts"]["checked_urls"] += 1
-                if f_allow and not _allowed(url, f_allow):
-                    add_violation("fashion", s.get("name","source"), url, "Domain not in allowlist")
-        for j in FASHION_REG.get("prestige_fashion_academic_journals_official", []):
-            url = j.get("url")
-            if url:
-                report["counts"]["checked_urls"] += 1
-                if f_allow and not _allowed(url, f_allow):
-                    add_violation("fashion", j.get("name","journal"), url, "Domain not in allowlist")
-    except Exception as e:
-        add_violation("fashion", "registry", "", f"Registry parse error: {e}")
+def _iter_weather_urls():
+    for hub in METEO_REG.get("global_official_hubs", []):
+        url = hub.get("official_url")
+        if url:
+            yield ("weather", hub.get("name","hub"), url, "weather")
+    for cc, svc in METEO_REG.get("services_by_country", {}).items():
+        url = svc.get("official_url")
+        if url:
+            yield ("weather", f"{cc}:{svc.get('service_name','service')}", url, "weather")
 
-    # --- academic ---
-    a_inst = allow.get("academic_institutional", {}).get("domains", [])
-    a_pub = allow.get("publishers", {}).get("domains", [])
-    try:
-        for group, items in (ACADEMIC_REG.get("reference_hubs", {}) or {}).items():
-            for it in items:
-                url = it.get("url")
+def _iter_fashion_urls():
+    for s in FASHION_REG.get("free_academic_fashion_sources", []):
+        url = s.get("url")
+        if url:
+            yield ("fashion", s.get("name","source"), url, "fashion")
+    for j in FASHION_REG.get("prestige_fashion_academic_journals_official", []):
+        url = j.get("url")
+        if url:
+            yield ("fashion", j.get("name","journal"), url, "fashion")
+
+def _academic_section(ref: dict) -> str:
+    return "publishers" if (ref.get("type") or "").lower() in _PUB_TYPES else "academic_institutional"
+
+def _iter_academic_urls():
+    for group, items in _HUBS.items():
+        for it in items:
+            url = it.get("url")
+            if url:
+                yield ("academic", f"hub:{group}:{it.get('name','item')}", url, _academic_section(it))
+    for mod, mapping in _ACADEMIC_MODULES.items():
+        for key, obj in (mapping or {}).items():
+            for r in obj.get("refs", []):
+                url = r.get("url")
                 if url:
-                    report["counts"]["checked_urls"] += 1
-                    ref_type = (it.get("type") or "").lower()
-                    use_pub = ref_type in ("publisher","journal_platform","press")
-                    domains = a_pub if use_pub else a_inst
-                    if domains and not _allowed(url, domains):
-                        add_violation("academic", f"hub:{group}:{it.get('name','item')}", url, "Domain not in allowlist")
-        for mod, mapping in (ACADEMIC_REG.get("modules", {}) or {}).items():
-            for key, obj in (mapping or {}).items():
-                refs = obj.get("refs", [])
-                if rules.get("require_reference_field", True):
-                    if not refs:
-                        add_violation("academic", f"module:{mod}:{key}", "", "Missing refs[]")
-                for r in refs:
-                    url = r.get("url")
-                    if url:
-                        report["counts"]["checked_urls"] += 1
-                        ref_type = (it.get("type") or "").lower()
-                    use_pub = ref_type in ("publisher","journal_platform","press")
-                    domains = a_pub if use_pub else a_inst
-                    if domains and not _allowed(url, domains):
-                            add_violation("academic", f"module:{mod}:{key}:{r.get('name','ref')}", url, "Domain not in allowlist")
-    except Exception as e:
-        add_violation("academic", "registry", "", f"Registry parse error: {e}")
+                    yield ("academic", f"module:{mod}:{key}:{r.get('name','ref')}", url, _academic_section(r))
+
+_REGISTRY_URL_SOURCES = (
+    ("dictionaries", _iter_dictionary_urls),
+    ("weather", _iter_weather_urls),
+    ("fashion", _iter_fashion_urls),
+    ("academic", _iter_academic_urls),
+)
+
+def validate_registry_links() -> dict:
+    """Validate registry JSON files against domain allowlists and required references.
+    Returns a report dict with violations.
+    """
+    rules = (GOV_REG or {}).get("rules", {})
+    rows: List[tuple] = []
+    errors: List[dict] = []
+    for module, source in _REGISTRY_URL_SOURCES:
+        try:
+            rows.extend(source())
+        except Exception as e:
+            errors.append({"module": module, "where": "registry", "url": "", "reason": f"Registry parse error: {e}"})
+
+    # Registries repeat the same URLs across hubs/modules: decide each (url, section) once per run.
+    seen: Dict[tuple, bool] = {}
+
+    def url_ok(url: str, section: str) -> bool:
+        key = (url, section)
+        ok = seen.get(key)
+        if ok is None:
+            allowed = _ALLOW_SETS.get(section)
+            # Sections with an empty allowlist are not enforced.
+            ok = seen[key] = not allowed or _allowed_fast(_domain(url), section)
+        return ok
+
+    violations = [
+        {"module": m, "where": w, "url": u, "reason": "Domain not in allowlist"}
+        for m, w, u, sec in rows
+        if not url_ok(u, sec)
+    ]
+    if rules.get("require_reference_field", True):
+        violations.extend(
+            {"module": "academic", "where": f"module:{mod}:{key}", "url": "", "reason": "Missing refs[]"}
+            for mod, mapping in _ACADEMIC_MODULES.items()
+            for key, obj in (mapping or {}).items()
+            if not obj.get("refs")
+        )
+    violations.extend(errors)
 
-    return report
+    return {
+        "generated_utc": datetime.utcnow().replace(microsecond=0).isoformat()+"Z",
+        "violations": violations,
+        "counts": {"checked_urls": len(rows), "violations": len(violations)},
+    }
 
 GOV_REPORT = None  # computed in on_ready()
 
@@ -1501,26 +1914,67 @@ MIT_TESLA_ALPHA_URL = "https://web.mit.edu/most/Public/Tesla1/alpha_tesla.html"
 TESLA_MIT_IMAGE_CACHE_PATH = os.path.join(DATA_DIR, "tesla_mit_image_cache.json")
 TESLA_MIT_IMAGE_CACHE = load_json(TESLA_MIT_IMAGE_CACHE_PATH) if os.path.exists(TESLA_MIT_IMAGE_CACHE_PATH) else {}
 
+_PAT_TRANS = str.maketrans("", "", " ,")
+
+@functools.lru_cache(maxsize=1024)
 def _norm_patno(patent_number: str) -> str:
-    return (patent_number or "").strip().replace(",", "").replace(" ", "")
+    return (patent_number or "").strip().translate(_PAT_TRANS)
+
+_IMG_EXTS = (".png", ".jpg", ".jpeg", ".gif", ".webp", ".svg")
+
+# lxml (C parser, in requirements.txt) when available; stdlib parser otherwise.
+_BS_PARSER = "lxml" if importlib.util.find_spec("lxml") else "html.parser"
 
 def _is_image_url(u: str) -> bool:
-    u = (u or "").lower()
-    return any(u.endswith(ext) for ext in (".png", ".jpg", ".jpeg", ".gif", ".webp", ".svg"))
+    return (u or "").lower().endswith(_IMG_EXTS)
+
+_TAG_RE = re.compile(r"<[^>]+>")
+_TR_RE = re.compile(r"<tr\b.*?</tr>", re.I | re.S)
+# Whitespace-delimited numeric tokens, commas allowed ("334,823").
+_NUM_TOKEN_RE = re.compile(r"(?<!\S)[\d,]*\d[\d,]*(?!\S)")
+
+def _build_mit_alpha_index(html: str) -> Dict[str, List[str]]:
+    """patent number -> candidate link URLs from its alpha-table row (first row wins)."""
+    index: Dict[str, List[str]] = {}
+    for m in _TR_RE.finditer(html):
+        row = m.group(0)
+        tokens = [t.replace(",", "") for t in _NUM_TOKEN_RE.findall(_TAG_RE.sub(" ", row))]
+        if not tokens:
+            continue
+        links = [urljoin(MIT_TESLA_ALPHA_URL, href.strip()) for href, _ in iter_links(row)]
+        for t in tokens:
+            index.setdefault(t, links)
+    return index
+
+# The alpha table is effectively static: fetch and index it at most once a day.
+_MIT_ALPHA_INDEX: Optional[Dict[str, List[str]]] = None
+_MIT_ALPHA_TS = 0.0
+_MIT_ALPHA_TTL = 24 * 3600
+_MIT_ALPHA_LOCK = asyncio.Lock()
+
+async def _get_mit_alpha_index() -> Optional[Dict[str, List[str]]]:
+    global _MIT_ALPHA_INDEX, _MIT_ALPHA_TS
+    if _MIT_ALPHA_INDEX is not None and time.monotonic() - _MIT_ALPHA_TS < _MIT_ALPHA_TTL:
+        return _MIT_ALPHA_INDEX
+    async with _MIT_ALPHA_LOCK:
+        if _MIT_ALPHA_INDEX is not None and time.monotonic() - _MIT_ALPHA_TS < _MIT_ALPHA_TTL:
+            return _MIT_ALPHA_INDEX
+        try:
+            html = await _fetch_text(MIT_TESLA_ALPHA_URL, timeout=25)
+        except Exception:
+            return _MIT_ALPHA_INDEX  # keep serving a stale index if we have one
+        _MIT_ALPHA_INDEX, _MIT_ALPHA_TS = _build_mit_alpha_index(html), time.monotonic()
+        return _MIT_ALPHA_INDEX
 
 async def _fetch_text(url: str, timeout: int = 20) -> str:
-    headers = {"User-Agent": "Bottany/1.0 (+https://railway.app)"}
-    async with aiohttp.ClientSession(headers=headers) as session:
-        async with session.get(url, timeout=timeout) as resp:
-            resp.raise_for_status()
-            return await resp.text()
+    async with _http().get(url, timeout=aiohttp.ClientTimeout(total=timeout)) as resp:
+        resp.raise_for_status()
+        return await resp.text()
 
 async def _url_exists(url: str, timeout: int = 10) -> bool:
     try:
-        headers = {"User-Agent": "Bottany/1.0 (+https://railway.app)"}
-        async with aiohttp.ClientSession(headers=headers) as session:
-            async with session.head(url, allow_redirects=True, timeout=timeout) as resp:
-                return 200 <= resp.status < 400
+        async with _http().head(url, allow_redirects=True, timeout=aiohttp.ClientTimeout(total=timeout)) as resp:
+            return 200 <= resp.status < 400
     except Exception:
         return False
 
@@ -1530,7 +1984,7 @@ def _mit_cache_get(pat: str):
 
 def _mit_cache_set(pat: str, image_url):
     TESLA_MIT_IMAGE_CACHE[str(pat)] = image_url  # None allowed
-    save_json(TESLA_MIT_IMAGE_CACHE_PATH, TESLA_MIT_IMAGE_CACHE)
+    schedule_cache_flush(TESLA_MIT_IMAGE_CACHE_PATH, TESLA_MIT_IMAGE_CACHE)
 
 async def mit_tesla_patent_image_url(patent_number: str) -> Optional[str]:
     """
@@ -1545,33 +1999,16 @@ async def mit_tesla_patent_image_url(patent_number: str) -> Optional[str]:
     if cached is not None:
         return cached  # may be URL or None
 
-    # Load alpha table
-    try:
-        html = await _fetch_text(MIT_TESLA_ALPHA_URL, timeout=25)
-    except Exception:
+    # Candidate links from the patent's alpha-table row
+    index = await _get_mit_alpha_index()
+    if index is None:
         _mit_cache_set(pat, None)
         return None
-
-    soup = BeautifulSoup(html, "html.parser")
-
-    # Find row containing the patent number
-    target_tr = None
-    for tr in soup.find_all("tr"):
-        txt = tr.get_text(" ", strip=True).replace(",", "")
-        if pat in txt.split():
-            target_tr = tr
-            break
-
-    if not target_tr:
+    candidates = index.get(pat)
+    if candidates is None:
         _mit_cache_set(pat, None)
         return None
 
-    # Collect candidate links from the row
-    candidates = []
-    for a in target_tr.find_all("a", href=True):
-        abs_href = urljoin(MIT_TESLA_ALPHA_URL, a["href"].strip())
-        candidates.append(abs_href)
-
     # Direct image link?
     for u in candidates:
         if _is_image_url(u) and await _url_exists(u):
@@ -1587,10 +2024,11 @@ async def mit_tesla_patent_image_url(patent_number: str) -> Optional[str]:
         except Exception:
             continue
 
-        psoup = BeautifulSoup(page_html, "html.parser")
+        psoup = BeautifulSoup(page_html, _BS_PARSER)
         imgs = psoup.find_all("img", src=True)
 
-        scored = []
+        # Single pass: keep the first image with the highest score.
+        best, best_score = None, -1
         for img in imgs:
             abs_src = urljoin(page_url, img["src"].strip())
             if not _is_image_url(abs_src):
@@ -1601,11 +2039,10 @@ async def mit_tesla_patent_image_url(patent_number: str) -> Optional[str]:
                 score += 5
             if any(k in low for k in ("fig", "figure", "drawing", "patent")):
                 score += 2
-            scored.append((score, abs_src))
+            if score > best_score:
+                best, best_score = abs_src, score
 
-        if scored:
-            scored.sort(key=lambda x: x[0], reverse=True)
-            best = scored[0][1]
+        if best is not None:
             _mit_cache_set(pat, best)
             return best
 
@@ -1623,8 +2060,7 @@ TESLA_REG_PATH = os.path.join(DATA_DIR, "tesla_registry.json")
 def load_json_registry(filename: str) -> dict:
     path = os.path.join(DATA_DIR, filename)
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        return load_json(path)
     except Exception as e:
         logger.warning("Could not load registry %s: %s", filename, e)
         return {}
@@ -1642,11 +2078,10 @@ ANIME_HISTORY_QUOTES = load_json_registry("anime_history_quotes.json")
 async def met_object(object_id: int) -> dict:
     # Official: The Met Collection API (public)
     url = f"https://collectionapi.metmuseum.org/public/collection/v1/objects/{int(object_id)}"
-    async with aiohttp.ClientSession() as session:
-        async with session.get(url, timeout=20) as resp:
-            if resp.status != 200:
-                return {}
-            return await resp.json()
+    async with _http().get(url, timeout=aiohttp.ClientTimeout(total=20)) as resp:
+        if resp.status != 200:
+            return {}
+        return await resp.json()
 
 TESLA_REG = load_json(TESLA_REG_PATH) if os.path.exists(TESLA_REG_PATH) else {}
 TESLA_CACHE_PATH = os.path.join(DATA_DIR, (TESLA_REG.get("cache", {}) or {}).get("cache_file", "tesla_cache.json"))
@@ -1660,52 +2095,52 @@ def _safe_get(url: str, timeout: int = 20) -> str:
     r.raise_for_status()
     return r.text
 
+_CELL_RE = re.compile(r"<t[dh]\b[^>]*>(.*?)(?=<t[dh]\b|</tr>|\Z)", re.I | re.S)
+_PATNO_RE = re.compile(r"\b(\d{3,}(?:,\d{3})*)\b")
+_FULL_NUM_RE = re.compile(r"\d+(?:,\d+)*")
+# Example: "Jan 5 1897" or "January 5, 1897" (best effort)
+_MONTH_RE = re.compile(
+    r"\b(Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|Jun(?:e)?|Jul(?:y)?|Aug(?:ust)?|Sep(?:tember)?|Oct(?:ober)?|Nov(?:ember)?|Dec(?:ember)?)\b"
+    r"\s+(\d{1,2})(?:,)?\s+(\d{4})\b",
+    re.IGNORECASE,
+)
+
 def _extract_mit_tesla_patents(html: str) -> List[dict]:
     """
     Parse MIT Tesla alpha table into a list of patents.
-    More robust than regex parsing.
+    Scans rows/cells with precompiled regexes; no soup is built for the table.
     """
-    soup = BeautifulSoup(html, "html.parser")
     items: List[dict] = []
+    seen = set()
 
-    for tr in soup.find_all("tr"):
+    for row in _TR_RE.finditer(html):
         # Get cells
-        cells = tr.find_all(["td", "th"])
+        cells = _CELL_RE.findall(row.group(0))
         if len(cells) < 4:
             continue
 
-        # Plain text per cell
-        cols = [c.get_text(" ", strip=True) for c in cells]
-        cols_clean = [re.sub(r"\s+", " ", c).strip() for c in cols]
+        # Plain text per cell, whitespace-collapsed
+        cols_clean = [" ".join(unescape(_TAG_RE.sub(" ", c)).split()) for c in cells]
 
         # Try to find a patent number (digits, often with commas)
         joined = " ".join(cols_clean)
-        m = re.search(r"\b(\d{3,}(?:,\d{3})*)\b", joined)
+        m = _PATNO_RE.search(joined)
         if not m:
             continue
 
+        # Deduplicate by patent_number as we go
         patno = m.group(1).replace(",", "")
-        if not patno.isdigit():
+        if not patno.isdigit() or patno in seen:
             continue
+        seen.add(patno)
 
         # Heuristic: title tends to be the first non-empty cell
-        title = ""
-        for c in cols_clean:
-            if c and not re.fullmatch(r"\d+(?:,\d+)*", c):
-                title = c
-                break
+        title = next((c for c in cols_clean if c and not _FULL_NUM_RE.fullmatch(c)), "")
 
         # Heuristic: attempt to build a grant date if month/day/year appear
         # MIT table often has Month Day Year in separate columns, but format may vary.
         grant_date = ""
-        # pull tokens that look like Month Day, Year patterns
-        # Example: "Jan 5 1897" or "January 5, 1897" (best effort)
-        date_match = re.search(
-            r"\b(Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|Jun(?:e)?|Jul(?:y)?|Aug(?:ust)?|Sep(?:tember)?|Oct(?:ober)?|Nov(?:ember)?|Dec(?:ember)?)\b"
-            r"\s+(\d{1,2})(?:,)?\s+(\d{4})\b",
-            joined,
-            flags=re.IGNORECASE,
-        )
+        date_match = _MONTH_RE.search(joined)
         if date_match:
             mo, dd, yy = date_match.group(1), date_match.group(2), date_match.group(3)
             grant_date = f"{mo} {dd}, {yy}"
@@ -1722,17 +2157,7 @@ def _extract_mit_tesla_patents(html: str) -> List[dict]:
             }
         )
 
-    # Deduplicate by patent_number
-    seen = set()
-    dedup = []
-    for it in items:
-        p = it.get("patent_number")
-        if not p or p in seen:
-            continue
-        seen.add(p)
-        dedup.append(it)
-
-    return dedup
+    return items
 
 def _extract_tesla_museum_pdf_lines(text: str):
     items = []
@@ -1819,7 +2244,15 @@ FALLBACK_TESLA_ITEMS = [
     },
 ]
 
+# Parsed catalog kept in memory; disk is only consulted every _TESLA_CACHE_MEM_TTL seconds.
+_TESLA_CACHE_MEM: Optional[dict] = None
+_TESLA_CACHE_MEM_TS = 0.0
+_TESLA_CACHE_MEM_TTL = 600
+
 def _ensure_tesla_cache():
+    global _TESLA_CACHE_MEM, _TESLA_CACHE_MEM_TS
+    if _TESLA_CACHE_MEM and time.monotonic() - _TESLA_CACHE_MEM_TS < _TESLA_CACHE_MEM_TTL:
+        return _TESLA_CACHE_MEM
     target = int((TESLA_REG.get("cache", {}) or {}).get("target_count", 150))
     refresh_days = int((TESLA_REG.get("cache", {}) or {}).get("refresh_days", 30))
     cache = _load_tesla_cache()
@@ -1835,6 +2268,7 @@ def _ensure_tesla_cache():
     except Exception:
         cache = _build_tesla_catalog(target_count=target)
         _save_tesla_cache(cache)
+    _TESLA_CACHE_MEM, _TESLA_CACHE_MEM_TS = cache, time.monotonic()
     return cache
 
 # -------------------------
@@ -1849,7 +2283,7 @@ def _wiki_cache_get(pat: str):
 
 def _wiki_cache_set(pat: str, image_url):
     TESLA_WIKI_IMAGE_CACHE[str(pat)] = image_url  # None allowed
-    save_json(TESLA_WIKI_IMAGE_CACHE_PATH, TESLA_WIKI_IMAGE_CACHE)
+    schedule_cache_flush(TESLA_WIKI_IMAGE_CACHE_PATH, TESLA_WIKI_IMAGE_CACHE)
 
 async def wikimedia_tesla_patent_image_url(patent_number: str) -> Optional[str]:
     """
@@ -1876,9 +2310,11 @@ async def wikimedia_tesla_patent_image_url(patent_number: str) -> Optional[str]:
         f"US{pat}.svg",
     ]
 
-    for fname in candidates:
-        url = f"https://commons.wikimedia.org/wiki/Special:FilePath/{fname}"
-        if await _url_exists(url):
+    # Probe all candidates concurrently; keep the first hit in priority order.
+    urls = [f"https://commons.wikimedia.org/wiki/Special:FilePath/{fname}" for fname in candidates]
+    results = await asyncio.gather(*(_url_exists(u) for u in urls))
+    for url, ok in zip(urls, results):
+        if ok:
             _wiki_cache_set(pat, url)
             return url
 
@@ -1983,7 +2419,6 @@ async def tesla_sources(interaction: discord.Interaction):
         embed.set_footer(text=f"+{len(sources)-10} more in registry")
     await interaction.response.send_message(embed=embed)
 
-bot.tree.add_command(tesla_group)
 
 
 # -------------------------
@@ -1991,49 +2426,51 @@ bot.tree.add_command(tesla_group)
 # Official/institutional public sources only.
 # -------------------------
 DAVINCI_REG_PATH = os.path.join(DATA_DIR, "davinci_registry.json")
-DAVINCI_REG = load_json(DAVINCI_REG_PATH) if os.path.exists(DAVINCI_REG_PATH) else {}
+DAVINCI_REG = load_registry(DAVINCI_REG_PATH)
 
-def _davinci_items(category: str = ""):
-    items = (DAVINCI_REG.get("items", []) or [])
-    cat = (category or "").strip().lower()
-    if cat and cat != "all":
-        items = [it for it in items if (it.get("category","").lower() == cat)]
-    return items
+# category_lower -> items, grouped once per DAVINCI_REG load.
+_DAVINCI_BY_CAT: Dict[str, list] = {}
+
+def _rebuild_davinci_index() -> None:
+    _DAVINCI_BY_CAT.clear()
+    _DAVINCI_BY_CAT["all"] = DAVINCI_REG.get("items", []) or []
+    for it in _DAVINCI_BY_CAT["all"]:
+        _DAVINCI_BY_CAT.setdefault(it.get("category", "").lower(), []).append(it)
+
+_rebuild_davinci_index()
+
+def _davinci_items(category: str = "") -> list:
+    return _DAVINCI_BY_CAT.get(_norm(category) or "all", [])
 
 davinci_group = app_commands.Group(name="davinci", description="Leonardo da Vinci: registry-based resources with pagination (official sources).")
 
 @davinci_group.command(name="list", description="List Da Vinci items with pagination.")
 @app_commands.describe(category="all|machine|drawing|manuscript|painting", page="Page number (starts at 1)")
 async def davinci_list(interaction: discord.Interaction, category: str = "all", page: int = 1):
+    await interaction.response.defer(thinking=True)
     items = _davinci_items(category)
     if not items:
-        await interaction.response.send_message("No Da Vinci items found for that category.")
+        await interaction.followup.send("No Da Vinci items found for that category.")
         return
 
-    page_size = int((DAVINCI_REG.get("pagination", {}) or {}).get("page_size", 8))
+    # Capped at 15 so a page always fits one embed description.
+    page_size = min(15, int((DAVINCI_REG.get("pagination", {}) or {}).get("page_size", 8)))
     page = max(1, int(page))
-    start = (page - 1) * page_size
-    end = start + page_size
-    chunk = items[start:end]
-
-    if not chunk:
-        await interaction.response.send_message("That page is out of range.")
+    total_pages = (len(items) + page_size - 1) // page_size
+    if page > total_pages:
+        await interaction.followup.send("That page is out of range.")
         return
 
-    total_pages = (len(items) + page_size - 1) // page_size
+    start = (page - 1) * page_size
+    chunk = items[start:start + page_size]
     title = f"Da Vinci — {category.upper()} (Page {page}/{total_pages})"
     embed = discord.Embed(title=title)
-    lines = []
-    for it in chunk:
-        name = it.get("title", "Untitled")
-        url = it.get("url", "")
-        note = it.get("note", "")
-        if url:
-            lines.append(f"• **{name}** — {note}\n  {url}")
-        else:
-            lines.append(f"• **{name}** — {note}")
-    embed.description = "\n".join(lines[:15])
-    await interaction.response.send_message(embed=embed)
+    embed.description = "\n".join(
+        f"• **{it.get('title', 'Untitled')}** — {it.get('note', '')}\n  {it['url']}" if it.get("url")
+        else f"• **{it.get('title', 'Untitled')}** — {it.get('note', '')}"
+        for it in chunk
+    )
+    await interaction.followup.send(embed=embed)
 
 @davinci_group.command(name="random", description="Show one Da Vinci item (one per call).")
 @app_commands.describe(category="all|machine|drawing|manuscript|painting")
@@ -2063,14 +2500,14 @@ async def davinci_sources(interaction: discord.Interaction):
         embed.set_footer(text=f"+{len(sources)-10} more in registry")
     await interaction.response.send_message(embed=embed)
 
-bot.tree.add_command(davinci_group)
 
 
 # -------------------------
 # Philosophy module (academic-only)
 # -------------------------
 PHILO_REG_PATH = os.path.join(DATA_DIR, "philosophy_registry.json")
-PHILO_REG = load_json(PHILO_REG_PATH) if os.path.exists(PHILO_REG_PATH) else {}
+PHILO_REG = load_registry(PHILO_REG_PATH)
+_GT_MOD: Dict[str, Any] = (PHILO_REG.get("modules") or {}).get("game_theory") or {}
 
 philosophy_group = app_commands.Group(name="philosophy", description="Academic philosophy explanations (source-based).")
 
@@ -2085,18 +2522,27 @@ def _mk_ref_lines(refs: list) -> str:
             lines.append(f"• {name}")
     return "\n".join(lines) if lines else "(No references configured.)"
 
-@philosophy_group.command(name="game_theory", description="Explain John Nash’s game theory (pure theory; no video-game connection).")
-async def philosophy_game_theory(interaction: discord.Interaction):
-    mod = ((PHILO_REG.get("modules", {}) or {}).get("game_theory", {}) or {})
-    if not mod:
-        await interaction.response.send_message("Game theory module is not configured.")
-        return
+# Rendered once per module per PHILO_REG load.
+_PHILO_REF_LINES: Dict[str, str] = {}
 
-    embed = discord.Embed(title=mod.get("title", "Game Theory — John Nash"))
+def _rebuild_philo_refs() -> None:
+    _PHILO_REF_LINES.clear()
+    for key, mod in ((PHILO_REG.get("modules", {}) or {}).items()):
+        _PHILO_REF_LINES[key] = _mk_ref_lines((mod or {}).get("refs", []) or [])
+
+_rebuild_philo_refs()
+
+def _build_game_theory_embed() -> Optional[_FrozenEmbed]:
+    """The /philosophy game_theory embed, built once per PHILO_REG load (None if unconfigured)."""
+    mod = _GT_MOD
+    if not mod:
+        return None
 
     summary = mod.get("summary", []) or []
-    if summary:
-        embed.description = "\n".join(f"• {s}" for s in summary[:6])
+    embed = _FrozenEmbed(
+        title=mod.get("title", "Game Theory — John Nash"),
+        description="\n".join(f"• {s}" for s in summary[:6]) if summary else None,
+    )
 
     # Key concepts (compact)
     concepts = mod.get("key_concepts", []) or []
@@ -2112,12 +2558,18 @@ async def philosophy_game_theory(interaction: discord.Interaction):
     if how:
         embed.add_field(name="How to approach problems", value="\n".join(f"{i+1}. {s}" for i,s in enumerate(how[:6]))[:1024], inline=False)
 
-    refs = mod.get("refs", []) or []
-    embed.add_field(name="Academic references (official)", value=_mk_ref_lines(refs)[:1024], inline=False)
+    embed.add_field(name="Academic references (official)", value=_PHILO_REF_LINES["game_theory"][:1024], inline=False)
+    return embed
 
-    await interaction.response.send_message(embed=embed)
+_GT_EMBED = _build_game_theory_embed()
+
+@philosophy_group.command(name="game_theory", description="Explain John Nash’s game theory (pure theory; no video-game connection).")
+async def philosophy_game_theory(interaction: discord.Interaction):
+    if _GT_EMBED is None:
+        await interaction.response.send_message("Game theory module is not configured.")
+        return
+    await interaction.response.send_message(embed=_GT_EMBED)
 
-bot.tree.add_command(philosophy_group)
 
 
 # -------------------------
@@ -2125,24 +2577,42 @@ bot.tree.add_command(philosophy_group)
 # Provides official platform links and optional voice channel join/leave.
 # -------------------------
 MUSIC_REG_PATH = os.path.join(DATA_DIR, "music_registry.json")
-MUSIC_REG = load_json(MUSIC_REG_PATH) if os.path.exists(MUSIC_REG_PATH) else {}
+MUSIC_REG = load_registry(MUSIC_REG_PATH)
 
 music_group = app_commands.Group(name="music", description="Music companion (links only; no streaming).")
 
-def _platform_links(query: str) -> list[tuple[str,str]]:
-    q = quote_plus(query.strip())
-    out = []
-    for p in (MUSIC_REG.get("platforms", []) or []):
-        name = p.get("name","Platform")
-        tmpl = p.get("url_template","")
-        if tmpl:
-            out.append((name, tmpl.replace("{q}", q)))
-    return out
-
-def _playlist_links(mood: str) -> list[tuple[str,str]]:
-    m = (mood or "").strip().lower()
+def _platform_links(query: str) -> tuple[tuple[str,str], ...]:
+    return _platform_links_cached(query.strip())
+
+# (name, url_template) pairs, resolved once per MUSIC_REG load.
+def _music_platforms() -> tuple[tuple[str,str], ...]:
+    return tuple(
+        (p.get("name","Platform"), p["url_template"])
+        for p in (MUSIC_REG.get("platforms") or []) if p.get("url_template")
+    )
+
+_MUSIC_PLATFORMS = _music_platforms()
+
+@functools.lru_cache(maxsize=1024)
+def _platform_links_cached(query: str) -> tuple[tuple[str,str], ...]:
+    q = quote_plus(query)
+    return tuple((name, tmpl.replace("{q}", q)) for name, tmpl in _MUSIC_PLATFORMS)
+
+def _playlist_links(mood: str) -> tuple[tuple[str,str], ...]:
+    return _playlist_links_cached(_norm(mood))
+
+@functools.lru_cache(maxsize=16)
+def _playlist_links_cached(m: str) -> tuple[tuple[str,str], ...]:
     items = ((MUSIC_REG.get("playlists", {}) or {}).get(m, []) or [])
-    return [(it.get("name","Playlist"), it.get("url","")) for it in items if it.get("url")]
+    return tuple((it.get("name","Playlist"), it.get("url","")) for it in items if it.get("url"))
+
+class _LinkView(discord.ui.View):
+    """Up to five link buttons; the (name, url) pairs come from the cached _platform_links."""
+    def __init__(self, items):
+        super().__init__(timeout=180)
+        for name, url in items[:5]:
+            self.add_item(discord.ui.Button(label=name, url=url))
+
 
 @music_group.command(name="recommend", description="Get official search links for a song/artist (no streaming).")
 @app_commands.describe(query="Song, artist, or album")
@@ -2161,12 +2631,6 @@ async def music_recommend(interaction: discord.Interaction, query: str):
     )
     embed.set_footer(text="Links only (ToS-safe). Bottany does not stream audio.")
 
-    class _LinkView(discord.ui.View):
-        def __init__(self, items):
-            super().__init__(timeout=180)
-            for name, url in items[:5]:
-                self.add_item(discord.ui.Button(label=name, url=url))
-
     view = _LinkView(links)
     await interaction.response.send_message(embed=embed, view=view)
 
@@ -2179,7 +2643,7 @@ async def music_playlist(interaction: discord.Interaction, mood: str):
     if not links:
         await interaction.response.send_message("No playlists found for that mood. Try: focus, soft, gaming.")
         return
-    embed = discord.Embed(title=f"Music — {mood.strip().lower()} playlists (official links)")
+    embed = discord.Embed(title=f"Music — {_norm(mood)} playlists (official links)")
     for name, url in links[:8]:
         embed.add_field(name=name, value=url, inline=False)
     embed.set_footer(text="Links only (ToS-safe).")
@@ -2192,10 +2656,9 @@ async def music_nowplaying(interaction: discord.Interaction, url: str):
     if not u.startswith("http"):
         await interaction.response.send_message("Please provide a valid URL (starting with http/https).")
         return
-    host = urlparse(u).netloc.lower().split(":")[0]
-    host = host[4:] if host.startswith("www.") else host
-    allowed = set(((GOV_REG or {}).get("allowlists", {}) or {}).get("music", {}).get("domains", []) or [])
-    if allowed and (host not in allowed and not any(host.endswith("."+d) for d in allowed)):
+    host = fast_host(u)
+    allowed = _ALLOW_SETS.get("music")
+    if allowed and not (host in allowed or host.endswith(_ALLOW_SUFFIXES["music"])):
         await interaction.response.send_message("Unsupported domain. Please use Spotify, YouTube, or Apple Music.")
         return
     embed = discord.Embed(title="Now Playing (shared link)", description=u)
@@ -2240,7 +2703,6 @@ async def music_sources(interaction: discord.Interaction):
     embed.set_footer(text="No audio streaming; ToS-safe link sharing.")
     await interaction.response.send_message(embed=embed)
 
-bot.tree.add_command(music_group)
 
 
 
@@ -2248,6 +2710,122 @@ bot.tree.add_command(music_group)
 
 
 # Awards
+AWARDS_REG_PATH = os.path.join(DATA_DIR, "awards_registry.json")
+AWARDS_REG = load_registry(AWARDS_REG_PATH)
+AWARDS_SOURCES_PATH = os.path.join(DATA_DIR, "awards_sources_v2.json")
+AWARDS_SOURCES = load_registry(AWARDS_SOURCES_PATH)
+
+def _bafta_slugs() -> List[str]:
+    return ((AWARDS_SOURCES.get("awards") or {}).get("bafta") or {}).get("known_category_slugs") or []
+
+_BAFTA_SLUGS = _bafta_slugs()
+
+# award_id -> {"award_name", "entries"}; entries are the registry dicts, in registry order.
+_AWARDS_BY_ID: Dict[str, Dict[str, Any]] = {}
+# (award_id, year, category_lower, genre_lower) -> entries; every entry is also filed under genre "all".
+_AWARDS_INDEX: Dict[tuple, List[dict]] = {}
+# (award_id, year) -> entries, for the /awards list year filter.
+_AWARDS_BY_YEAR: Dict[tuple, List[dict]] = {}
+
+def _rebuild_awards_index() -> None:
+    """Index AWARDS_REG once; supports both the per-award "categories" layout and the flat "winners" list."""
+    _AWARDS_BY_ID.clear()
+    _AWARDS_INDEX.clear()
+    _AWARDS_BY_YEAR.clear()
+    awards = AWARDS_REG.get("awards") or []
+    if isinstance(awards, dict):
+        for aid, meta in awards.items():
+            _AWARDS_BY_ID[aid.lower()] = {"award_name": (meta or {}).get("name", "Award"), "entries": []}
+        for e in AWARDS_REG.get("winners") or []:
+            aid = (e.get("award_id") or "").lower()
+            _AWARDS_BY_ID.setdefault(aid, {"award_name": "Award", "entries": []})["entries"].append(e)
+    else:
+        for a in awards:
+            _AWARDS_BY_ID[(a.get("award_id") or "").lower()] = {
+                "award_name": a.get("award_name", "Award"),
+                "entries": a.get("categories") or [],
+            }
+    for aid, award in _AWARDS_BY_ID.items():
+        for e in award["entries"]:
+            try:
+                year = int(e.get("year", 0))
+            except (TypeError, ValueError):
+                continue
+            cat = (e.get("category") or "").lower()
+            genre = (e.get("genre") or "all").lower()
+            _AWARDS_BY_YEAR.setdefault((aid, year), []).append(e)
+            _AWARDS_INDEX.setdefault((aid, year, cat, "all"), []).append(e)
+            if genre != "all":
+                _AWARDS_INDEX.setdefault((aid, year, cat, genre), []).append(e)
+
+_rebuild_awards_index()
+
+# [checked_at, year]: the UTC year, re-derived at most hourly.
+_YEAR_CACHE = [0.0, 0]
+
+def _current_year() -> int:
+    now = time.time()
+    if now - _YEAR_CACHE[0] > 3600:
+        _YEAR_CACHE[0] = now
+        _YEAR_CACHE[1] = time.gmtime(now).tm_year
+    return _YEAR_CACHE[1]
+
+class AsyncRateLimiter:
+    """Spaces out request starts on one host: each wait() reserves the next slot
+    `interval` seconds after the previous one and sleeps until it comes up."""
+
+    def __init__(self, interval: float):
+        self._interval = interval
+        self._lock = asyncio.Lock()
+        self._next = 0.0
+
+    async def wait(self, interval: float = 0.0) -> None:
+        async with self._lock:
+            now = asyncio.get_running_loop().time()
+            start = max(now, self._next)
+            self._next = start + max(interval, self._interval)
+        if start > now:
+            await asyncio.sleep(start - now)
+
+# One limiter per award host (cache key prefix), shared by /awards sync_all, sync_batch and the weekly task.
+_AWARD_LIMITERS: Dict[str, AsyncRateLimiter] = {
+    "dice": AsyncRateLimiter(0.5),
+    "bafta": AsyncRateLimiter(0.5),
+    "gja": AsyncRateLimiter(0.5),
+}
+
+# Concurrent fetches per award host during batch syncs.
+_AWARDS_SYNC_CONCURRENCY = 4
+
+async def _run_award_syncs(jobs: List[tuple], sleep_s: float, force: bool, counts: Dict[str, int]) -> None:
+    """Run (cache_key, fn, *args) sync jobs for one host in threads, at most
+    _AWARDS_SYNC_CONCURRENCY at a time. Request starts go through the host's
+    AsyncRateLimiter, spaced by at least sleep_s.
+    Results are cached and tallied into counts["done"] / counts["failed"]; uncached
+    jobs are added to counts["queued"] up front so callers can report progress."""
+    sem = asyncio.Semaphore(_AWARDS_SYNC_CONCURRENCY)
+
+    async def _one(key: str, fn, *args) -> None:
+        async with sem:
+            await _AWARD_LIMITERS[key.split(":", 1)[0]].wait(sleep_s)
+            try:
+                data = await asyncio.to_thread(fn, *args)
+            except Exception as e:
+                logger.warning("awards sync %s failed: %s", key, e)
+                data = None
+            if data:
+                _cache_set(key, data)
+                counts["done"] += 1
+            else:
+                counts["failed"] += 1
+
+    pending = [job for job in jobs if force or not _cache_get(job[0])]
+    counts["queued"] = counts.get("queued", 0) + len(pending)
+    await asyncio.gather(*(_one(*job) for job in pending))
+
+# Minimum gap between interim progress followups, to stay clear of Discord rate limits.
+_SYNC_PROGRESS_INTERVAL = 3.0
+
 awards_group = app_commands.Group(name="awards", description="Game awards lookup (official sources; registry-based).")
 
 @awards_group.command(name="categories", description="Show award sources and known categories/slugs.")
@@ -2255,12 +2833,13 @@ awards_group = app_commands.Group(name="awards", description="Game awards lookup
 async def awards_categories(interaction: discord.Interaction, award: str):
     if not await enforce_rate_limit(interaction, "awards_categories", cooldown_seconds=10):
         return
+    await interaction.response.defer(thinking=True)
     aid = _norm(award)
     embed = discord.Embed(title="Awards — Categories / Sources")
     if aid == "tga":
         embed.add_field(name="Official winners hub", value="https://thegameawards.com/winners", inline=False)
     elif aid == "bafta":
-        slugs = (((AWARDS_SOURCES.get("awards", {}) or {}).get("bafta", {}) or {}).get("known_category_slugs", []) or [])
+        slugs = _BAFTA_SLUGS
         embed.add_field(name="Known BAFTA category slugs", value="\n".join(f"• {s}" for s in slugs[:25]) or "(none)", inline=False)
         embed.add_field(name="Official hub", value="https://www.bafta.org/awards/games/", inline=False)
         embed.add_field(name="Tip", value="Run /awards sync award:bafta param:<slug> to cache a category.", inline=False)
@@ -2277,9 +2856,9 @@ async def awards_categories(interaction: discord.Interaction, award: str):
         embed.add_field(name="Year template", value="https://www.gamesradar.com/.../golden-joystick-awards-{year}-all-winners/", inline=False)
         embed.add_field(name="Tip", value="Run /awards sync award:gja param:<year> to cache a year.", inline=False)
     else:
-        await interaction.response.send_message("Unknown award id. Use: tga, bafta, dice, gja.")
+        await interaction.followup.send("Unknown award id. Use: tga, bafta, dice, gja.")
         return
-    await interaction.response.send_message(embed=embed)
+    await interaction.followup.send(embed=embed)
 
 @awards_group.command(name="sync_all", description="Admin: sync BAFTA (all slugs), DICE hub, and GJA (recent years) into cache.")
 @app_commands.checks.has_permissions(manage_guild=True)
@@ -2288,57 +2867,38 @@ async def awards_sync_all(interaction: discord.Interaction, gja_years_back: int
     if not await enforce_rate_limit(interaction, "awards_sync_all", cooldown_seconds=45):
         return
     await interaction.response.defer(ephemeral=True, thinking=True)
-    done = 0
-    failed = 0
-    try:
-        sleep_s = max(0, int(sleep_seconds))
-        now_year = datetime.utcnow().year
-
-        # DICE
-        try:
-            if force or not _cache_get("dice"):
-                data = _sync_awards_dice_hub()
-                if data:
-                    _cache_set("dice", data); done += 1
-                else:
-                    failed += 1
-        except Exception as e:
-            logger.warning("sync_all: DICE failed: %s", e); failed += 1
-        await asyncio.sleep(sleep_s)
-
-        # BAFTA slugs
-        slugs = (((AWARDS_SOURCES.get("awards", {}) or {}).get("bafta", {}) or {}).get("known_category_slugs", []) or [])
-        for slug in slugs[:25]:
-            key = f"bafta:{_norm(slug)}"
-            if (not force) and _cache_get(key):
+    counts = {"done": 0, "failed": 0, "queued": 0}
+
+    async def _report_progress():
+        sent = 0
+        while True:
+            await asyncio.sleep(_SYNC_PROGRESS_INTERVAL)
+            n = counts["done"] + counts["failed"]
+            if n == sent:
                 continue
+            sent = n
             try:
-                data = _sync_awards_bafta(slug)
-                if data:
-                    _cache_set(key, data); done += 1
-                else:
-                    failed += 1
-            except Exception as e:
-                logger.warning("sync_all: BAFTA %s failed: %s", slug, e); failed += 1
-            await asyncio.sleep(sleep_s)
+                await interaction.followup.send(f"Sync-all progress: {n}/{counts['queued']} pages fetched…", ephemeral=True)
+            except discord.HTTPException:
+                pass
 
-        # GJA recent years
+    try:
+        sleep_s = max(0, int(sleep_seconds))
+        now_year = _current_year()
         yb = max(0, int(gja_years_back))
-        for y in range(now_year - yb, now_year + 1):
-            key = f"gja:{y}"
-            if (not force) and _cache_get(key):
-                continue
-            try:
-                data = _sync_awards_gja_year(y)
-                if data:
-                    _cache_set(key, data); done += 1
-                else:
-                    failed += 1
-            except Exception as e:
-                logger.warning("sync_all: GJA %s failed: %s", y, e); failed += 1
-            await asyncio.sleep(sleep_s)
 
-        await interaction.followup.send(f"Sync-all completed. Updated: {done}, failed: {failed}.", ephemeral=True)
+        # One job list per host, run side by side so a slow host does not hold up the others.
+        reporter = asyncio.create_task(_report_progress())
+        try:
+            await asyncio.gather(
+                _run_award_syncs([("dice", _sync_awards_dice_hub)], sleep_s, force, counts),
+                _run_award_syncs([(f"bafta:{_norm(slug)}", _sync_awards_bafta, slug) for slug in _BAFTA_SLUGS[:25]], sleep_s, force, counts),
+                _run_award_syncs([(f"gja:{y}", _sync_awards_gja_year, y) for y in range(now_year - yb, now_year + 1)], sleep_s, force, counts),
+            )
+        finally:
+            reporter.cancel()
+
+        await interaction.followup.send(f"Sync-all completed. Updated: {counts['done']}, failed: {counts['failed']}.", ephemeral=True)
     except Exception as e:
         logger.warning("sync_all error: %s", e)
         await interaction.followup.send("Sync-all failed. Try again later.", ephemeral=True)
@@ -2366,50 +2926,27 @@ async def awards_sync_batch(interaction: discord.Interaction, award: str, start:
         return
     await interaction.response.defer(ephemeral=True, thinking=True)
     aid = _norm(award)
-    done = 0
-    failed = 0
+    counts = {"done": 0, "failed": 0}
 
     try:
         if aid == "bafta":
-            slugs = (((AWARDS_SOURCES.get("awards", {}) or {}).get("bafta", {}) or {}).get("known_category_slugs", []) or [])
+            slugs = _BAFTA_SLUGS
             if not bafta_all and slugs:
                 slugs = slugs[:1]
-            for slug in slugs[:25]:
-                key = f"bafta:{_norm(slug)}"
-                if _cache_get(key) and not force:
-                    continue
-                try:
-                    data = _sync_awards_bafta(slug)
-                    if data:
-                        _cache_set(key, data); done += 1
-                    else:
-                        failed += 1
-                except Exception:
-                    failed += 1
-            await interaction.followup.send(f"BAFTA batch sync complete. Updated: {done}, failed: {failed}.", ephemeral=True)
+            await _run_award_syncs([(f"bafta:{_norm(slug)}", _sync_awards_bafta, slug) for slug in slugs[:25]], 0, force, counts)
+            await interaction.followup.send(f"BAFTA batch sync complete. Updated: {counts['done']}, failed: {counts['failed']}.", ephemeral=True)
             return
 
         if aid == "gja":
-            now_year = datetime.utcnow().year
+            now_year = _current_year()
             if start <= 0:
                 start = now_year - 2
             if end <= 0:
                 end = now_year
             if end < start:
                 start, end = end, start
-            for y in range(start, end + 1):
-                key = f"gja:{y}"
-                if _cache_get(key) and not force:
-                    continue
-                try:
-                    data = _sync_awards_gja_year(y)
-                    if data:
-                        _cache_set(key, data); done += 1
-                    else:
-                        failed += 1
-                except Exception:
-                    failed += 1
-            await interaction.followup.send(f"GJA batch sync complete for {start}-{end}. Updated: {done}, failed: {failed}.", ephemeral=True)
+            await _run_award_syncs([(f"gja:{y}", _sync_awards_gja_year, y) for y in range(start, end + 1)], 0, force, counts)
+            await interaction.followup.send(f"GJA batch sync complete for {start}-{end}. Updated: {counts['done']}, failed: {counts['failed']}.", ephemeral=True)
             return
 
         await interaction.followup.send("Unsupported award for batch sync. Use: bafta or gja.", ephemeral=True)
@@ -2453,7 +2990,7 @@ async def awards_sync(interaction: discord.Interaction, award: str, param: str =
             return
 
         if aid == "gja":
-            year = int(param) if str(param).strip().isdigit() else datetime.utcnow().year
+            year = int(param) if str(param).strip().isdigit() else _current_year()
             key = f"gja:{year}"
             if _cache_get(key) and not force:
                 await interaction.response.send_message("Cache already exists. Use force:true to refresh.", ephemeral=True)
@@ -2471,21 +3008,35 @@ async def awards_sync(interaction: discord.Interaction, award: str, param: str =
         logger.warning("Awards sync error: %s", e)
         await interaction.response.send_message("Sync failed. Try again later.", ephemeral=True)
 
+# cache key -> (winners dict, {normalized category: (category, winner)}); rebuilt when the cached dict is replaced.
+_GJA_WINNERS_NORM: Dict[str, tuple] = {}
+
+def _gja_winners_norm(key: str, winners: Dict[str, str]) -> Dict[str, tuple]:
+    hit = _GJA_WINNERS_NORM.get(key)
+    if hit is not None and hit[0] is winners:
+        return hit[1]
+    norm = {}
+    for k, v in winners.items():
+        norm.setdefault(k.strip().lower(), (k, v))  # first key wins, as in the old scan
+    _GJA_WINNERS_NORM[key] = (winners, norm)
+    return norm
+
 @awards_group.command(name="lookup", description="Lookup award winners by award, year, category, and optional genre.")
 @app_commands.describe(award="tga|bafta|dice|gja", year="Year (e.g., 2025)", category="Category name (e.g., Game of the Year)", genre="Optional genre filter (e.g., rpg, action, all)")
 async def awards_lookup(interaction: discord.Interaction, award: str, year: int, category: str, genre: str = "all", bafta_slug: str = ""):
     if not await enforce_rate_limit(interaction, "awards_lookup", cooldown_seconds=10):
         return
-    award_id = (award or "").strip().lower()
-    cat_norm = (category or "").strip().lower()
-    gen_norm = (genre or "all").strip().lower()
+    await interaction.response.defer(thinking=True)
+    award_id = _norm(award)
+    cat_norm = _norm(category)
+    gen_norm = _norm(genre) or "all"
+
+    if award_id not in _AWARDS_BY_ID and award_id not in ("bafta", "gja"):
+        await interaction.followup.send("Unknown award id. Use: tga, bafta, dice, gja.")
+        return
 
     # Find matches
-    for a in (AWARDS_REG.get("awards", []) or []):
-        if a.get("award_id","").lower() != award_id:
-            continue
-        entries = a.get("categories", []) or []
-        matches = [e for e in entries if int(e.get("year",0))==int(year) and e.get("category","").lower()==cat_norm and (gen_norm=="all" or (e.get("genre","all").lower()==gen_norm))]
+    matches = _AWARDS_INDEX.get((award_id, int(year), cat_norm, gen_norm), [])
     if not matches:
         # CACHE_FALLBACK: try sync cache for BAFTA/GJA
         if award_id == "bafta":
@@ -2499,85 +3050,75 @@ async def awards_lookup(interaction: discord.Interaction, award: str, year: int,
                 src = c.get("source_url","")
                 if src and _allowed_domain("awards", src):
                     embed.add_field(name="Official source", value=src, inline=False)
-                await interaction.response.send_message(embed=embed)
+                await interaction.followup.send(embed=embed)
                 return
-            await interaction.response.send_message("No match in registry or cache. Tip: run /awards sync award:bafta param:<slug> and try again.")
+            await interaction.followup.send("No match in registry or cache. Tip: run /awards sync award:bafta param:<slug> and try again.")
             return
 
         if award_id == "gja":
             key = f"gja:{int(year)}"
             c = _cache_get(key) if "_cache_get" in globals() else {}
-            winners = (c.get("winners", {}) or {})
-            cat_norm = (category or "").strip().lower()
-            found = None
-            for k,v in winners.items():
-                if k.strip().lower() == cat_norm:
-                    found = (k,v); break
-            if not found:
-                for k,v in winners.items():
-                    if cat_norm and cat_norm in k.strip().lower():
-                        found = (k,v); break
+            winners_norm = _gja_winners_norm(key, c.get("winners", {}) or {})
+            found = winners_norm.get(cat_norm)
+            if not found and cat_norm:
+                found = next((kv for norm, kv in winners_norm.items() if cat_norm in norm), None)
             if found:
                 k,v = found
                 embed = discord.Embed(title=f"Golden Joystick Awards — {k} ({year})", description=f"Winner: **{v}**")
                 src = c.get("source_url","")
                 if src and _allowed_domain("awards", src):
                     embed.add_field(name="Organizer source", value=src, inline=False)
-                await interaction.response.send_message(embed=embed)
+                await interaction.followup.send(embed=embed)
                 return
-            await interaction.response.send_message("No match in registry or cache. Tip: run /awards sync award:gja param:<year> and try again.")
+            await interaction.followup.send("No match in registry or cache. Tip: run /awards sync award:gja param:<year> and try again.")
             return
 
-        await interaction.response.send_message("No match found in the registry for that award/year/category/genre.")
+        await interaction.followup.send("No match found in the registry for that award/year/category/genre.")
         return
 
-    await interaction.response.send_message("Unknown award id. Use: tga, bafta, dice, gja.")
+    m = matches[0]
+    award_name = _AWARDS_BY_ID[award_id]["award_name"]
+    embed = discord.Embed(title=f"{award_name} — {m.get('category', category)} ({year})", description=f"Winner: **{m.get('winner','(unknown)')}**")
+    src = m.get("source_url","")
+    if src and _allowed_domain("awards", src):
+        embed.add_field(name="Official source", value=src, inline=False)
+    await interaction.followup.send(embed=embed)
 
 @awards_group.command(name="list", description="List categories for an award with pagination.")
 @app_commands.describe(award="tga|bafta|dice|gja", year="Optional year filter", page="Page number (starts at 1)")
 async def awards_list(interaction: discord.Interaction, award: str, year: int = 0, page: int = 1):
     if not await enforce_rate_limit(interaction, "awards_list", cooldown_seconds=10):
         return
-    award_id = (award or "").strip().lower()
+    await interaction.response.defer(thinking=True)
+    award_id = _norm(award)
     page = max(1, int(page))
     page_size = 8
 
-    for a in (AWARDS_REG.get("awards", []) or []):
-        if a.get("award_id","").lower() != award_id:
-            continue
-        entries = a.get("categories", []) or []
-        if year:
-            entries = [e for e in entries if int(e.get("year",0))==int(year)]
-        # build list lines
-        lines = [f"• {e.get('year')} — **{e.get('category')}** — {e.get('winner')} (genre: {e.get('genre','all')})" for e in entries]
-        if not lines:
-            await interaction.response.send_message("No entries found for that filter.")
+    a = _AWARDS_BY_ID.get(award_id)
+    if a is not None:
+        entries = _AWARDS_BY_YEAR.get((award_id, int(year)), []) if year else a["entries"]
+        if not entries:
+            await interaction.followup.send("No entries found for that filter.")
             return
-        total_pages = (len(lines)+page_size-1)//page_size
-        start = (page-1)*page_size
-        end = start+page_size
-        chunk = lines[start:end]
-        if not chunk:
-            await interaction.response.send_message("That page is out of range.")
+        total_pages = (len(entries)+page_size-1)//page_size
+        if page > total_pages:
+            await interaction.followup.send("That page is out of range.")
             return
-        embed = discord.Embed(title=f"Awards — {a.get('award_name','Award')} entries (Page {page}/{total_pages})")
-        embed.description = "\n".join(chunk[:page_size])
-        await interaction.response.send_message(embed=embed)
+        start = (page-1)*page_size
+        # build list lines for this page only
+        lines = [f"• {e.get('year')} — **{e.get('category')}** — {e.get('winner')} (genre: {e.get('genre','all')})" for e in entries[start:start+page_size]]
+        embed = discord.Embed(title=f"Awards — {a.get('award_name','Award')} entries (Page {page}/{total_pages})", description="\n".join(lines))
+        await interaction.followup.send(embed=embed)
         return
 
-    await interaction.response.send_message("Unknown award id. Use: tga, bafta, dice, gja.")
+    await interaction.followup.send("Unknown award id. Use: tga, bafta, dice, gja.")
 
 
 def _find_award_entries(award_id: str, year: int, category: str):
-    awards = (AWARDS_REG.get("awards", []) or [])
-    for a in awards:
-        if a.get("award_id") != award_id:
-            continue
-        entries = a.get("categories", []) or []
-        cat_norm = (category or "").strip().lower()
-        out = [e for e in entries if int(e.get("year", 0)) == int(year) and (e.get("category","").lower() == cat_norm)]
-        return a.get("award_name","Award"), out
-    return "Award", []
+    a = _AWARDS_BY_ID.get(award_id)
+    if a is None:
+        return "Award", []
+    return a["award_name"], _AWARDS_INDEX.get((award_id, int(year), _norm(category), "all"), [])
 
 @awards_group.command(name="tga", description="Lookup The Game Awards winners by year and category.")
 @app_commands.describe(year="Year (e.g., 2023)", category="Category name (e.g., Game of the Year)")
@@ -2607,10 +3148,83 @@ async def awards_sources(interaction: discord.Interaction):
         embed.add_field(name=s.get("name","Source"), value=s.get("url",""), inline=False)
     await interaction.response.send_message(embed=embed)
 
-bot.tree.add_command(awards_group)
+def _reload_all_registries() -> List[str]:
+    """Re-read the Da Vinci / philosophy / music / awards registries whose files changed
+    and rebuild their derived indexes. Returns the names that were reloaded."""
+    global DAVINCI_REG, PHILO_REG, _GT_MOD, _GT_EMBED, MUSIC_REG, _MUSIC_PLATFORMS, AWARDS_REG, AWARDS_SOURCES, _BAFTA_SLUGS
+    reloaded = []
+    reg = load_registry(DAVINCI_REG_PATH)
+    if reg is not DAVINCI_REG:
+        DAVINCI_REG = reg
+        _rebuild_davinci_index()
+        reloaded.append("davinci")
+    reg = load_registry(PHILO_REG_PATH)
+    if reg is not PHILO_REG:
+        PHILO_REG = reg
+        _GT_MOD = (PHILO_REG.get("modules") or {}).get("game_theory") or {}
+        _rebuild_philo_refs()
+        _GT_EMBED = _build_game_theory_embed()
+        reloaded.append("philosophy")
+    reg = load_registry(MUSIC_REG_PATH)
+    if reg is not MUSIC_REG:
+        MUSIC_REG = reg
+        _MUSIC_PLATFORMS = _music_platforms()
+        _platform_links_cached.cache_clear()
+        _playlist_links_cached.cache_clear()
+        reloaded.append("music")
+    reg = load_registry(AWARDS_REG_PATH)
+    if reg is not AWARDS_REG:
+        AWARDS_REG = reg
+        _rebuild_awards_index()
+        reloaded.append("awards")
+    reg = load_registry(AWARDS_SOURCES_PATH)
+    if reg is not AWARDS_SOURCES:
+        AWARDS_SOURCES = reg
+        _BAFTA_SLUGS = _bafta_slugs()
+        reloaded.append("awards_sources")
+    return reloaded
+
+@registry_group.command(name="reload", description="Admin: reload changed Da Vinci/philosophy/music/awards registries.")
+async def registry_reload(interaction: discord.Interaction):
+    if not _is_admin(interaction):
+        await interaction.response.send_message("You need 'Manage Server' permission.")
+        return
+    # Runs on the loop so no handler sees a half-rebuilt index; these files are small.
+    reloaded = _reload_all_registries()
+    msg = f"Reloaded: {', '.join(reloaded)}." if reloaded else "No registry files changed."
+    await interaction.response.send_message(msg, ephemeral=True)
+
+# Registered together once every group above is fully built.
+for _group in (tesla_group, davinci_group, philosophy_group, music_group, awards_group):
+    bot.tree.add_command(_group)
+
+
+# (label, url) buttons for allowlisted free-games sources, already trimmed to the first four sources;
+# built on first use, reset when allowlists change.
+_FREEGAMES_BUTTON_CACHE: Optional[tuple] = None
+
+def _build_freegames_buttons() -> tuple:
+    sources = (FREEGAMES_REG.get("sources", []) or []) if "FREEGAMES_REG" in globals() else []
+    return tuple(
+        (s.get("name","Source")[:80], s["url"])
+        for s in sources[:4]
+        if s.get("url") and _allowed_domain("gaming_deals", s["url"])
+    )
+
+def _freegames_buttons() -> tuple:
+    global _FREEGAMES_BUTTON_CACHE
+    if _FREEGAMES_BUTTON_CACHE is None:
+        _FREEGAMES_BUTTON_CACHE = _build_freegames_buttons()
+    return _FREEGAMES_BUTTON_CACHE
 
+class _FGView(discord.ui.View):
+    def __init__(self, epic_items):
+        super().__init__(timeout=180)
+        for label, url in _freegames_buttons():
+            self.add_item(discord.ui.Button(label=label, url=url))
+        for title, url in itertools.islice(epic_items, 3):
+            self.add_item(discord.ui.Button(label=f"Epic: {title}"[:80], url=url))
 
-@tasks.loop(hours=168)  # weekly
 async def weekly_freegames_task():
     channel_id = (BOT_CFG or {}).get("freegames_announce_channel_id")
     if not channel_id:
@@ -2618,39 +3232,24 @@ async def weekly_freegames_task():
     channel = bot.get_channel(int(channel_id))
     if not channel:
         return
+    # Skip the Epic fetch and embed/view build entirely when the post could not be delivered.
+    me = getattr(channel, "guild", None) and channel.guild.me
+    if me is not None and not channel.permissions_for(me).send_messages:
+        logger.warning("Weekly free games: no send permission in channel %s", channel_id)
+        return
     try:
         # Reuse freegames embed builder by calling internal helper via a lightweight duplication:
         embed = discord.Embed(title="Weekly Free Games — Official sources", description="Use the buttons to open official pages. (Epic list is best-effort.)")
-        sources = (FREEGAMES_REG.get("sources", []) or []) if "FREEGAMES_REG" in globals() else []
-        epic_items = []
-        try:
-            epic_items = _epic_free_games() if "_epic_free_games" in globals() else []
-        except Exception:
-            epic_items = []
-        if epic_items:
-            embed.description = "Current Epic promotions (best-effort):\n" + "\n".join([f"• **{t}**" for t,_ in epic_items[:5]])
-
-        class _FGView(discord.ui.View):
-            def __init__(self):
-                super().__init__(timeout=180)
-                for s in sources[:4]:
-                    url = s.get("url","")
-                    name = s.get("name","Source")
-                    if url and _allowed_domain("gaming_deals", url):
-                        self.add_item(discord.ui.Button(label=name[:80], url=url))
-                for title, url in epic_items[:3]:
-                    self.add_item(discord.ui.Button(label=f"Epic: {title}"[:80], url=url))
-
-        await channel.send(embed=embed, view=_FGView())
+        # Shares the /freegames_* TTL cache, which never stores an empty or failed fetch.
+        epic_items = [(o["title"], o["url"]) for o in await fetch_epic_cached(_http()) if o.get("title") and o.get("url")]
+        # One embed per promotion; Discord accepts up to 10 embeds per message, so send them in batches.
+        embeds = [embed] + [discord.Embed(title=f"Epic: {t}"[:256], url=u) for t, u in epic_items]
+        for i in range(0, len(embeds), 10):
+            await channel.send(embeds=embeds[i:i+10], view=_FGView(epic_items) if i == 0 else discord.utils.MISSING)
         logger.info("Posted weekly free games update to channel %s", channel_id)
     except Exception as e:
         logger.warning("Weekly free games post failed: %s", e)
 
-@weekly_freegames_task.before_loop
-async def before_weekly_freegames_task():
-    await bot.wait_until_ready()
-
-@tasks.loop(hours=168)  # weekly
 async def weekly_awards_task():
     # Optional weekly refresh (disabled by default)
     if not (BOT_CFG or {}).get("awards_autosync_enabled", False):
@@ -2659,53 +3258,71 @@ async def weekly_awards_task():
         sleep_s = int((BOT_CFG or {}).get("awards_autosync_sleep_seconds", 2))
         slug_limit = int((BOT_CFG or {}).get("awards_autosync_bafta_slug_limit", 25))
         years_back = int((BOT_CFG or {}).get("awards_autosync_gja_years_back", 2))
-        now_year = datetime.utcnow().year
+        now_year = _current_year()
+        sleep_s = max(0, sleep_s)
+        counts = {"done": 0, "failed": 0, "queued": 0}
+
+        # DICE hub, BAFTA known slugs and GJA recent years; each host has its own cap and pacing.
+        await asyncio.gather(
+            _run_award_syncs([("dice", _sync_awards_dice_hub)], sleep_s, True, counts),
+            _run_award_syncs([(f"bafta:{_norm(slug)}", _sync_awards_bafta, slug) for slug in _BAFTA_SLUGS[:max(1, slug_limit)]], sleep_s, True, counts),
+            _run_award_syncs([(f"gja:{y}", _sync_awards_gja_year, y) for y in range(now_year - max(0, years_back), now_year + 1)], sleep_s, True, counts),
+        )
 
-        # DICE hub
-        try:
-            data = _sync_awards_dice_hub()
-            if data:
-                _cache_set("dice", data)
-        except Exception as e:
-            logger.warning("Weekly awards: DICE sync failed: %s", e)
-        await asyncio.sleep(max(0, sleep_s))
+        logger.info("Weekly awards autosync completed. Updated: %s, failed: %s.", counts["done"], counts["failed"])
+    except Exception as e:
+        logger.warning("Weekly awards autosync failed: %s", e)
 
-        # BAFTA batch (known slugs)
-        try:
-            slugs = (((AWARDS_SOURCES.get("awards", {}) or {}).get("bafta", {}) or {}).get("known_category_slugs", []) or [])
-            for slug in slugs[:max(1, slug_limit)]:
-                key = f"bafta:{_norm(slug)}"
-                try:
-                    data = _sync_awards_bafta(slug)
-                    if data:
-                        _cache_set(key, data)
-                except Exception as e:
-                    logger.warning("Weekly awards: BAFTA slug %s failed: %s", slug, e)
-                await asyncio.sleep(max(0, sleep_s))
-        except Exception as e:
-            logger.warning("Weekly awards: BAFTA batch failed: %s", e)
+# Weekly jobs run at a fixed UTC slot (Saturday 12:00) rather than 168h after startup,
+# and the last slot each one ran for is persisted so a restart mid-week does not repeat it.
+WEEKLY_STATE_PATH = os.path.join(DATA_DIR, "weekly_runs.json")
+WEEKLY_WEEKDAY = 5  # Monday=0
+WEEKLY_HOUR_UTC = 12
 
-        # GJA recent years
-        try:
-            for y in range(now_year - max(0, years_back), now_year + 1):
-                key = f"gja:{y}"
-                try:
-                    data = _sync_awards_gja_year(y)
-                    if data:
-                        _cache_set(key, data)
-                except Exception as e:
-                    logger.warning("Weekly awards: GJA year %s failed: %s", y, e)
-                await asyncio.sleep(max(0, sleep_s))
-        except Exception as e:
-            logger.warning("Weekly awards: GJA batch failed: %s", e)
+def _next_weekly(now: datetime, weekday: int = WEEKLY_WEEKDAY, hour: int = WEEKLY_HOUR_UTC) -> datetime:
+    target = now.replace(hour=hour, minute=0, second=0, microsecond=0) + timedelta(days=(weekday - now.weekday()) % 7)
+    return target if target > now else target + timedelta(days=7)
 
-        logger.info("Weekly awards autosync completed.")
-    except Exception as e:
-        logger.warning("Weekly awards autosync failed: %s", e)
+def _weekly_last_run(name: str) -> Optional[datetime]:
+    state = load_json(WEEKLY_STATE_PATH) if os.path.exists(WEEKLY_STATE_PATH) else {}
+    try:
+        return datetime.fromisoformat(state[name])
+    except (KeyError, TypeError, ValueError):
+        return None
 
-@weekly_awards_task.before_loop
-async def before_weekly_awards_task():
+def _weekly_mark_run(name: str, slot: datetime) -> None:
+    state = load_json(WEEKLY_STATE_PATH) if os.path.exists(WEEKLY_STATE_PATH) else {}
+    state[name] = slot.isoformat()
+    save_json_atomic(WEEKLY_STATE_PATH, state)
+
+async def _weekly_loop(name: str, job) -> None:
     await bot.wait_until_ready()
+    while not bot.is_closed():
+        now = datetime.now(timezone.utc)
+        target = _next_weekly(now)
+        due = target - timedelta(days=7)  # latest slot at or before now
+        last = _weekly_last_run(name)
+        if last is None:
+            # No record yet (first deploy or lost state): start from the next slot, don't fire now.
+            _weekly_mark_run(name, due)
+            last = due
+        if last >= due:
+            # Re-check after waking so an early wake-up just sleeps the remainder instead of running twice.
+            await asyncio.sleep(max((target - now).total_seconds(), 1.0))
+            continue
+        # The slot currently due was missed (e.g. bot was down at 12:00): run it once now.
+        try:
+            await job()
+        except Exception as e:
+            logger.warning("Weekly job %s failed: %s", name, e)
+        _weekly_mark_run(name, due)
+
+def _start_weekly_jobs() -> None:
+    if getattr(bot, "_weekly_tasks", None) is None:
+        bot._weekly_tasks = [
+            asyncio.create_task(_weekly_loop("freegames", weekly_freegames_task)),
+            asyncio.create_task(_weekly_loop("awards", weekly_awards_task)),
+        ]
 
 
 
@@ -2830,21 +3447,42 @@ async def restaurants_michelin_find(interaction: discord.Interaction, query: str
     embed.add_field(name="Tip", value="Use the search box on the site to filter by city, cuisine, and stars.", inline=False)
     await interaction.response.send_message(embed=embed)
 
+def _ra_year(x: dict) -> int:
+    try:
+        return int(x.get("year", 0) or 0)
+    except (TypeError, ValueError):
+        return 0
+
+# Parallel arrays over the restaurant awards registry: award name (lowercased) and year per item.
+_RA_ITEMS: List[dict] = RESTAURANT_AWARDS_REGISTRY.get("items", []) or []
+_RA_AWARDS_LC: List[str] = [str(x.get("award", "")).lower() for x in _RA_ITEMS]
+_RA_YEARS: List[int] = [_ra_year(x) for x in _RA_ITEMS]
+# Inverted indexes: award (lowercased) / year -> item indexes.
+_RA_BY_AWARD: Dict[str, List[int]] = {}
+_RA_BY_YEAR: Dict[int, List[int]] = {}
+for _i, (_a, _y) in enumerate(zip(_RA_AWARDS_LC, _RA_YEARS)):
+    _RA_BY_AWARD.setdefault(_a, []).append(_i)
+    _RA_BY_YEAR.setdefault(_y, []).append(_i)
+
 @restaurants_group.command(name="award_winner", description="Show one non‑Michelin award-winning restaurant item (seed registry), optionally filtered by year.")
 @app_commands.describe(year="Optional year filter (e.g., 2024). Use 0 for any.", award="Optional award filter (e.g., 'World\'s 50 Best Restaurants'). Leave blank for any.")
 async def restaurants_award_winner(interaction: discord.Interaction, year: int = 0, award: str = ""):
     if not await enforce_rate_limit(interaction, "restaurants_award_winner", cooldown_seconds=5):
         return
-    items = (RESTAURANT_AWARDS_REGISTRY.get("items", []) or [])
-    if award:
-        a = award.strip().lower()
-        items = [x for x in items if (x.get("award","").lower() == a)]
-    if year and year > 0:
-        items = [x for x in items if int(x.get("year",0) or 0) == int(year)]
-    if not items:
+    a_q = _norm(award)
+    y_q = int(year) if year and year > 0 else 0
+    if a_q and y_q:
+        idxs = [i for i in _RA_BY_AWARD.get(a_q, ()) if _RA_YEARS[i] == y_q]
+    elif a_q:
+        idxs = _RA_BY_AWARD.get(a_q, ())
+    elif y_q:
+        idxs = _RA_BY_YEAR.get(y_q, ())
+    else:
+        idxs = range(len(_RA_ITEMS))
+    if not idxs:
         await interaction.response.send_message("No matching entries in the restaurant awards registry.")
         return
-    x = random.choice(items)
+    x = _RA_ITEMS[idxs[random.randrange(len(idxs))]]
     embed = discord.Embed(title=str(x.get("name","Restaurant award item")))
     desc = " • ".join([y for y in [x.get("city",""), x.get("country","")] if y])
     if desc:
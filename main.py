@@ -1,12 +1,11 @@
 
 import os
+import sys
 import asyncio
 import logging
 import discord
-from discord.ext import commands
-import pkgutil
-import importlib
-import inspect
+
+from utils.shutdown import ShutdownBot
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("bottany")
@@ -14,7 +13,7 @@ logger = logging.getLogger("bottany")
 intents = discord.Intents.default()
 intents.message_content = True
 
-bot = commands.Bot(command_prefix="!", intents=intents)
+bot = ShutdownBot(command_prefix="!", intents=intents)
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 DATA_DIR = os.path.join(BASE_DIR, "data")
@@ -23,17 +22,30 @@ DATA_DIR = os.path.join(BASE_DIR, "data")
 # -----------------------------
 # SAFE REGISTER CALLER
 # -----------------------------
+# (module, qualname) -> parameter count; on_ready runs again on every reconnect.
+_REGISTER_ARITY: dict[tuple[str, str], int] = {}
+
+
+def _register_arity(func) -> int:
+    key = (func.__module__, func.__qualname__)
+    n = _REGISTER_ARITY.get(key)
+    if n is None:
+        import inspect  # startup-only; kept off the import path
+
+        n = _REGISTER_ARITY[key] = len(inspect.signature(func).parameters)
+    return n
+
+
 async def safe_register(func, bot, data_dir):
     if not func:
         return
 
     try:
-        sig = inspect.signature(func)
-        params = sig.parameters
+        n = _register_arity(func)
 
-        if len(params) == 2:
+        if n == 2:
             result = func(bot, data_dir)
-        elif len(params) == 1:
+        elif n == 1:
             result = func(bot)
         else:
             result = func()
@@ -48,24 +60,53 @@ async def safe_register(func, bot, data_dir):
 # -----------------------------
 # AUTO-LOADER (modular future-safe)
 # -----------------------------
-async def auto_load_command_modules(bot, data_dir):
+# module name -> register hooks, resolved on the first on_ready and reused after reconnects.
+_MODULE_HOOKS: dict[str, tuple] | None = None
+
+
+def _module_hooks(module) -> tuple:
+    # A module may list its hooks explicitly; otherwise its register() is the hook.
+    hooks = getattr(module, "__register_hooks__", None)
+    if hooks:
+        return tuple(hooks)
+    register_func = getattr(module, "register", None)
+    return (register_func,) if register_func else ()
+
+
+async def _discover_command_modules() -> dict[str, tuple]:
+    import importlib  # startup-only; kept off the import path
+    import pkgutil
+
     try:
         import commands
     except Exception:
         logger.warning("commands package not found.")
-        return
+        return {}
 
+    found = {}
     for _, module_name, _ in pkgutil.iter_modules(commands.__path__):
         try:
-            module = importlib.import_module(f"commands.{module_name}")
-
-            if hasattr(module, "register"):
-                register_func = getattr(module, "register")
-                await safe_register(register_func, bot, data_dir)
-                logger.info("Auto-loaded module: commands.%s", module_name)
-
+            # Module init reads files and runs top-level code; keep it off the event loop.
+            module = await asyncio.to_thread(importlib.import_module, f"commands.{module_name}")
         except Exception as e:
             logger.warning("Auto-load failed for commands.%s: %s", module_name, e)
+            continue
+        hooks = _module_hooks(module)
+        if hooks:
+            found[module_name] = hooks
+    return found
+
+
+async def auto_load_command_modules(bot, data_dir):
+    global _MODULE_HOOKS
+    if _MODULE_HOOKS is None:
+        _MODULE_HOOKS = await _discover_command_modules()
+
+    for module_name, hooks in _MODULE_HOOKS.items():
+        for register_func in hooks:
+            await safe_register(register_func, bot, data_dir)
+        logger.info("Auto-loaded module: commands.%s", module_name)
+        await asyncio.sleep(0)  # let heartbeats run between modules
 
 
 @bot.event
@@ -112,5 +153,18 @@ async def ping(interaction: discord.Interaction):
     await interaction.response.send_message("Pong.")
 
 
+def _install_uvloop() -> None:
+    # libuv loop for gateway/aiohttp traffic; stays on the stdlib loop when unavailable.
+    if sys.platform == "win32":
+        return
+    try:
+        import uvloop
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    logger.info("Using uvloop event loop.")
+
+
 if __name__ == "__main__":
+    _install_uvloop()
     bot.run(os.getenv("DISCORD_TOKEN"))
@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+import re
+from html import unescape
+from typing import Iterator, Tuple
+
+# Anchor scan for the store providers: they only need href + visible text, not a parse tree.
+# href must follow whitespace so data-href= / xlink:href= style attributes are not picked up.
+_A_RE = re.compile(r"""<a\b[^>]*?\shref\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s>]+))[^>]*>(.*?)</a\s*>""", re.I | re.S)
+_TAG_RE = re.compile(r"<[^>]+>")
+_WS_RE = re.compile(r"\s+")
+
+
+def iter_links(html: str) -> Iterator[Tuple[str, str]]:
+    """Yield (href, text) for each <a href> in html; text has tags removed and whitespace collapsed."""
+    for m in _A_RE.finditer(html or ""):
+        href = unescape(m.group(1) or m.group(2) or m.group(3) or "")
+        text = _WS_RE.sub(" ", unescape(_TAG_RE.sub(" ", m.group(4)))).strip()
+        yield href, text
@@ -6,6 +6,7 @@ import datetime as dt
 from typing import Any, Dict, List
 
 import aiohttp
+import orjson
 
 
 def _parse_iso(date_str: str) -> dt.datetime | None:
@@ -53,7 +54,8 @@ async def fetch_epic_offers(
 
     async with session.get(url, timeout=timeout_s) as r:
         r.raise_for_status()
-        data = await r.json()
+        # Large nested catalog payload: decode the raw bytes with orjson.
+        data = orjson.loads(await r.read())
 
     elements = (
         data.get("data", {})
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import asyncio
 from typing import Any, Dict, List
 
 import aiohttp
-from bs4 import BeautifulSoup
+
+from providers._html_links import iter_links
 
 
 async def _fetch_page(session: aiohttp.ClientSession, url: str, timeout_s: int) -> str:
@@ -13,11 +15,8 @@ async def _fetch_page(session: aiohttp.ClientSession, url: str, timeout_s: int)
 
 
 def _extract_links(html: str) -> List[Dict[str, Any]]:
-    soup = BeautifulSoup(html, "lxml")
     out: List[Dict[str, Any]] = []
-    for a in soup.select("a[href]"):
-        href = a.get("href") or ""
-        text = (a.get_text(" ", strip=True) or "").strip()
+    for href, text in iter_links(html):
         if not text or len(text) < 2:
             continue
         if "/game/" in href or "/en/game/" in href:
@@ -36,13 +35,18 @@ def _extract_links(html: str) -> List[Dict[str, Any]]:
 
 
 async def fetch_gog_offers(session: aiohttp.ClientSession, endpoints: List[str], timeout_s: int = 20) -> List[Dict[str, Any]]:
+    async def _fetch_links(url: str) -> List[Dict[str, Any]]:
+        html = await _fetch_page(session, url, timeout_s)
+        # Parsing is CPU-bound; run it in a thread so other fetches keep progressing.
+        return await asyncio.to_thread(_extract_links, html)
+
     out: List[Dict[str, Any]] = []
-    for url in endpoints:
-        try:
-            html = await _fetch_page(session, url, timeout_s)
-            out.extend(_extract_links(html))
-        except Exception:
+    # Fetch and parse every endpoint at once; a failed page is skipped, as before.
+    pages = await asyncio.gather(*(_fetch_links(url) for url in endpoints), return_exceptions=True)
+    for links in pages:
+        if isinstance(links, BaseException):
             continue
+        out.extend(links)
     # Dedup across pages
     seen=set()
     uniq=[]
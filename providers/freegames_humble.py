@@ -1,19 +1,58 @@
 from __future__ import annotations
 
-import re
+import asyncio
 from typing import Any, Dict, List, Optional
 from urllib.parse import urljoin
 
 import aiohttp
-from bs4 import BeautifulSoup
+
+from providers._html_links import iter_links
 
 DEFAULT_URLS = [
     # Humble's promo URLs change. We keep this as a best-effort scraper for visible promos/deals.
     "https://www.humblebundle.com/store",
 ]
 
-def _clean_text(s: str) -> str:
-    return re.sub(r"\s+", " ", s or "").strip()
+async def _fetch_html(session: aiohttp.ClientSession, u: str, timeout_s: int) -> Optional[str]:
+    try:
+        async with session.get(u, timeout=timeout_s, headers={"User-Agent": "Mozilla/5.0"}) as resp:
+            if resp.status != 200:
+                return None
+            return await resp.text()
+    except Exception:
+        return None
+
+def _parse_sync(html: str, base_url: str) -> List[Dict[str, Any]]:
+    """Product-ish links on one store page (heuristic); no I/O, safe to run in a thread."""
+    out: List[Dict[str, Any]] = []
+    seen = set()
+
+    # Find product cards/links (heuristic).
+    for href, text in iter_links(html):
+        if not text or len(text) < 3:
+            continue
+        if any(bad in href for bad in ["#", "javascript:", "mailto:", "/login", "/search"]):
+            continue
+
+        # Keep only store item links-ish
+        if "/store/" not in href and "/bundle/" not in href:
+            continue
+
+        full = href if href.startswith("http") else urljoin(base_url, href)
+        if full in seen:
+            continue
+        seen.add(full)
+
+        kind = "deal"
+        note = "Humble Bundle (auto-scraped). Verify final price/eligibility on page."
+        out.append({"title": text, "url": full, "kind": kind, "note": note})
+    return out
+
+async def _fetch_offers(session: aiohttp.ClientSession, u: str, timeout_s: int) -> List[Dict[str, Any]]:
+    html = await _fetch_html(session, u, timeout_s)
+    if html is None:
+        return []
+    return await asyncio.to_thread(_parse_sync, html, u)
 
 async def fetch_humble_offers(
     session: aiohttp.ClientSession,
@@ -27,37 +66,16 @@ async def fetch_humble_offers(
     urls = urls or DEFAULT_URLS
     out: List[Dict[str, Any]] = []
 
-    for u in urls:
-        try:
-            async with session.get(u, timeout=timeout_s, headers={"User-Agent": "Mozilla/5.0"}) as resp:
-                if resp.status != 200:
-                    continue
-                html = await resp.text()
-        except Exception:
-            continue
-
-        soup = BeautifulSoup(html, "lxml")
-
-        # Find product cards/links (heuristic).
-        for a in soup.find_all("a", href=True):
-            href = a.get("href") or ""
-            text = _clean_text(a.get_text(" "))
-            if not text or len(text) < 3:
-                continue
-            if any(bad in href for bad in ["#", "javascript:", "mailto:", "/login", "/search"]):
-                continue
+    seen = set()
 
-            # Keep only store item links-ish
-            if "/store/" not in href and "/bundle/" not in href:
+    # Fetch and parse all pages concurrently (parsing in threads), then merge in URL order.
+    pages = await asyncio.gather(*(_fetch_offers(session, u, timeout_s) for u in urls))
+    for offers in pages:
+        for item in offers:
+            if item["url"] in seen:
                 continue
-
-            full = href if href.startswith("http") else urljoin(u, href)
-            if any(x["url"] == full for x in out):
-                continue
-
-            kind = "deal"
-            note = "Humble Bundle (auto-scraped). Verify final price/eligibility on page."
-            out.append({"title": text, "url": full, "kind": kind, "note": note})
+            seen.add(item["url"])
+            out.append(item)
 
         if len(out) > 40:
             out = out[:40]
@@ -9,10 +9,12 @@ from __future__ import annotations
 
 import os
 import json
+import asyncio
 from typing import Any, Dict, List
 
 import aiohttp
-from bs4 import BeautifulSoup
+
+from providers._html_links import iter_links
 
 
 def _save_json(path: str, obj: Any) -> None:
@@ -21,29 +23,38 @@ def _save_json(path: str, obj: Any) -> None:
         json.dump(obj, f, ensure_ascii=False, indent=2)
 
 
+def _parse_sync(html: str) -> List[Dict[str, str]]:
+    """Game/channel links on one Luna page; no I/O, safe to run in a thread."""
+    items: List[Dict[str, str]] = []
+    for href, txt in iter_links(html):
+        if not txt:
+            continue
+        if "/game/" in href or "/games/" in href or "/channel/" in href or "/channels/" in href:
+            if href.startswith("/"):
+                href = "https://luna.amazon.com" + href
+            items.append({"title": txt[:140], "url": href})
+    return items
+
+
 async def refresh_luna_cache(urls: List[str], cache_path: str, *, timeout_s: int = 18) -> Dict[str, Any]:
     timeout = aiohttp.ClientTimeout(total=timeout_s)
     items: List[Dict[str, str]] = []
-    async with aiohttp.ClientSession() as session:
-        for url in urls:
-            try:
-                async with session.get(url, timeout=timeout, headers={"User-Agent": "Mozilla/5.0"}) as resp:
-                    if resp.status >= 400:
-                        continue
-                    html = await resp.text()
-            except Exception:
-                continue
-
-            soup = BeautifulSoup(html, "lxml")
-            for a in soup.find_all("a", href=True):
-                href = a["href"]
-                txt = (a.get_text(" ", strip=True) or "").strip()
-                if not txt:
-                    continue
-                if "/game/" in href or "/games/" in href or "/channel/" in href or "/channels/" in href:
-                    if href.startswith("/"):
-                        href = "https://luna.amazon.com" + href
-                    items.append({"title": txt[:140], "url": href})
+
+    async def _fetch(session: aiohttp.ClientSession, url: str) -> List[Dict[str, str]]:
+        try:
+            async with session.get(url, timeout=timeout, headers={"User-Agent": "Mozilla/5.0"}) as resp:
+                if resp.status >= 400:
+                    return []
+                html = await resp.text()
+        except Exception:
+            return []
+        # Parse in a thread so the other page fetches keep progressing.
+        return await asyncio.to_thread(_parse_sync, html)
+
+    async with aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=10)) as session:
+        pages = await asyncio.gather(*(_fetch(session, url) for url in urls))
+    for page_items in pages:
+        items.extend(page_items)
 
     # dedupe
     seen = set()
@@ -5,6 +5,11 @@ import re
 from dataclasses import dataclass
 from typing import Dict, Iterable, List, Tuple
 
+try:  # optional: vectorizes SimHash bit accumulation when installed
+    import numpy as _np
+except ImportError:  # pragma: no cover
+    _np = None
+
 _WORD = re.compile(r"[A-Za-z0-9][A-Za-z0-9\-']+")
 
 def _tokenize(s: str) -> List[str]:
@@ -18,19 +23,42 @@ def simhash64(text: str) -> int:
     tokens = _tokenize(text)
     if not tokens:
         return 0
-    v = [0] * 64
-    for t in tokens:
-        # stable 64-bit hash
-        h = int(hashlib.blake2b(t.encode("utf-8"), digest_size=8).hexdigest(), 16)
-        for i in range(64):
-            bit = (h >> i) & 1
-            v[i] += 1 if bit else -1
+    # stable 64-bit hash per token
+    digests = [hashlib.blake2b(t.encode("utf-8"), digest_size=8).digest() for t in tokens]
+    if _np is not None:
+        return _simhash64_np(digests)
+    # Per-bit set counts kept as a vertical binary counter: planes[k] holds bit k
+    # of all 64 column counts, so adding a token costs ~log2(n) int ops, not 64.
+    planes: List[int] = []
+    for d in digests:
+        carry = int.from_bytes(d, "big")
+        for k, p in enumerate(planes):
+            planes[k] = p ^ carry
+            carry &= p
+            if not carry:
+                break
+        else:
+            if carry:
+                planes.append(carry)
+    # bit i is set when more than half of the tokens had it set (v[i] > 0)
+    half = len(tokens) // 2
     out = 0
-    for i, w in enumerate(v):
-        if w > 0:
+    for i in range(64):
+        count = 0
+        for k, p in enumerate(planes):
+            count |= ((p >> i) & 1) << k
+        if count > half:
             out |= (1 << i)
     return out
 
+def _simhash64_np(digests: List[bytes]) -> int:
+    """NumPy variant of simhash64's bit accumulation; same result."""
+    # digests are big-endian ints, reversed so byte j holds bits 8j..8j+7
+    arr = _np.frombuffer(b"".join(d[::-1] for d in digests), dtype=_np.uint8).reshape(-1, 8)
+    counts = _np.unpackbits(arr, axis=1, bitorder="little").sum(axis=0, dtype=_np.int64)
+    mask = (counts * 2 > len(digests)).astype(_np.uint8)
+    return int.from_bytes(_np.packbits(mask, bitorder="little").tobytes(), "little")
+
 def hamming64(a: int, b: int) -> int:
     return (a ^ b).bit_count()
 
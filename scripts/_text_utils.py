@@ -3,10 +3,19 @@ import re
 from typing import Iterable, List
 
 _SENT_SPLIT = re.compile(r"(?<=[.!?])\s+(?=[A-Z0-9\(\[])", re.M)
+_WS = re.compile(r"\s+")
+_LETTERS = re.compile(r"[A-Za-z]{4,}")
+
+# obvious boilerplate; matched as one alternation so each sentence is scanned once
+_BOILERPLATE = (
+    "click", "cookie", "all rights reserved", "terms of use", "privacy policy",
+    "creativecommons", "download", "subscribe", "log in", "sign in",
+)
+_RE_BOILERPLATE = re.compile("|".join(re.escape(b) for b in _BOILERPLATE))
 
 def normalize_space(s: str) -> str:
     s = (s or "").strip()
-    s = re.sub(r"\s+", " ", s)
+    s = _WS.sub(" ", s)
     return s
 
 def is_good_sentence(s: str) -> bool:
@@ -16,15 +25,10 @@ def is_good_sentence(s: str) -> bool:
     if len(s) > 280: # too long for Discord embed
         return False
     # avoid obvious boilerplate
-    bad = [
-        "click", "cookie", "all rights reserved", "terms of use", "privacy policy",
-        "creativecommons", "download", "subscribe", "log in", "sign in"
-    ]
-    low = s.lower()
-    if any(b in low for b in bad):
+    if _RE_BOILERPLATE.search(s.lower()):
         return False
     # sentence should contain some letters
-    if not re.search(r"[A-Za-z]{4,}", s):
+    if not _LETTERS.search(s):
         return False
     return True
 
@@ -37,6 +41,13 @@ _FACTUAL_BLACKLIST = [
     "join us", "sign up", "subscribe", "learn more", "click here", "watch",
 ]
 
+# Compiled once; is_factual_sentence runs per sentence during pool builds.
+_RE_BLACKLIST = re.compile("|".join(re.escape(b) for b in _FACTUAL_BLACKLIST))
+_RE_PRONOUN = re.compile(r"\b(?:i|we|you|our|my|your)\b")
+_RE_COPULA = re.compile(r"\b(?:is|are|was|were|refers to|defined as|consists of|includes)\b")
+_RE_DATE_NUM = re.compile(r"\b(?:1[6-9]\d{2}|20\d{2}|[0-9]+(?:\.[0-9]+)?)\b")
+_RE_PASSIVE = re.compile(r"\b(?:was discovered|was developed|was proposed|was introduced|was first)\b")
+
 def is_factual_sentence(s: str) -> bool:
     """
     Heuristic 'factual-only' filter for academic trivia.
@@ -45,7 +56,7 @@ def is_factual_sentence(s: str) -> bool:
     """
     s = normalize_space(s)
     low = s.lower()
-    if any(b in low for b in _FACTUAL_BLACKLIST):
+    if _RE_BLACKLIST.search(low):
         return False
     # exclude questions / exclamations (usually not factual trivia)
     if "?" in s:
@@ -53,14 +64,14 @@ def is_factual_sentence(s: str) -> bool:
     if s.count("!") >= 1:
         return False
     # exclude first/second person pronouns (common in essays/CTAs)
-    if re.search(r"\b(i|we|you|our|my|your)\b", low):
+    if _RE_PRONOUN.search(low):
         return False
     # prefer sentences with a verb/copula or numeric/date signal
-    has_copula = re.search(r"\b(is|are|was|were|refers to|defined as|consists of|includes)\b", low) is not None
-    has_date_or_num = re.search(r"\b(1[6-9]\d{2}|20\d{2}|[0-9]+(\.[0-9]+)?)\b", s) is not None
+    has_copula = _RE_COPULA.search(low) is not None
+    has_date_or_num = _RE_DATE_NUM.search(s) is not None
     if not (has_copula or has_date_or_num):
         # allow some passive factual constructions
-        if re.search(r"\b(was discovered|was developed|was proposed|was introduced|was first)\b", low) is None:
+        if _RE_PASSIVE.search(low) is None:
             return False
     return True
 
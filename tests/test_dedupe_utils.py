@@ -0,0 +1,39 @@
+import hashlib
+import random
+import string
+
+import pytest
+
+from scripts import _dedupe_utils
+from scripts._dedupe_utils import _tokenize, simhash64
+
+
+def _reference_simhash64(text):
+    # The original per-bit loop; both accumulation paths must match it exactly.
+    v = [0] * 64
+    for t in _tokenize(text):
+        h = int(hashlib.blake2b(t.encode("utf-8"), digest_size=8).hexdigest(), 16)
+        for i in range(64):
+            v[i] += 1 if (h >> i) & 1 else -1
+    return sum(1 << i for i, w in enumerate(v) if w > 0)
+
+
+def _texts():
+    rng = random.Random(1234)
+    words = ["".join(rng.choices(string.ascii_lowercase, k=rng.randint(2, 8))) for _ in range(200)]
+    texts = ["", "a", "x y", "hello hello", "Tesla's 1891 coil"]
+    texts += [" ".join(rng.choices(words, k=rng.randint(1, 300))) for _ in range(300)]
+    return texts
+
+
+def test_simhash64_pure_python_matches_reference(monkeypatch):
+    monkeypatch.setattr(_dedupe_utils, "_np", None)
+    for text in _texts():
+        assert simhash64(text) == _reference_simhash64(text)
+
+
+def test_simhash64_numpy_matches_reference(monkeypatch):
+    np = pytest.importorskip("numpy")
+    monkeypatch.setattr(_dedupe_utils, "_np", np)
+    for text in _texts():
+        assert simhash64(text) == _reference_simhash64(text)
@@ -0,0 +1,31 @@
+import pytest
+
+from utils.url_utils import fast_host
+
+
+@pytest.mark.parametrize("url, host", [
+    ("https://open.spotify.com/track/1", "open.spotify.com"),
+    ("https://www.YouTube.com/watch?v=x", "youtube.com"),
+    ("https://music.apple.com:443/us/album/1", "music.apple.com"),
+    ("http://spotify.com", "spotify.com"),
+    ("https://spotify.com?x=1", "spotify.com"),
+    ("https://[::1]:8080/", "::1"),
+])
+def test_fast_host_plain_urls(url, host):
+    assert fast_host(url) == host
+
+
+@pytest.mark.parametrize("url", [
+    "https://evil.com\\@spotify.com/",
+    "https://user@evil.com@spotify.com/",
+    "https://evil.com\\.spotify.com/",
+    "https://spotify.com:x@evil.com/",
+    "https://user:pw@open.spotify.com/",
+    "https://evil.com spotify.com/",
+    "https://evil.com\tspotify.com/",
+    "https:/spotify.com/",
+    "https:///path",
+    "spotify.com",
+])
+def test_fast_host_rejects_ambiguous_authority(url):
+    assert fast_host(url) == ""
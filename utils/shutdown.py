@@ -0,0 +1,32 @@
+import logging
+
+from discord.ext import commands
+
+logger = logging.getLogger("bottany")
+
+# Async no-arg callables (e.g. closing a module's aiohttp session), run by ShutdownBot.close().
+_HOOKS = []
+
+
+def on_shutdown(fn):
+    """Register fn to be awaited once when the bot closes; usable as a decorator."""
+    if fn not in _HOOKS:
+        _HOOKS.append(fn)
+    return fn
+
+
+async def run_shutdown_hooks():
+    # Newest first, so modules imported later close before the ones they depend on.
+    for fn in reversed(_HOOKS):
+        try:
+            await fn()
+        except Exception as e:
+            logger.warning("Shutdown hook %s failed: %s", getattr(fn, "__qualname__", fn), e)
+
+
+class ShutdownBot(commands.Bot):
+    """commands.Bot whose close() runs the registered shutdown hooks before disconnecting."""
+
+    async def close(self):
+        await run_shutdown_hooks()
+        await super().close()
@@ -0,0 +1,32 @@
+from urllib.parse import urlparse
+
+
+def fast_host(u: str) -> str:
+    """Lowercased host of a scheme://host[:port]/... URL, without a leading "www.".
+
+    Returns "" when there is no "://" or when the authority contains "@", "\\" or
+    whitespace: browsers and Discord resolve those differently from urlparse
+    (e.g. "https://evil.com\\@spotify.com/" opens evil.com), so they must never
+    pass a domain allowlist.
+    """
+    i = u.find("://")
+    if i == -1:
+        return ""
+    i += 3
+    end = len(u)
+    for ch in "/?#":
+        j = u.find(ch, i, end)
+        if j != -1:
+            end = j
+    authority = u[i:end]
+    if not authority or any(ch in "@\\" or ch.isspace() for ch in authority):
+        return ""
+    if authority.startswith("["):  # IPv6 literal
+        try:
+            host = urlparse(u).hostname or ""
+        except ValueError:
+            return ""
+    else:
+        host = authority.split(":", 1)[0]
+    host = host.lower()
+    return host[4:] if host.startswith("www.") else host